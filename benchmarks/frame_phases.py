@@ -0,0 +1,209 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import pygame
+
+from src import engine as engine_module
+from src import collision
+from src import globals
+from src.engine import Engine, Inputs
+from src.Asteroid import ASTEROID_POOL
+from src.pickup import PICKUP_POOL
+from src.projectile import PROJECTILE_POOL
+
+"""Scenario benchmarks for the cost of each phase of a simulation frame.
+
+Each scenario is a seeded game state (asteroids of mixed sizes, live
+projectiles, pickups, an active shield). Every sample restores the same
+state, then times the phases of a frame separately: spawner update, the
+sprite group updates, player update with its collision checks, projectile
+collision with the collision grid rebuild and drawing every group to an
+offscreen surface. Every scenario runs several times, interleaved with the
+others, and each statistic is the median over those repeats, so one run
+disturbed by the machine does not move the result. Results are written as
+JSON with the median, p95 and p99 of each phase in milliseconds and can be
+compared against a saved baseline:
+
+    python benchmarks/frame_phases.py --output baseline.json
+    python benchmarks/frame_phases.py --baseline baseline.json
+"""
+SCENARIOS = {
+    "asteroids_50": {"asteroids": 50, "projectiles": 100, "pickups": 50, "shield": True},
+    "asteroids_200": {"asteroids": 200, "projectiles": 100, "pickups": 50, "shield": True},
+    "asteroids_1000": {"asteroids": 1000, "projectiles": 100, "pickups": 50, "shield": True},
+}
+
+PHASES = ("spawner", "player", "updates", "collision", "draw")
+
+
+"""Build a scenario on a fresh seeded engine and return its snapshot."""
+def build(engine, asteroids, projectiles, pickups, shield):
+    rng = globals.RNG
+    width, height = globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT
+    # Let the player pick its heading so it has one to fire along
+    engine.step(globals.FIXED_DT, Inputs(aim=(width, height / 2)))
+
+    for i in range(asteroids):
+        pos = (rng.uniform(0, width), rng.uniform(0, height))
+        globals.ASTEROID_SPRITES.add(ASTEROID_POOL.acquire(pos, 3 - i % 3))
+    for _ in range(projectiles):
+        pos = (rng.uniform(0, width), rng.uniform(0, height))
+        globals.PROJECTILE_SPRITES.add(PROJECTILE_POOL.acquire(pos, rng.uniform(0, 360)))
+    for i in range(pickups):
+        pos = (rng.uniform(0, width), rng.uniform(0, height))
+        globals.PICKUP_SPRITES.add(PICKUP_POOL.acquire(pos, ("shield", "damage")[i % 2]))
+    if shield:
+        engine.player.add_shield()
+    return engine.snapshot()
+
+
+"""Run one frame of an engine phase by phase and return each phase's time in nanoseconds."""
+def time_frame(engine, surface):
+    clock = time.perf_counter_ns
+    globals.DT = globals.FIXED_DT
+    times = {}
+
+    start = clock()
+    engine.spawner.update()
+    times["spawner"] = clock() - start
+
+    start = clock()
+    globals.ASTEROID_SPRITES.update()
+    globals.PROJECTILE_SPRITES.update()
+    globals.PICKUP_SPRITES.update()
+    times["updates"] = clock() - start
+
+    start = clock()
+    collision.rebuild_grids()
+    rebuild = clock() - start
+
+    start = clock()
+    globals.PLAYER_SPRITE.update()
+    times["player"] = clock() - start
+
+    start = clock()
+    engine.spawner.handle_collision()
+    times["collision"] = clock() - start + rebuild
+
+    start = clock()
+    globals.PLAYER_SPRITE.draw(surface)
+    globals.ASTEROID_SPRITES.draw(surface)
+    globals.PROJECTILE_SPRITES.draw(surface)
+    globals.PICKUP_SPRITES.draw(surface)
+    times["draw"] = clock() - start
+    return times
+
+
+"""Return the nearest-rank percentile of a list of numbers."""
+def percentile(values, percent):
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def summarize(samples):
+    return {
+        "median_ms": percentile(samples, 50) / 1e6,
+        "p95_ms": percentile(samples, 95) / 1e6,
+        "p99_ms": percentile(samples, 99) / 1e6,
+    }
+
+
+"""Time every phase of a scenario over a number of samples of the same starting state."""
+def run_scenario(counts, samples, warmup=10, seed=1):
+    engine = Engine(seed=seed)
+    state = build(engine, **counts)
+    surface = pygame.Surface((globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
+    results = {phase: [] for phase in PHASES}
+    for i in range(warmup + samples):
+        engine.restore(state)
+        times = time_frame(engine, surface)
+        if i >= warmup:
+            for phase in PHASES:
+                results[phase].append(times[phase])
+    results["total"] = [sum(frame) for frame in zip(*(results[phase] for phase in PHASES))]
+    return {phase: summarize(values) for phase, values in results.items()}
+
+
+"""Combine repeated runs of a scenario into the median of each statistic over the runs."""
+def combine(runs):
+    return {
+        phase: {stat: percentile([run[phase][stat] for run in runs], 50) for stat in stats}
+        for phase, stats in runs[0].items()
+    }
+
+
+"""Compare results against a baseline and return (scenario, phase, ratio) of every regression.
+
+Phases must be slower by both the relative tolerance and min_delta
+milliseconds, so timer noise on phases that take microseconds is ignored.
+The defaults let two runs of the same code pass.
+"""
+def compare(results, baseline, tolerance=0.25, min_delta=0.1):
+    regressions = []
+    for name, phases in results["scenarios"].items():
+        for phase, stats in phases.items():
+            previous = baseline.get("scenarios", {}).get(name, {}).get(phase)
+            if previous is None:
+                continue
+            ratio = stats["median_ms"] / max(previous["median_ms"], 1e-6)
+            print(f"{name:>16} {phase:>10} {previous['median_ms']:9.3f} ms "
+                  f"-> {stats['median_ms']:9.3f} ms ({ratio:5.2f}x)")
+            slower = stats["median_ms"] - previous["median_ms"]
+            if ratio > 1 + tolerance and slower > min_delta:
+                regressions.append((name, phase, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the phases of a frame in benchmark scenarios")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run; may be repeated (default: all)")
+    parser.add_argument("--samples", type=int, default=100, help="timed frames per scenario and repeat")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="runs of every scenario whose medians are combined")
+    parser.add_argument("--output", metavar="FILE", help="write the results as JSON to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare median times against FILE")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative slowdown of a median reported as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.1,
+                        help="smallest slowdown in milliseconds reported as a regression")
+    args = parser.parse_args(argv)
+
+    engine_module.init_headless()
+    names = args.scenario or list(SCENARIOS)
+    runs = {name: [] for name in names}
+    # Interleave the repeats, so a slow spell of the machine hits every scenario a little
+    for _ in range(args.repeats):
+        for name in names:
+            runs[name].append(run_scenario(SCENARIOS[name], args.samples))
+    results = {
+        "samples": args.samples, "repeats": args.repeats,
+        "scenarios": {name: combine(runs[name]) for name in names},
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        print(text)
+
+    regressions = []
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()),
+                              args.tolerance, args.min_delta)
+        for name, phase, ratio in regressions:
+            print(f"Regression: {name} {phase} is {ratio:.2f}x the baseline median")
+    pygame.quit()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
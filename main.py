@@ -1,3 +1,5 @@
+import argparse
+import logging
 import os
 import sys
 from src import engine
@@ -9,4 +11,28 @@ if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
 
 """This file is the entry point to run the game engine."""
 if __name__ == "__main__":
-    engine.run()
+    parser = argparse.ArgumentParser(description="Modern Asteroids")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window as fast as possible")
+    parser.add_argument("--frames", type=int, default=36000,
+                        help="number of frames to simulate in headless mode")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for the simulation")
+    parser.add_argument("--record", metavar="FILE", default=None,
+                        help="record the inputs of the game to a replay file")
+    parser.add_argument("--replay", metavar="FILE", default=None,
+                        help="re-simulate a replay file headless as fast as possible")
+    parser.add_argument("--seek-wave", type=int, default=None,
+                        help="start the replay from the keyframe of this wave")
+    parser.add_argument("--log-level", default="WARNING",
+                        help="logging level, e.g. INFO to follow spawn governor decisions "
+                             "or DEBUG for asset and font load reports")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(name)s: %(message)s")
+
+    if args.replay:
+        engine.run_replay(args.replay, args.seek_wave)
+    elif args.headless:
+        engine.run_headless(args.frames, args.seed, args.record)
+    else:
+        engine.run(args.record)
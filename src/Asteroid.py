@@ -1,451 +1,116 @@
 import pygame
-import random
 from pathlib import Path
 from . import globals
-
-# Using the asteroid art files organized by size
-ASTEROID_PATHS = {
-    "large": [
-        Path("assets", "art", "asteroids", "large", f)
-        for f in [
-            "a10000.png",
-            "a10001.png",
-            "a10002.png",
-            "a10003.png",
-            "a10004.png",
-            "a10005.png",
-            "a10006.png",
-            "a10007.png",
-            "a10008.png",
-            "a10009.png",
-            "a10010.png",
-            "a10011.png",
-            "a10012.png",
-            "a10013.png",
-            "a10014.png",
-            "a10015.png",
-            "a30000.png",
-            "a30001.png",
-            "a30002.png",
-            "a30003.png",
-            "a30004.png",
-            "a30005.png",
-            "a30006.png",
-            "a30007.png",
-            "a30008.png",
-            "a30009.png",
-            "a30010.png",
-            "a30011.png",
-            "a30012.png",
-            "a30013.png",
-            "a30014.png",
-            "a30015.png",
-            "b10000.png",
-            "b10001.png",
-            "b10002.png",
-            "b10003.png",
-            "b10004.png",
-            "b10005.png",
-            "b10006.png",
-            "b10007.png",
-            "b10008.png",
-            "b10009.png",
-            "b10010.png",
-            "b10011.png",
-            "b10012.png",
-            "b10013.png",
-            "b10014.png",
-            "b10015.png",
-            "b30000.png",
-            "b30001.png",
-            "b30002.png",
-            "b30003.png",
-            "b30004.png",
-            "b30005.png",
-            "b30006.png",
-            "b30007.png",
-            "b30008.png",
-            "b30009.png",
-            "b30010.png",
-            "b30011.png",
-            "b30012.png",
-            "b30013.png",
-            "b30014.png",
-            "b30015.png",
-            "c10000.png",
-            "c10001.png",
-            "c10002.png",
-            "c10003.png",
-            "c10004.png",
-            "c10005.png",
-            "c10006.png",
-            "c10007.png",
-            "c10008.png",
-            "c10009.png",
-            "c10010.png",
-            "c10011.png",
-            "c10012.png",
-            "c10013.png",
-            "c10014.png",
-            "c10015.png",
-            "c30000.png",
-            "c30001.png",
-            "c30002.png",
-            "c30003.png",
-            "c30004.png",
-            "c30005.png",
-            "c30006.png",
-            "c30007.png",
-            "c30008.png",
-            "c30009.png",
-            "c30010.png",
-            "c30011.png",
-            "c30012.png",
-            "c30013.png",
-            "c30014.png",
-            "c30015.png",
-            "c40000.png",
-            "c40001.png",
-            "c40002.png",
-            "c40003.png",
-            "c40004.png",
-            "c40005.png",
-            "c40006.png",
-            "c40007.png",
-            "c40008.png",
-            "c40009.png",
-            "c40010.png",
-            "c40011.png",
-            "c40012.png",
-            "c40013.png",
-            "c40014.png",
-            "c40015.png",
-        ]
-    ],
-    "medium": [
-        Path("assets", "art", "asteroids", "medium", f)
-        for f in [
-            "a10000.png",
-            "a10001.png",
-            "a10002.png",
-            "a10003.png",
-            "a10004.png",
-            "a10005.png",
-            "a10006.png",
-            "a10007.png",
-            "a10008.png",
-            "a10009.png",
-            "a10010.png",
-            "a10011.png",
-            "a10012.png",
-            "a10013.png",
-            "a10014.png",
-            "a10015.png",
-            "a30000.png",
-            "a30001.png",
-            "a30002.png",
-            "a30003.png",
-            "a30004.png",
-            "a30005.png",
-            "a30006.png",
-            "a30007.png",
-            "a30008.png",
-            "a30009.png",
-            "a30010.png",
-            "a30011.png",
-            "a30012.png",
-            "a30013.png",
-            "a30014.png",
-            "a30015.png",
-            "a40000.png",
-            "a40001.png",
-            "a40002.png",
-            "a40003.png",
-            "a40004.png",
-            "a40005.png",
-            "a40006.png",
-            "a40007.png",
-            "a40008.png",
-            "a40009.png",
-            "a40010.png",
-            "a40011.png",
-            "a40012.png",
-            "a40013.png",
-            "a40014.png",
-            "a40015.png",
-            "b40000.png",
-            "b40001.png",
-            "b40002.png",
-            "b40003.png",
-            "b40004.png",
-            "b40005.png",
-            "b40006.png",
-            "b40007.png",
-            "b40008.png",
-            "b40009.png",
-            "b40010.png",
-            "b40011.png",
-            "b40012.png",
-            "b40013.png",
-            "b40014.png",
-            "b40015.png",
-            "c10000.png",
-            "c10001.png",
-            "c10002.png",
-            "c10003.png",
-            "c10004.png",
-            "c10005.png",
-            "c10006.png",
-            "c10007.png",
-            "c10008.png",
-            "c10009.png",
-            "c10010.png",
-            "c10011.png",
-            "c10012.png",
-            "c10013.png",
-            "c10014.png",
-            "c10015.png",
-            "c30000.png",
-            "c30001.png",
-            "c30002.png",
-            "c30003.png",
-            "c30004.png",
-            "c30005.png",
-            "c30006.png",
-            "c30007.png",
-            "c30008.png",
-            "c30009.png",
-            "c30010.png",
-            "c30011.png",
-            "c30012.png",
-            "c30013.png",
-            "c30014.png",
-            "c30015.png",
-            "c40000.png",
-            "c40001.png",
-            "c40002.png",
-            "c40003.png",
-            "c40004.png",
-            "c40005.png",
-            "c40006.png",
-            "c40007.png",
-            "c40008.png",
-            "c40009.png",
-            "c40010.png",
-            "c40011.png",
-            "c40012.png",
-            "c40013.png",
-            "c40014.png",
-            "c40015.png",
-            "d10000.png",
-            "d10001.png",
-            "d10002.png",
-            "d10003.png",
-            "d10004.png",
-            "d10005.png",
-            "d10006.png",
-            "d10007.png",
-            "d10008.png",
-            "d10009.png",
-            "d10010.png",
-            "d10011.png",
-            "d10012.png",
-            "d10013.png",
-            "d10014.png",
-            "d10015.png",
-            "d30000.png",
-            "d30001.png",
-            "d30002.png",
-            "d30003.png",
-            "d30004.png",
-            "d30005.png",
-            "d30006.png",
-            "d30007.png",
-            "d30008.png",
-            "d30009.png",
-            "d30010.png",
-            "d30011.png",
-            "d30012.png",
-            "d30013.png",
-            "d30014.png",
-            "d30015.png",
-            "d40000.png",
-            "d40001.png",
-            "d40002.png",
-            "d40003.png",
-            "d40004.png",
-            "d40005.png",
-            "d40006.png",
-            "d40007.png",
-            "d40008.png",
-            "d40009.png",
-            "d40010.png",
-            "d40011.png",
-            "d40012.png",
-            "d40013.png",
-            "d40014.png",
-            "d40015.png",
-        ]
-    ],
-    "small": [
-        Path("assets", "art", "asteroids", "small", f)
-        for f in [
-            "a10000.png",
-            "a10001.png",
-            "a10002.png",
-            "a10003.png",
-            "a10004.png",
-            "a10005.png",
-            "a10006.png",
-            "a10007.png",
-            "a10008.png",
-            "a10009.png",
-            "a10010.png",
-            "a10011.png",
-            "a10012.png",
-            "a10013.png",
-            "a10014.png",
-            "a10015.png",
-            "a30000.png",
-            "a30001.png",
-            "a30002.png",
-            "a30003.png",
-            "a30004.png",
-            "a30005.png",
-            "a30006.png",
-            "a30007.png",
-            "a30008.png",
-            "a30009.png",
-            "a30010.png",
-            "a30011.png",
-            "a30012.png",
-            "a30013.png",
-            "a30014.png",
-            "a30015.png",
-            "a40000.png",
-            "a40001.png",
-            "a40002.png",
-            "a40003.png",
-            "a40004.png",
-            "a40005.png",
-            "a40006.png",
-            "a40007.png",
-            "a40008.png",
-            "a40009.png",
-            "a40010.png",
-            "a40011.png",
-            "a40012.png",
-            "a40013.png",
-            "a40014.png",
-            "a40015.png",
-            "b10000.png",
-            "b10001.png",
-            "b10002.png",
-            "b10003.png",
-            "b10004.png",
-            "b10005.png",
-            "b10006.png",
-            "b10007.png",
-            "b10008.png",
-            "b10009.png",
-            "b10010.png",
-            "b10011.png",
-            "b10012.png",
-            "b10013.png",
-            "b10014.png",
-            "b10015.png",
-            "b30000.png",
-            "b30001.png",
-            "b30002.png",
-            "b30003.png",
-            "b30004.png",
-            "b30005.png",
-            "b30006.png",
-            "b30007.png",
-            "b30008.png",
-            "b30009.png",
-            "b30010.png",
-            "b30011.png",
-            "b30012.png",
-            "b30013.png",
-            "b30014.png",
-            "b30015.png",
-            "b40000.png",
-            "b40001.png",
-            "b40002.png",
-            "b40003.png",
-            "b40004.png",
-            "b40005.png",
-            "b40006.png",
-            "b40007.png",
-            "b40008.png",
-            "b40009.png",
-            "b40010.png",
-            "b40011.png",
-            "b40012.png",
-            "b40013.png",
-            "b40014.png",
-            "b40015.png",
-        ]
-    ],
-}
+from . import assets
+from . import sounds
+from . import collision
+from . import culling
+from .rotation import RotationCache
+from .pool import Pool
+from .spawn_queue import SpawnQueue
+from .governor import SpawnGovernor, QUALITY
+from .manifest import AssetManifest
+
+# Asteroid art files indexed by size class and variant family
+ASTEROID_MANIFEST = AssetManifest.load()
+ASTEROID_PATHS = ASTEROID_MANIFEST.paths
 
 asteroid_sound_path = Path("assets", "sounds", "asteroid_destroyed.wav")
 
+# Rotation frames and masks shared by all asteroids drawn from the same sprite path
+ROTATION_CACHE = RotationCache(
+    globals.ASTEROID_ROTATION_STEP, globals.ROTATION_CACHE_BYTES
+)
+
+
+def choose_sprite_path(size, variant=None):
+    """Pick the sprite for an asteroid of a size, keeping its variant family if given"""
+    # Select appropriate asteroid sprite based on size
+    if size == 3:  # Large
+        size_category = "large"
+    elif size == 2:  # Medium
+        size_category = "medium"
+    else:  # Small
+        size_category = "small"
+
+    # Select a random variant if not specified
+    if variant is None:
+        return globals.RNG.choice(ASTEROID_PATHS[size_category])
+
+    # Use the specified variant if available
+    matching_paths = ASTEROID_MANIFEST.family(size_category, variant)
+    return (
+        globals.RNG.choice(matching_paths)
+        if matching_paths
+        else globals.RNG.choice(ASTEROID_PATHS[size_category])
+    )
+
+
+def random_spawn_position():
+    """Generate a random position outside but near the screen"""
+    side = globals.RNG.randint(0, 3)  # 0=top, 1=right, 2=bottom, 3=left
+
+    if side == 0:  # Top
+        return pygame.math.Vector2(
+            globals.RNG.randint(0, globals.WINDOW_WIDTH), -50
+        )
+    elif side == 1:  # Right
+        return pygame.math.Vector2(
+            globals.WINDOW_WIDTH + 50, globals.RNG.randint(0, globals.WINDOW_HEIGHT)
+        )
+    elif side == 2:  # Bottom
+        return pygame.math.Vector2(
+            globals.RNG.randint(0, globals.WINDOW_WIDTH), globals.WINDOW_HEIGHT + 50
+        )
+    else:  # Left
+        return pygame.math.Vector2(-50, globals.RNG.randint(0, globals.WINDOW_HEIGHT))
+
 
 class Asteroid(pygame.sprite.Sprite):
+    pool = None
+
     def __init__(self, pos=None, size=2, variant=None):
         super().__init__()
-        self.asteroid_sound = pygame.mixer.Sound(asteroid_sound_path)
+        self.asteroid_sound = sounds.load_sound(asteroid_sound_path)
+        self.pos = pygame.math.Vector2()
+        self.vel = pygame.math.Vector2()
+        self.reset(pos, size, variant)
 
+    def reset(self, pos=None, size=2, variant=None):
+        """Reinitialise in place so a pooled asteroid can be spawned again"""
         # Size determines asteroid properties (3=large, 2=medium, 1=small)
         self.size = size
-
-        # Select appropriate asteroid sprite based on size
-        if size == 3:  # Large
-            size_category = "large"
-        elif size == 2:  # Medium
-            size_category = "medium"
-        else:  # Small
-            size_category = "small"
-
-        # Select a random variant if not specified
-        if variant is None:
-            sprite_path = random.choice(ASTEROID_PATHS[size_category])
-        else:
-            # Use the specified variant if available
-            matching_paths = [
-                p for p in ASTEROID_PATHS[size_category] if variant in p.name
-            ]
-            sprite_path = (
-                random.choice(matching_paths)
-                if matching_paths
-                else random.choice(ASTEROID_PATHS[size_category])
-            )
+        sprite_path = choose_sprite_path(size, variant)
 
         # Load and scale the sprite
-        self.large_image = pygame.image.load(sprite_path).convert_alpha()
-        self.image = (
-            self.large_image.copy()
-        )  # No scaling needed as we have proper sized assets
-        self.start_img = self.image
+        self.sprite_path = sprite_path
+        self.large_image = assets.load_image(sprite_path)
+        self.start_img = self.large_image  # No scaling needed as we have proper sized assets
+        self.image, self.mask = ROTATION_CACHE.frame(sprite_path, self.start_img, 0)
+        # Covers the opaque pixels of every frame, for the collision pre-check
+        self.radius = ASTEROID_MANIFEST.radius(sprite_path)
 
         # Set position (random if not specified)
         if pos is None:
-            self.pos = self._get_random_spawn_position()
+            self.pos.update(self._get_random_spawn_position())
         else:
-            self.pos = pygame.math.Vector2(pos)
+            self.pos.update(pos)
 
         self.rect = self.image.get_rect(center=self.pos)
 
         # Set random velocity based on size
-        speed = random.uniform(50, 100) / size
-        angle = random.uniform(0, 360)
-        self.vel = pygame.math.Vector2.from_polar((speed, angle))
+        speed = globals.RNG.uniform(50, 100) / size
+        angle = globals.RNG.uniform(0, 360)
+        self.vel.from_polar((speed, angle))
 
         # Set rotation properties
         self.rotation = 0
-        self.rotation_speed = random.uniform(-1, 1)
+        self.rotation_speed = globals.RNG.uniform(-1, 1)
+        # Angle of the frame shown, which snapshots keep since culled asteroids turn past it,
+        # angle of the current frame while quality is reduced, and steps put off while off-screen
+        self.image_angle = 0
+        self.frame_angle = 0
+        self.skipped = 0
 
         # Set health and points based on size
         self.health = size * 10
@@ -456,30 +121,45 @@ class Asteroid(pygame.sprite.Sprite):
 
     def _get_random_spawn_position(self):
         """Generate a random position outside but near the screen"""
-        side = random.randint(0, 3)  # 0=top, 1=right, 2=bottom, 3=left
-
-        if side == 0:  # Top
-            return pygame.math.Vector2(random.randint(0, globals.WINDOW_WIDTH), -50)
-        elif side == 1:  # Right
-            return pygame.math.Vector2(
-                globals.WINDOW_WIDTH + 50, random.randint(0, globals.WINDOW_HEIGHT)
-            )
-        elif side == 2:  # Bottom
-            return pygame.math.Vector2(
-                random.randint(0, globals.WINDOW_WIDTH), globals.WINDOW_HEIGHT + 50
-            )
-        else:  # Left
-            return pygame.math.Vector2(-50, random.randint(0, globals.WINDOW_HEIGHT))
+        return random_spawn_position()
 
     def update(self):
+        quality = QUALITY
+        # Under load, asteroids outside the screen move every few steps, by all of them at once
+        if quality.offscreen_interval > 1 and not self.rect.colliderect(culling.VIEW):
+            if self.skipped < quality.offscreen_interval - 1:
+                self.skipped += 1
+                return
+        steps = 1 + self.skipped
+        self.skipped = 0
+
         # Update position
-        self.pos += self.vel * globals.DT
+        self.pos += self.vel * globals.DT * steps
         self.rect.center = self.pos
 
-        # Update rotation
-        self.rotation += self.rotation_speed
-        self.image = pygame.transform.rotozoom(self.start_img, self.rotation, 1)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        # Update rotation and collision mask using the shared pre-rendered frames;
+        # out of view the asteroid keeps turning but keeps its frame until it is back
+        self.rotation += self.rotation_speed * steps
+        if not self.rect.colliderect(culling.VIEW):
+            culling.STATS["updates"] += 1
+            self.frame_angle = None
+        elif quality.level == 0:
+            self.image, self.mask = ROTATION_CACHE.frame(
+                self.sprite_path, self.start_img, self.rotation
+            )
+            self.rect = self.image.get_rect(center=self.rect.center)
+            self.image_angle = self.rotation
+            self.frame_angle = None
+        elif self.size > 1 or quality.rotate_small:
+            # Coarser angles mean a new frame is only needed every few steps
+            step = ROTATION_CACHE.step * quality.rotation_step
+            angle = round(self.rotation / step) * step
+            if angle != self.frame_angle:
+                self.image_angle = self.frame_angle = angle
+                self.image, self.mask = ROTATION_CACHE.frame(
+                    self.sprite_path, self.start_img, angle
+                )
+                self.rect = self.image.get_rect(center=self.rect.center)
 
         # Check screen boundaries
         self.check_bounds()
@@ -494,32 +174,51 @@ class Asteroid(pygame.sprite.Sprite):
         if self.pos.y > globals.WINDOW_HEIGHT + 100:
             self.pos.y = -100
 
+    def advance(self, seconds):
+        """Move and turn the asteroid as if it had been flying for the given time"""
+        self.pos += self.vel * seconds
+        self.rotation += self.rotation_speed * seconds / globals.FIXED_DT
+        self.image, self.mask = ROTATION_CACHE.frame(
+            self.sprite_path, self.start_img, self.rotation
+        )
+        self.image_angle = self.rotation
+        self.rect = self.image.get_rect(center=self.pos)
+
     def take_damage(self, amount):
         self.health -= amount
         return self.health <= 0
 
-    def split(self):
-        """Split asteroid into smaller pieces when destroyed"""
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def fragments(self):
+        """Position, size and variant of the pieces this asteroid breaks into"""
         if self.size > 1:
             new_size = self.size - 1
             offset = 20  # Offset for new asteroids
 
-            # Create two new smaller asteroids with the same variant
-            new_asteroids = [
-                Asteroid(
-                    (self.pos.x + offset, self.pos.y + offset), new_size, self.variant
-                ),
-                Asteroid(
-                    (self.pos.x - offset, self.pos.y - offset), new_size, self.variant
-                ),
+            return [
+                ((self.pos.x + offset, self.pos.y + offset), new_size, self.variant),
+                ((self.pos.x - offset, self.pos.y - offset), new_size, self.variant),
             ]
-
-            return new_asteroids
         return []
 
+    def split(self):
+        """Split asteroid into smaller pieces when destroyed"""
+        # Create two new smaller asteroids with the same variant
+        return [ASTEROID_POOL.acquire(*fragment) for fragment in self.fragments()]
+
+
+# Free list of killed asteroids, reused by spawns and splits
+ASTEROID_POOL = Pool(Asteroid, globals.ASTEROID_POOL_SIZE)
+
 
 class AsteroidManager:
-    def __init__(self):
+    def __init__(self, field=None):
+        # Optional AsteroidField that stores asteroids as NumPy arrays (stress mode)
+        self.field = field
         self.spawn_timer = 0
         self.spawn_rate = 1.0  # Asteroids per second
         self.level = 1
@@ -528,8 +227,38 @@ class AsteroidManager:
         self.wave_timer = 0
         self.wave_duration = 60  # 60 seconds per wave
         self.break_duration = 10  # 10 seconds between waves
+        # How many asteroids were spawned and how many of those had to wait for their art to load
+        self.spawns = 0
+        self.stalled_spawns = 0
+        # Fragments, wave spawns and pickups waiting for a frame with time to spare
+        self.queue = SpawnQueue()
+        # Caps the asteroid population and slows spawning when frames run long
+        self.governor = SpawnGovernor(
+            globals.MAX_ASTEROIDS, globals.MAX_ASTEROID_MASS,
+            globals.FRAME_BUDGET_MS, globals.FRAME_WINDOW,
+        )
 
     def update(self):
+        # Create what earlier steps queued before anything moves. Each spawn is
+        # caught up to the queue clock, i.e. to the last step's movement, and
+        # this step's movement then moves it once like everything else
+        self.queue.drain()
+
+        # Move every asteroid of the array backend in one vectorized step
+        if self.field is not None:
+            self.field.step(globals.DT)
+            # Wave spawns below are placed after this movement
+            self.queue.tick(globals.DT)
+
+        event = self.update_waves()
+
+        # Sprites move after this in the group update, so wave spawns above
+        # were placed before this step's movement and anything queued later after it
+        if self.field is None:
+            self.queue.tick(globals.DT)
+        return event
+
+    def update_waves(self):
         # Update wave timer
         self.wave_timer += globals.DT
 
@@ -543,9 +272,9 @@ class AsteroidManager:
 
             # Update spawn timer during active wave
             self.spawn_timer += globals.DT
-            if self.spawn_timer >= 1 / self.spawn_rate:
+            if self.spawn_timer >= 1 / self.governor.spawn_rate(self.spawn_rate):
                 self.spawn_timer = 0
-                self.spawn_asteroid()
+                self.queue.post(self.spawn_wave_asteroid)
         else:
             # Break between waves
             if self.wave_timer >= self.break_duration:
@@ -566,6 +295,7 @@ class AsteroidManager:
         self.wave_timer = 0
         self.wave_number = 1
         self.spawn_rate = 1.0
+        self.queue.clear()
         return "WAVE_START"
     
     def reset_game(self):
@@ -576,44 +306,87 @@ class AsteroidManager:
     def spawn_asteroid(self, pos=None, size=None):
         # Create a new asteroid
         if size is None:
-            size = random.choices([3, 2, 1], weights=[0.3, 0.6, 0.1])[0]
+            size = globals.RNG.choices([3, 2, 1], weights=[0.3, 0.6, 0.1])[0]
 
-        asteroid = Asteroid(pos, size)
+        stalls = assets.STATS["loads"] + assets.STATS["waits"]
+        if self.field is not None:
+            asteroid = self.field.spawn(pos, size)
+        else:
+            asteroid = ASTEROID_POOL.acquire(pos, size)
         globals.ASTEROID_SPRITES.add(asteroid)
+        self.spawns += 1
+        if assets.STATS["loads"] + assets.STATS["waits"] > stalls:
+            self.stalled_spawns += 1
 
         return asteroid
 
+    def spawn_wave_asteroid(self):
+        """Spawn an asteroid for the running wave, unless the governor holds it back"""
+        governor = self.governor
+        size = globals.RNG.choices(
+            [3, 2, 1], weights=governor.size_weights([0.3, 0.6, 0.1])
+        )[0]
+        if not governor.admit(globals.ASTEROID_SPRITES, size):
+            return None
+
+        asteroid = self.spawn_asteroid(size=size)
+        # Fewer spawns under load are made up for with faster ones
+        if governor.speed != 1:
+            asteroid.vel *= governor.speed
+        return asteroid
+
+    def spawn_fragment(self, pos, size, variant):
+        """Add one piece of a destroyed asteroid to the game"""
+        if self.field is not None:
+            fragment = self.field.spawn(pos, size, variant)
+        else:
+            fragment = ASTEROID_POOL.acquire(pos, size, variant)
+        globals.ASTEROID_SPRITES.add(fragment)
+        return fragment
+
     def handle_collision(self):
-        # Check for collisions between projectile and asteroids
-        hits_dict = pygame.sprite.groupcollide(
-            globals.ASTEROID_SPRITES,
-            globals.PROJECTILE_SPRITES,
-            False,
-            True,
-            pygame.sprite.collide_mask,
-        )
-        hits = [key for key, value in hits_dict.items() if value]
+        # Check for collisions between projectile and asteroids, testing each
+        # projectile only against asteroids that share a grid cell with it.
+        # The grid was built this step before the player collided, so skip
+        # asteroids the player's shield has destroyed since
+        grid = collision.ASTEROID_GRID
+        hits = {}
+        for projectile in globals.PROJECTILE_SPRITES.sprites():
+            struck = [
+                asteroid for asteroid in pygame.sprite.spritecollide(
+                    projectile, grid.query(projectile.rect), False, collision.collide
+                )
+                if asteroid.alive()
+            ]
+            if struck:
+                # A shot is spent on the first asteroid it hits, in sprite group order
+                projectile.kill()
+                hits[struck[0]] = None
 
         points = 0
         resources = []
+        # Under load only the first few explosions of a pass are heard
+        max_sounds = QUALITY.max_sounds
+        played = 0
 
         for asteroid in hits:
             if asteroid.take_damage(globals.PROJECTILE_DAMAGE):
-                                
-                asteroid.asteroid_sound.set_volume(asteroid.size * 0.2)
-                asteroid.asteroid_sound.play()
+
+                if max_sounds is None or played < max_sounds:
+                    sounds.play(asteroid.asteroid_sound, asteroid.size * 0.2)
+                    played += 1
 
                 points += asteroid.points
 
-                # Create smaller asteroids
-                new_asteroids = asteroid.split()
-                for new_asteroid in new_asteroids:
-                    globals.ASTEROID_SPRITES.add(new_asteroid)
+                # Create smaller asteroids, now or in a later frame with time to spare
+                for fragment in asteroid.fragments():
+                    self.queue.post(self.spawn_fragment, *fragment)
 
                 # Generate resources at asteroid position
-                if asteroid.size < 2 and random.random() < 0.3:  # 30% chance to drop a resource
-                    resource_type = random.choice(["damage", "shield"])
-                    resources.append((asteroid.pos, resource_type))
+                # 30% chance to drop a resource
+                if asteroid.size < 2 and globals.RNG.random() < 0.3:
+                    resource_type = globals.RNG.choice(["damage", "shield"])
+                    resources.append((pygame.math.Vector2(asteroid.pos), resource_type))
 
                 # Remove the destroyed asteroid
                 asteroid.kill()
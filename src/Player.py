@@ -1,7 +1,11 @@
 from pathlib import Path
 import pygame
 from . import globals
-from .projectile import Projectile
+from . import assets
+from . import sounds
+from . import collision
+from .projectile import PROJECTILE_POOL
+from .rotation import RotationCache
 
 """Load asset file paths on import."""
 sprite_path = Path("assets", "art", "spaceships", "bgbattleship.png")
@@ -9,13 +13,18 @@ shoot_sound_path = Path("assets", "sounds", "laserfire01.ogg")
 upgrade_shoot_sound_path = Path("assets", "sounds", "laserfire02.ogg")
 destroyed_sound_path = Path("assets", "sounds", "mechanical_explosion.wav")
 shield_path = Path("assets", "art", "spaceships", "spr_shield.png")
+SHIELD_SCALING = 0.3
+BOOST_DURATION = 5  # Seconds of simulated time per pickup
+
+"""Rotated ship images and masks, one per whole degree of heading."""
+ROTATION_CACHE = RotationCache(1, 32 * 1024 * 1024)
 
 """This class manages the player-controlled sprite."""
 class Player(pygame.sprite.Sprite):
     """Initialize with Sprite properties and custom gameplay properties."""
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.image.load(sprite_path).convert_alpha()
+        self.image = assets.load_image(sprite_path)
         self.start_img = self.image
         self.rect = self.image.get_rect(center=pos)
         self.mask = pygame.mask.from_surface(self.image)
@@ -27,18 +36,20 @@ class Player(pygame.sprite.Sprite):
         self.fire_delay = 700
         self.last_shot = 0
         self.sprite_rotation_offset = -90
-        self.shoot_sound = pygame.mixer.Sound(shoot_sound_path)
-        self.shoot_sound.set_volume(0.5)
-        self.destroyed_sound = pygame.mixer.Sound(destroyed_sound_path)
-        self.destroyed_sound.set_volume(0.5)
+        self.aim = None
+        self.default_shoot_sound = sounds.load_sound(shoot_sound_path)
+        self.shoot_sound = self.default_shoot_sound
+        self.shoot_volume = 0.5
+        self.destroyed_sound = sounds.load_sound(destroyed_sound_path)
         self.damage_up = 0
         self.shield_up = 0
         self.shield = None
 
-    """Called on every loop to update state and position."""
+    """Called on every loop to update state and position; collides against the grids of collision.rebuild_grids."""
     def update(self):
         asteroid_collisions = pygame.sprite.spritecollide(
-            self, globals.ASTEROID_SPRITES, False, collided=pygame.sprite.collide_mask
+            self, collision.ASTEROID_GRID.query(self.rect), False,
+            collided=collision.collide
         )
         if len(asteroid_collisions):
             if self.shield:
@@ -47,18 +58,20 @@ class Player(pygame.sprite.Sprite):
                 self.shield.kill()
                 self.shield = None
                 for asteroid in asteroid_collisions:
-                    asteroid.asteroid_sound.set_volume(asteroid.size * 0.2)
-                    asteroid.asteroid_sound.play()
+                    sounds.play(asteroid.asteroid_sound, asteroid.size * 0.2)
                     asteroid.kill()
             else:
                 self.destroy()
-                globals.PICKUP_SPRITES.empty()
+                # Kill rather than empty the group so pickups return to their pool
+                for pickup in globals.PICKUP_SPRITES.sprites():
+                    pickup.kill()
 
         pickup_collisions = pygame.sprite.spritecollide(
-            self, globals.PICKUP_SPRITES, False, collided=pygame.sprite.collide_mask
+            self, collision.PICKUP_GRID.query(self.rect), False,
+            collided=collision.collide
         )
         for pickup in pickup_collisions:
-            pickup.sound.play()
+            sounds.play(pickup.sound)
             if pickup.type == 'shield':
                 self.add_shield()
                 pickup.kill()
@@ -68,18 +81,18 @@ class Player(pygame.sprite.Sprite):
 
         self.pos += self.vel * globals.DT
         self.rect.center = self.pos
-        self.mask = pygame.mask.from_surface(self.image)
-        self.last_shot += globals.CLOCK.get_time()
+        self.last_shot += globals.DT * 1000
         self.check_boosts()
         self.rotate()
         self.check_bounds()
         self.reduce_velocity()
 
-    """Rotates player sprite toward mouse position."""
+    """Rotates player sprite and mask toward the aim position, or the mouse if none is set."""
     def rotate(self):
-        _, self.angle = (pygame.mouse.get_pos() - self.pos).as_polar()
-        self.image = pygame.transform.rotozoom(
-            self.start_img, -self.angle + self.sprite_rotation_offset, 1
+        target = self.aim if self.aim is not None else pygame.mouse.get_pos()
+        _, self.angle = (target - self.pos).as_polar()
+        self.image, self.mask = ROTATION_CACHE.frame(
+            sprite_path, self.start_img, -self.angle + self.sprite_rotation_offset
         )
         self.rect = self.image.get_rect(center=self.rect.center)
 
@@ -102,13 +115,13 @@ class Player(pygame.sprite.Sprite):
     """Fires a Projectile object on player input, given a minimum set interval."""
     def shoot(self):
         if self.last_shot >= self.fire_delay:
-            self.shoot_sound.play()
+            sounds.play(self.shoot_sound, self.shoot_volume)
             self.last_shot = 0
             origin = self.pos + pygame.math.Vector2.from_polar(
                 (self.image.get_height() / 2, self.angle)
             )
             damage_boost = self.damage_up > 0
-            projectile = Projectile(origin, self.angle, damage_boost)
+            projectile = PROJECTILE_POOL.acquire(origin, self.angle, damage_boost)
             globals.PROJECTILE_SPRITES.add(projectile)
 
     """Gradually reduce the sprite velocity to simulate friction (ignore that we're in space)."""
@@ -135,13 +148,14 @@ class Player(pygame.sprite.Sprite):
 
     """Add damage boost from resource pickup"""
     def add_damage(self):
-        self.damage_up += 300
+        self.damage_up += BOOST_DURATION
         globals.PROJECTILE_DAMAGE = 30
-        self.shoot_sound = pygame.mixer.Sound(upgrade_shoot_sound_path)
+        self.shoot_sound = sounds.load_sound(upgrade_shoot_sound_path)
+        self.shoot_volume = 1.0
     
     """Add shield boost from resource pickup"""
     def add_shield(self):
-        self.shield_up += 300
+        self.shield_up += BOOST_DURATION
         if not self.shield:
           self.shield = Shield(self)
           globals.PLAYER_SPRITE.add(self.shield)
@@ -149,14 +163,15 @@ class Player(pygame.sprite.Sprite):
     """Check for boosts from pickups on each update and decrement remaining boost time"""
     def check_boosts(self):
         if self.damage_up > 0:
-            self.damage_up -= 1
+            self.damage_up = max(0, self.damage_up - globals.DT)
         else:
             globals.PROJECTILE_DAMAGE = 10
-            self.shoot_sound = pygame.mixer.Sound(shoot_sound_path)
+            self.shoot_sound = self.default_shoot_sound
+            self.shoot_volume = 0.5
           
         
         if self.shield_up > 0:
-            self.shield_up -= 1
+            self.shield_up = max(0, self.shield_up - globals.DT)
         elif self.shield:
             globals.PLAYER_SPRITE.remove(self.shield)
             self.shield.kill()
@@ -165,7 +180,7 @@ class Player(pygame.sprite.Sprite):
     """Play spaceship destruction audio and remove the player sprite."""
     def destroy(self):
         globals.LIVES -= 1
-        self.destroyed_sound.play()
+        sounds.play(self.destroyed_sound, 0.5)
         self.kill()
 
 """Sprite to draw as an overlay on the player ship to represent the shield boost"""
@@ -173,9 +188,9 @@ class Shield(pygame.sprite.Sprite):
     def __init__(self, player):
         super().__init__()
         self.player = player
-        self.sprite_scaling = 0.3
-        self.large_image = pygame.image.load(shield_path).convert_alpha()
-        self.image = pygame.transform.scale_by(self.large_image, self.sprite_scaling)
+        self.sprite_scaling = SHIELD_SCALING
+        self.large_image = assets.load_image(shield_path)
+        self.image = assets.load_image(shield_path, self.sprite_scaling)
         self.rect = self.image.get_rect(center=player.rect.center)
     
     def update(self):
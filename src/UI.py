@@ -1,5 +1,59 @@
+from pathlib import Path
+import time
 import pygame
 import pygame.freetype
+from . import culling
+
+"""Fonts bundled with the game, looked up as <name in lowercase>.ttf before asking the system."""
+font_dir = Path("assets", "fonts")
+
+"""Registry of resolved fonts keyed by (name, size, bold, italic), shared by every UI element."""
+FONTS = {}
+
+"""Count cache hits, fonts resolved (and how many came from font_dir) and time spent resolving."""
+FONT_STATS = {"hits": 0, "resolved": 0, "bundled": 0, "ns": 0}
+
+
+"""Return the shared freetype font for a name, size and style, resolving it on first use.
+
+A bundled font file skips system font discovery entirely; otherwise the
+name is resolved through pygame.freetype.SysFont.
+"""
+def load_font(name, size, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = FONTS.get(key)
+    if font is not None:
+        FONT_STATS["hits"] += 1
+        return font
+
+    start = time.perf_counter_ns()
+    path = font_dir / f"{name.lower()}.ttf"
+    if path.is_file():
+        font = pygame.freetype.Font(path, size)
+        font.strong = bold
+        font.oblique = italic
+        FONT_STATS["bundled"] += 1
+    else:
+        font = pygame.freetype.SysFont(name, size, bold, italic)
+    FONT_STATS["resolved"] += 1
+    FONT_STATS["ns"] += time.perf_counter_ns() - start
+    FONTS[key] = font
+    return font
+
+
+"""Describe how many fonts were resolved and how long it took, e.g. for a startup log line."""
+def font_report():
+    return (
+        f"Resolved {FONT_STATS['resolved']} font(s) "
+        f"({FONT_STATS['bundled']} bundled) in {FONT_STATS['ns'] / 1e6:.1f} ms, "
+        f"{FONT_STATS['hits']} cache hit(s)"
+    )
+
+
+def clear_fonts():
+    FONTS.clear()
+    for key in FONT_STATS:
+        FONT_STATS[key] = 0
 
 
 """Class to handle loading and refreshing of UI elements."""
@@ -22,9 +76,9 @@ class UI():
                 child.children.clear()
         self.children.clear()
 
+    """Draw every element and return the screen rects they covered."""
     def draw(self):
-        for element in self.children:
-            element.draw(self.screen)
+        return [element.draw(self.screen) for element in self.children]
 
 """Class for modal UI elements"""
 class Modal(pygame.Surface):
@@ -62,7 +116,7 @@ class Modal(pygame.Surface):
             child.draw(screen)
             self.blit(child, child.rect)
         parent = self.parent or screen
-        parent.blit(self, self.rect)
+        return parent.blit(self, self.rect)
     
     """Check if a click falls in the bounds of a button on this modal."""
     def check_click(self, mouse):
@@ -85,7 +139,7 @@ class Button(pygame.Surface):
         self.children = list()
         self.rect = self.get_rect(topleft=pos)
         self.text = text
-        self.label = pygame.freetype.SysFont("Courier", 32, bold=True)
+        self.label = load_font("Courier", 32, bold=True)
         self.label_image, self.label_rect = self.label.render(self.text, (123, 107, 189))
         self.blit(
             self.label_image,
@@ -120,7 +174,7 @@ class Button(pygame.Surface):
             child.draw(screen)
             self.blit(child, child.rect)
         parent = self.parent or screen
-        parent.blit(self, self.rect)
+        return parent.blit(self, self.rect)
     
     def set_text(self, text):
         self.fill(self.color)
@@ -135,23 +189,166 @@ class Button(pygame.Surface):
         )
 
 
-"""Class to create a Text UI element"""
+"""Class to create a Text UI element
+
+With glyphs=True the text is composed from a GlyphAtlas instead of being
+rasterised by freetype on every change, for HUD values that change often.
+"""
 class Text(pygame.Surface):
-    def __init__(self, pos, fontsize, color, text, font, bold=False, italic=False):
+    def __init__(self, pos, fontsize, color, text, font, bold=False, italic=False, glyphs=False):
         super().__init__((0,0))
         self.text = text
-        self.font = pygame.freetype.SysFont(font, fontsize, bold, italic)
+        self.font = load_font(font, fontsize, bold, italic)
         self.color = color
-        self.image, self.rect = self.font.render(text, color)
+        self.atlas = None
+        if glyphs:
+            self.atlas = glyph_atlas(self.font, (font, fontsize, bold, italic), color)
+            self.image = self.atlas.render(text)
+            self.rect = self.image.get_rect()
+        else:
+            self.image, self.rect = self.font.render(text, color)
         self.rect.topleft = pos
         self.parent = None
 
     def draw(self, screen):
         parent = self.parent or screen
-        parent.blit(self.image, self.rect)
+        return parent.blit(self.image, self.rect)
     
     def set_text(self, text):
+        # Most frames set the same string again, e.g. an unchanged score
+        if text == self.text:
+            return
         pos = self.rect
         self.text = text
-        self.image, self.rect = self.font.render(text, self.color)
+        if self.atlas is not None:
+            self.image = self.atlas.render(text)
+            self.rect = self.image.get_rect()
+        else:
+            self.image, self.rect = self.font.render(text, self.color)
         self.rect.center = pos.center
+
+
+"""Pre-rendered characters of one font, size and color, composed into text with a few blits.
+
+Every glyph is rendered once into a cell as tall as the font, with its
+baseline at the font's ascender, so glyphs line up when placed side by side
+at their advance widths.
+"""
+class GlyphAtlas:
+    def __init__(self, font, color, characters="0123456789"):
+        self.font = font
+        self.color = color
+        self.height = font.get_sized_height()
+        self.ascender = font.get_sized_ascender()
+        self.glyphs = {}
+        for character in characters:
+            self.glyph(character)
+
+    """Return the cell of a character, rendering it on first use."""
+    def glyph(self, character):
+        glyph = self.glyphs.get(character)
+        if glyph is None:
+            metrics = self.font.get_metrics(character)[0]
+            advance = round(metrics[4]) if metrics else self.height // 2
+            glyph = pygame.Surface((max(1, advance), self.height), pygame.SRCALPHA)
+            origin = self.font.origin
+            self.font.origin = True
+            self.font.render_to(glyph, (0, self.ascender), character, self.color)
+            self.font.origin = origin
+            self.glyphs[character] = glyph
+        return glyph
+
+    """Compose a string from cached glyphs."""
+    def render(self, text):
+        glyphs = [self.glyph(character) for character in text]
+        image = pygame.Surface(
+            (max(1, sum(glyph.get_width() for glyph in glyphs)), self.height), pygame.SRCALPHA
+        )
+        x = 0
+        for glyph in glyphs:
+            image.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return image
+
+
+"""Glyph atlases shared by every Text with the same font, size, style and color."""
+GLYPH_ATLASES = {}
+
+def glyph_atlas(font, key, color):
+    atlas = GLYPH_ATLASES.get((key, color))
+    if atlas is None:
+        atlas = GLYPH_ATLASES[key, color] = GlyphAtlas(font, color)
+    return atlas
+
+
+"""Class to create a performance overlay UI element.
+
+Shows FPS, a graph of recent frame times and the average time of every
+phase recorded by a FrameProfiler, plus the number of sprites in each of the
+given groups. The overlay only re-renders its text every `refresh` frames so
+leaving it on costs little more than one blit.
+"""
+class PerfOverlay(pygame.Surface):
+    def __init__(self, pos, profiler, groups, clock=None, refresh=10):
+        self.line_height = 16
+        self.graph_height = 60
+        height = self.line_height * (len(profiler.phases) + 3) + self.graph_height + 20
+        super().__init__((420, height), pygame.SRCALPHA)
+        self.rect = self.get_rect(topleft=pos)
+        self.parent = None
+        self.profiler = profiler
+        self.groups = groups
+        self.clock = clock
+        self.refresh = refresh
+        self.frames = 0
+        self.font = load_font("Courier", 14, bold=True)
+        self.budget_ms = 1000 / 60
+
+    def draw(self, screen):
+        if self.frames % self.refresh == 0:
+            self.render()
+        self.frames += 1
+        parent = self.parent or screen
+        return parent.blit(self, self.rect)
+
+    """Redraw the text and frame time graph from the profiler's ring buffers."""
+    def render(self):
+        profiler = self.profiler
+        self.fill((0, 0, 0, 170))
+        x, y = 10, 6
+        fps = self.clock.get_fps() if self.clock else 0
+        self.font.render_to(
+            self, (x, y),
+            f"FPS {fps:5.1f}  frame {profiler.last_ms():5.2f} ms", (255, 255, 255)
+        )
+        y += self.line_height
+
+        # One column per recorded frame; the line marks the 60 FPS budget
+        width = self.get_width() - 2 * x
+        history = profiler.history()[-width:]
+        bottom = y + self.graph_height
+        scale = self.graph_height / (2 * self.budget_ms * 1e6)
+        for i, total in enumerate(history):
+            color = (230, 80, 80) if total > self.budget_ms * 1e6 else (80, 200, 120)
+            top = max(y, bottom - int(total * scale))
+            pygame.draw.line(self, color, (x + i, bottom), (x + i, top))
+        budget = bottom - self.graph_height // 2
+        pygame.draw.line(self, (200, 200, 200), (x, budget), (x + width, budget))
+        y = bottom + 6
+
+        for phase in profiler.phases:
+            self.font.render_to(
+                self, (x, y),
+                f"{phase:<11}{profiler.average_ms(phase):6.2f} ms", (220, 220, 220)
+            )
+            y += self.line_height
+
+        counts = "  ".join(f"{name} {len(group)}" for name, group in self.groups.items())
+        self.font.render_to(self, (x, y), counts, (220, 220, 220))
+        y += self.line_height
+
+        culled = culling.LAST_FRAME
+        self.font.render_to(
+            self, (x, y),
+            f"culled {culled['updates']} updates  {culled['draws']} draws", (220, 220, 220)
+        )
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+import pygame
+
+"""Pre-decoded pixel cache for every image under assets/art, memory-mapped at startup.
+
+The build step (python -m src.asset_cache) decodes each PNG once and writes
+its pixels as 32-bit BGRA, the layout convert_alpha() produces on common
+displays, into one file along with the source's size, modification time and
+SHA-1. At startup the file is mapped copy-on-write and surfaces are created
+over the mapping with pygame.image.frombuffer, so nothing is decoded or
+copied. An entry is only used while its source file is unchanged: a
+matching size and mtime is trusted, otherwise the file is hashed. Stale,
+missing or corrupt entries fall back to decoding the PNG.
+"""
+cache_path = Path("assets", "art.cache")
+art_dir = Path("assets", "art")
+
+MAGIC = b"ASTC"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+ALIGN = 64
+
+
+def file_hash(path):
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+"""Decode every image in a directory tree into a cache file, except the paths in skip."""
+def build(source_dir=art_dir, path=cache_path, skip=()):
+    index, blobs, offset = {}, [], 0
+    for source in sorted(Path(source_dir).rglob("*.png")):
+        if source.as_posix() in skip:
+            continue
+        image = pygame.image.load(source)
+        pixels = pygame.image.tobytes(image, "BGRA")
+        stat = source.stat()
+        index[source.as_posix()] = (
+            stat.st_size, stat.st_mtime_ns, file_hash(source),
+            image.get_width(), image.get_height(), offset,
+        )
+        padding = -len(pixels) % ALIGN
+        blobs.append(pixels + bytes(padding))
+        offset += len(pixels) + padding
+
+    header = json.dumps(index).encode()
+    # Pixel data starts aligned after the header and index
+    data_start = HEADER.size + len(header)
+    data_start += -data_start % ALIGN
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(header)))
+        file.write(header)
+        file.write(bytes(data_start - HEADER.size - len(header)))
+        for blob in blobs:
+            file.write(blob)
+    return len(index)
+
+
+"""A memory-mapped cache file; load() returns surfaces for still-valid entries and None otherwise."""
+class AssetCache:
+    def __init__(self, path=cache_path):
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_size = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset cache")
+        self.index = json.loads(self.map[HEADER.size:HEADER.size + index_size])
+        data_start = HEADER.size + index_size
+        self.data_start = data_start + -data_start % ALIGN
+        self.valid = {}
+        # Surfaces over the mapping only skip convert_alpha() if they already match the display
+        probe = pygame.image.frombuffer(bytes(4), (1, 1), "BGRA")
+        self.native = (
+            pygame.display.get_surface() is not None
+            and probe.get_masks() == probe.convert_alpha().get_masks()
+        )
+
+    """Return whether the entry for a path still matches its source file."""
+    def is_valid(self, key):
+        valid = self.valid.get(key)
+        if valid is None:
+            size, mtime_ns, digest = self.index[key][:3]
+            try:
+                stat = os.stat(key)
+                valid = stat.st_size == size and (
+                    stat.st_mtime_ns == mtime_ns or file_hash(key) == digest
+                )
+            except OSError:
+                valid = False
+            self.valid[key] = valid
+        return valid
+
+    def contains(self, path):
+        key = Path(path).as_posix()
+        return key in self.index and self.is_valid(key)
+
+    def load(self, path):
+        key = Path(path).as_posix()
+        if key not in self.index or not self.is_valid(key):
+            return None
+        width, height, offset = self.index[key][3:]
+        start = self.data_start + offset
+        pixels = memoryview(self.map)[start:start + width * height * 4]
+        image = pygame.image.frombuffer(pixels, (width, height), "BGRA")
+        return image if self.native else image.convert_alpha()
+
+
+"""Map the cache file if it exists and hand it to the assets module; return it or None."""
+def open_cache(path=cache_path):
+    from . import assets
+    try:
+        cache = AssetCache(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    assets.DECODED = cache
+    return cache
+
+
+if __name__ == "__main__":
+    from . import assets
+    from . import atlas
+    # Sprites served from an atlas are never decoded on their own, so only the atlas is cached
+    atlas.load_manifests()
+    count = build(path=sys.argv[1] if len(sys.argv) > 1 else cache_path, skip=assets.REGIONS)
+    print(f"Cached {count} decoded images")
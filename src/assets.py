@@ -0,0 +1,91 @@
+from pathlib import Path
+import pygame
+
+"""Process-wide registry of decoded images, keyed by path and transform.
+
+Surfaces handed out here are shared by every sprite that asks for the same
+key, so callers must treat them as read-only and copy before drawing on one.
+"""
+IMAGES = {}
+
+"""Count cache hits, cache misses, file decodes on the calling thread, images served from the decoded
+cache and loads that had to wait for a background decode, since startup."""
+STATS = {"hits": 0, "misses": 0, "loads": 0, "mapped": 0, "waits": 0}
+
+"""Memory-mapped cache of decoded pixels (see asset_cache), consulted before decoding a file."""
+DECODED = None
+
+"""Decodes running in the background (see streamer), keyed by path; load_image uses these instead of decoding again."""
+PENDING = {}
+
+"""Rectangles of packed atlases that stand in for individual image files, keyed by source path."""
+REGIONS = {}
+
+
+"""Return the IMAGES key of an image file, the same whether the path is a str or a Path."""
+def image_key(path, scale=1, alpha=True):
+    return (str(path), scale, alpha)
+
+
+"""Return the shared surface for an image file, optionally scaled by a factor."""
+def load_image(path, scale=1, alpha=True):
+    key = image_key(path, scale, alpha)
+    image = IMAGES.get(key)
+    if image is not None:
+        STATS["hits"] += 1
+        return image
+
+    STATS["misses"] += 1
+    region = REGIONS.get(Path(path).as_posix()) if scale == 1 else None
+    if scale != 1:
+        image = pygame.transform.scale_by(load_image(path, 1, alpha), scale)
+    elif region is not None:
+        # A view into the decoded atlas, so the atlas file is only opened once
+        atlas_path, rect = region
+        image = load_image(atlas_path, 1, alpha).subsurface(rect)
+    else:
+        image = DECODED.load(path) if DECODED is not None else None
+        if image is not None:
+            STATS["mapped"] += 1
+            if not alpha:
+                image = image.convert()
+        else:
+            future = PENDING.pop(Path(path).as_posix(), None)
+            if future is None:
+                STATS["loads"] += 1
+                image = pygame.image.load(path)
+            else:
+                if not future.done():
+                    STATS["waits"] += 1
+                image = future.result()
+            image = image.convert_alpha() if alpha else image.convert()
+    IMAGES[key] = image
+    return image
+
+
+"""Serve each source path of an atlas as a subsurface of the atlas image instead of its own file."""
+def register_atlas(atlas_path, frames):
+    for source, rect in frames.items():
+        REGIONS[Path(source).as_posix()] = (atlas_path, pygame.Rect(rect))
+
+
+"""Decode a batch of (path, scale) pairs ahead of time, e.g. before the game loop starts."""
+def preload(entries):
+    for path, scale in entries:
+        load_image(path, scale)
+
+
+"""Return the number of file decodes so far, to compare against a later reading."""
+def loads():
+    return STATS["loads"]
+
+
+"""Forget every decoded image and image source; atlas regions point into atlases loaded here, so they go too."""
+def clear():
+    global DECODED
+    DECODED = None
+    IMAGES.clear()
+    PENDING.clear()
+    REGIONS.clear()
+    for key in STATS:
+        STATS[key] = 0
@@ -0,0 +1,260 @@
+import pygame
+from . import globals
+from . import assets
+from . import sounds
+from . import culling
+from .Asteroid import (
+    ASTEROID_MANIFEST,
+    ROTATION_CACHE,
+    asteroid_sound_path,
+    choose_sprite_path,
+    random_spawn_position,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the stress-mode backend
+    np = None
+
+
+"""Struct-of-arrays store for large numbers of asteroids.
+
+Position, velocity, rotation, rotation speed, health, size and variant of
+every asteroid live in contiguous NumPy arrays, so movement and wrap-around
+for the whole field is a handful of vectorized operations per frame. Each
+live slot is paired with an AsteroidView, a thin sprite that the sprite
+groups, collision code and draw calls use exactly like an Asteroid.
+"""
+class AsteroidField:
+    def __init__(self, capacity=4096):
+        if np is None:
+            raise ImportError("AsteroidField requires NumPy (pip install numpy)")
+        self.capacity = 0
+        self.count = 0
+        self.free = []
+        self.views = []
+        self.paths = []
+        self.path_index = {}
+        self.pos = np.zeros((0, 2))
+        self.vel = np.zeros((0, 2))
+        self.rotation = np.zeros(0)
+        self.rotation_speed = np.zeros(0)
+        self.health = np.zeros(0)
+        self.size = np.zeros(0, np.int8)
+        self.variant = np.zeros(0, np.int32)
+        self.alive = np.zeros(0, bool)
+        self.frame = np.zeros(0, np.int64)
+        self.half_size = np.zeros((0, 2))
+        self.grow(capacity)
+
+    """Enlarge every array to hold at least the given number of asteroids."""
+    def grow(self, capacity):
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        self.pos = np.concatenate((self.pos, np.zeros((extra, 2))))
+        self.vel = np.concatenate((self.vel, np.zeros((extra, 2))))
+        self.rotation = np.concatenate((self.rotation, np.zeros(extra)))
+        self.rotation_speed = np.concatenate((self.rotation_speed, np.zeros(extra)))
+        self.health = np.concatenate((self.health, np.zeros(extra)))
+        self.size = np.concatenate((self.size, np.zeros(extra, np.int8)))
+        self.variant = np.concatenate((self.variant, np.zeros(extra, np.int32)))
+        self.alive = np.concatenate((self.alive, np.zeros(extra, bool)))
+        self.frame = np.concatenate((self.frame, np.full(extra, -1, np.int64)))
+        self.half_size = np.concatenate((self.half_size, np.zeros((extra, 2))))
+        self.views.extend([None] * extra)
+        self.capacity = capacity
+
+    """Add an asteroid with the same randomized properties as Asteroid and return its view."""
+    def spawn(self, pos=None, size=2, variant=None):
+        sprite_path = choose_sprite_path(size, variant)
+        pos = random_spawn_position() if pos is None else pygame.math.Vector2(pos)
+        speed = globals.RNG.uniform(50, 100) / size
+        angle = globals.RNG.uniform(0, 360)
+        vel = pygame.math.Vector2.from_polar((speed, angle))
+        rotation_speed = globals.RNG.uniform(-1, 1)
+        return self.place(sprite_path, pos, vel, 0, rotation_speed, size * 10, size, variant)
+
+    """Put an asteroid with the given state into a free slot and return its view, e.g. to restore a snapshot.
+
+    image_angle is the angle of the frame it shows, which for an asteroid
+    outside the view lags behind its rotation; it defaults to the rotation.
+    """
+    def place(self, sprite_path, pos, vel, rotation, rotation_speed, health, size,
+              variant=None, image_angle=None):
+        if self.free:
+            i = self.free.pop()
+        else:
+            if self.count == self.capacity:
+                self.grow(self.capacity * 2)
+            i = self.count
+            self.count += 1
+
+        key = str(sprite_path)
+        if key not in self.path_index:
+            self.path_index[key] = len(self.paths)
+            self.paths.append(sprite_path)
+        self.pos[i] = pos
+        self.vel[i] = vel
+        self.rotation[i] = rotation
+        self.rotation_speed[i] = rotation_speed
+        self.health[i] = health
+        self.size[i] = size
+        self.variant[i] = self.path_index[key]
+        self.alive[i] = True
+        self.frame[i] = ROTATION_CACHE.index(rotation if image_angle is None else image_angle)
+
+        view = AsteroidView(self, i, sprite_path, sprite_path.name[:2] if variant is None else variant)
+        self.views[i] = view
+        # sync only refreshes the size of asteroids in view, so start from the first frame's
+        self.half_size[i] = view.rect.w // 2, view.rect.h // 2
+        return view
+
+    """Return a slot to the free list once its view has been killed."""
+    def release(self, i):
+        self.alive[i] = False
+        self.views[i] = None
+        self.free.append(i)
+
+    """Advance every asteroid by dt seconds, wrap it around the screen and refresh its view."""
+    def step(self, dt):
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        pos += self.vel[:n] * dt
+        self.rotation[:n] += self.rotation_speed[:n]
+
+        # Same margins as Asteroid.check_bounds
+        x, y = pos[:, 0], pos[:, 1]
+        x[x < -100] = globals.WINDOW_WIDTH + 100
+        x[x > globals.WINDOW_WIDTH + 100] = -100
+        y[y < -100] = globals.WINDOW_HEIGHT + 100
+        y[y > globals.WINDOW_HEIGHT + 100] = -100
+
+        self.sync()
+
+    """Copy array state into the views so they can be drawn and collided.
+
+    Views only fetch a new image when their quantized rotation frame changes;
+    otherwise the per-view work is a single rect move.
+    """
+    def sync(self):
+        live = np.flatnonzero(self.alive[:self.count])
+        if not len(live):
+            return
+        views = self.views
+        step = ROTATION_CACHE.step
+        frames = np.rint(self.rotation[live] / step).astype(np.int64) % ROTATION_CACHE.frame_count
+        # Asteroids out of view keep their old frame until they come back
+        view = culling.VIEW
+        pos, half = self.pos[live], self.half_size[live]
+        visible = (
+            (pos[:, 0] + half[:, 0] > view.left) & (pos[:, 0] - half[:, 0] < view.right)
+            & (pos[:, 1] + half[:, 1] > view.top) & (pos[:, 1] - half[:, 1] < view.bottom)
+        )
+        culling.STATS["updates"] += len(live) - int(np.count_nonzero(visible))
+        stale = (frames != self.frame[live]) & visible
+        changed = live[stale]
+        self.frame[changed] = frames[stale]
+        for i, frame in zip(changed.tolist(), self.frame[changed].tolist()):
+            view = views[i]
+            view.image, view.mask = ROTATION_CACHE.frame(
+                view.sprite_path, view.start_img, frame * step
+            )
+            view.rect.size = view.image.get_size()
+            self.half_size[i] = view.rect.w // 2, view.rect.h // 2
+        topleft = (self.pos[live].astype(np.int64) - self.half_size[live].astype(np.int64)).tolist()
+        for i, corner in zip(live.tolist(), topleft):
+            views[i].rect.topleft = corner
+
+    def __len__(self):
+        return self.count - len(self.free)
+
+
+"""Sprite backed by one slot of an AsteroidField, with the interface of Asteroid."""
+class AsteroidView(pygame.sprite.Sprite):
+    def __init__(self, field, index, sprite_path, variant):
+        super().__init__()
+        self.field = field
+        self.index = index
+        self.sprite_path = sprite_path
+        self.variant = variant
+        self.asteroid_sound = sounds.load_sound(asteroid_sound_path)
+        self.start_img = assets.load_image(sprite_path)
+        self.radius = ASTEROID_MANIFEST.radius(sprite_path)
+        self.image, self.mask = ROTATION_CACHE.frame(sprite_path, self.start_img, self.image_angle)
+        self.rect = self.image.get_rect(center=field.pos[index].tolist())
+
+    @property
+    def pos(self):
+        return pygame.math.Vector2(*self.field.pos[self.index])
+
+    @property
+    def vel(self):
+        return pygame.math.Vector2(*self.field.vel[self.index])
+
+    @vel.setter
+    def vel(self, value):
+        self.field.vel[self.index] = tuple(value)
+
+    @property
+    def size(self):
+        return int(self.field.size[self.index])
+
+    @property
+    def health(self):
+        return float(self.field.health[self.index])
+
+    @property
+    def points(self):
+        return self.size * 10
+
+    @property
+    def rotation(self):
+        return float(self.field.rotation[self.index])
+
+    @property
+    def rotation_speed(self):
+        return float(self.field.rotation_speed[self.index])
+
+    """Angle of the frame shown, which sync only refreshes while the asteroid is in view."""
+    @property
+    def image_angle(self):
+        return float(self.field.frame[self.index] * ROTATION_CACHE.step)
+
+    """Movement happens for the whole field at once in AsteroidField.step."""
+    def update(self):
+        pass
+
+    def take_damage(self, amount):
+        self.field.health[self.index] -= amount
+        return bool(self.field.health[self.index] <= 0)
+
+    """Move and turn the asteroid as if it had been flying for the given time."""
+    def advance(self, seconds):
+        field, i = self.field, self.index
+        field.pos[i] += field.vel[i] * seconds
+        field.rotation[i] += field.rotation_speed[i] * seconds / globals.FIXED_DT
+        self.rect.center = field.pos[i].tolist()
+
+    def fragments(self):
+        """Position, size and variant of the pieces this asteroid breaks into"""
+        size = self.size
+        if size <= 1:
+            return []
+        pos = self.pos
+        offset = 20
+        return [
+            ((pos.x + offset, pos.y + offset), size - 1, self.variant),
+            ((pos.x - offset, pos.y - offset), size - 1, self.variant),
+        ]
+
+    def split(self):
+        """Split into two smaller asteroids of the same variant in the same field"""
+        return [self.field.spawn(*fragment) for fragment in self.fragments()]
+
+    def kill(self):
+        super().kill()
+        if self.field.views[self.index] is self:
+            self.field.release(self.index)
@@ -0,0 +1,72 @@
+import json
+import sys
+from pathlib import Path
+import pygame
+from . import assets
+
+"""Pack the asteroid sprites into one atlas image per size class, and register the atlases at runtime.
+
+The packer (python -m src.atlas) places every image of a class on shelves of
+at most MAX_WIDTH pixels, saves the atlas as <class>.png in atlas_dir and
+writes <class>.json mapping each source path to its rectangle. At runtime
+load_manifests registers those rectangles with the assets module, which then
+decodes each atlas once and serves the original paths as subsurfaces of it.
+Without atlases, images are loaded from their own files as before.
+"""
+atlas_dir = Path("assets", "art", "asteroids", "atlas")
+MAX_WIDTH = 4096
+
+
+"""Place images on shelves left to right; return the atlas size and each path's (x, y, w, h)."""
+def layout(sizes, max_width=MAX_WIDTH):
+    frames = {}
+    x = y = shelf_height = width = 0
+    for path, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], str(item[0]))):
+        if x + w > max_width and x > 0:
+            y += shelf_height
+            x = shelf_height = 0
+        frames[path] = (x, y, w, h)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+    return (width, y + shelf_height), frames
+
+
+"""Pack a list of image files into one surface; return it with the rectangle of each file."""
+def pack(paths, max_width=MAX_WIDTH):
+    images = {Path(path).as_posix(): pygame.image.load(path) for path in paths}
+    size, frames = layout(
+        {path: image.get_size() for path, image in images.items()}, max_width
+    )
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    for path, (x, y, _, _) in frames.items():
+        atlas.blit(images[path], (x, y))
+    return atlas, frames
+
+
+"""Write an atlas image and manifest for each named group of image paths."""
+def build(groups, directory=atlas_dir):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, paths in groups.items():
+        atlas, frames = pack(paths)
+        pygame.image.save(atlas, directory / f"{name}.png")
+        manifest = {"image": f"{name}.png", "frames": frames}
+        (directory / f"{name}.json").write_text(json.dumps(manifest, indent=1))
+
+
+"""Register every atlas manifest in a directory with the assets module; return how many were found."""
+def load_manifests(directory=atlas_dir):
+    directory = Path(directory)
+    if not directory.is_dir():
+        return 0
+    manifests = sorted(directory.glob("*.json"))
+    for path in manifests:
+        manifest = json.loads(path.read_text())
+        assets.register_atlas(directory / manifest["image"], manifest["frames"])
+    return len(manifests)
+
+
+if __name__ == "__main__":
+    from .Asteroid import ASTEROID_PATHS
+    build(ASTEROID_PATHS, sys.argv[1] if len(sys.argv) > 1 else atlas_dir)
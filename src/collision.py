@@ -0,0 +1,103 @@
+import pygame
+from . import globals
+from .profiler import FrameCounters
+
+"""Count collision tests per frame: grid candidates, narrow-phase mask tests and confirmed hits."""
+STATS = FrameCounters("candidates", "narrow", "hits")
+LAST_FRAME = STATS.last_frame
+begin_frame = STATS.begin_frame
+
+
+"""Uniform grid that buckets sprites by every cell their rect overlaps.
+
+With no fixed cell size the grid sizes its cells to the largest sprite seen
+on each rebuild, so a sprite never spans more than two cells per axis.
+"""
+class SpatialHash:
+    def __init__(self, cell_size=None, min_cell_size=32):
+        self.fixed_cell_size = cell_size
+        self.min_cell_size = min_cell_size
+        self.cell_size = cell_size or min_cell_size
+        self.cells = {}
+        self.order = {}
+
+    """Clear the grid and bucket every sprite in an iterable by its current rect."""
+    def rebuild(self, sprites):
+        self.cells.clear()
+        self.order.clear()
+        sprites = list(sprites)
+        if self.fixed_cell_size is None:
+            largest = max((max(s.rect.size) for s in sprites), default=0)
+            self.cell_size = max(self.min_cell_size, largest)
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        self.order.setdefault(sprite, len(self.order))
+        cells = self.cells
+        for key in self.keys(sprite.rect):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    """Return every cell coordinate a rect overlaps."""
+    def keys(self, rect):
+        size = self.cell_size
+        x0, x1 = rect.left // size, (rect.right - 1) // size
+        y0, y1 = rect.top // size, (rect.bottom - 1) // size
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    """Return the sprites sharing a cell with a rect, each once, in insertion order."""
+    def query(self, rect):
+        cells = self.cells
+        found = {}
+        for key in self.keys(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(dict.fromkeys(bucket))
+        # Buckets are visited cell by cell, so sprites from several cells need sorting
+        if len(found) > 1:
+            return sorted(found, key=self.order.__getitem__)
+        return list(found)
+
+
+"""Return whether a sprite's covering circle reaches a rect; sprites without a radius always do."""
+def reaches(sprite, rect):
+    radius = getattr(sprite, "radius", None)
+    if radius is None:
+        return True
+    x, y = sprite.rect.center
+    dx = max(rect.left - x, 0, x - rect.right)
+    dy = max(rect.top - y, 0, y - rect.bottom)
+    return dx * dx + dy * dy <= radius * radius
+
+
+"""Collision callback for pygame.sprite.spritecollide: rect and radius pre-checks, then pixel masks.
+
+Asteroid frames are mostly transparent corners, so the circle around
+their opaque pixels rejects many pairs whose rects overlap.
+"""
+def collide(left, right):
+    STATS["candidates"] += 1
+    if not left.rect.colliderect(right.rect):
+        return False
+    if not (reaches(right, left.rect) and reaches(left, right.rect)):
+        return False
+    STATS["narrow"] += 1
+    if pygame.sprite.collide_mask(left, right):
+        STATS["hits"] += 1
+        return True
+    return False
+
+
+"""Grids shared by every collision site, rebuilt once per step by rebuild_grids."""
+ASTEROID_GRID = SpatialHash()
+PICKUP_GRID = SpatialHash()
+
+
+"""Bucket the asteroids and pickups where they are now; Engine.step calls this once sprites have moved."""
+def rebuild_grids():
+    ASTEROID_GRID.rebuild(globals.ASTEROID_SPRITES)
+    PICKUP_GRID.rebuild(globals.PICKUP_SPRITES)
@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+import random
+import pygame
+from . import globals
+
+"""Names in src/globals.py that hold the state of one game rather than configuration."""
+GAME_STATE = (
+    "DT", "LIVES", "SCORE", "PROJECTILE_DAMAGE", "RNG",
+    "PLAYER_SPRITE", "ASTEROID_SPRITES", "PROJECTILE_SPRITES", "PICKUP_SPRITES",
+)
+
+"""The per-game part of src/globals.py for one of several games sharing a process.
+
+The game code reads and writes its state through the globals module, so a
+context keeps its own copy of those values and swaps them in for the
+duration of `with context.active():`. Anything the game changed is saved
+back to the context on exit and the previous values are put back, so games
+can be stepped one after another, and nested, without seeing each other's
+sprites, score or random numbers.
+"""
+class GameContext:
+    def __init__(self, seed=None):
+        self.values = {
+            "DT": 0,
+            "LIVES": 3,
+            "SCORE": 0,
+            "PROJECTILE_DAMAGE": 10,
+            "RNG": random.Random(seed),
+            "PLAYER_SPRITE": pygame.sprite.Group(),
+            "ASTEROID_SPRITES": pygame.sprite.Group(),
+            "PROJECTILE_SPRITES": pygame.sprite.Group(),
+            "PICKUP_SPRITES": pygame.sprite.Group(),
+        }
+
+    @contextmanager
+    def active(self):
+        saved = {name: getattr(globals, name) for name in GAME_STATE}
+        for name, value in self.values.items():
+            setattr(globals, name, value)
+        try:
+            yield self
+        finally:
+            for name in GAME_STATE:
+                self.values[name] = getattr(globals, name)
+            for name, value in saved.items():
+                setattr(globals, name, value)
@@ -0,0 +1,28 @@
+import pygame
+from . import globals
+from .profiler import FrameCounters
+
+"""Count sprites culled per frame: asteroid updates that skipped their rotation frame and sprites not drawn."""
+STATS = FrameCounters("updates", "draws")
+LAST_FRAME = STATS.last_frame
+begin_frame = STATS.begin_frame
+
+"""Screen area plus CULL_MARGIN on every side; asteroids whose rect misses it skip image work.
+
+The margin covers the corners a rotated frame can gain over the stale one
+a culled asteroid keeps, so asteroids never pop in at the edge. Moved in
+place by set_view, so holding a reference to it is safe.
+"""
+VIEW = pygame.Rect(0, 0, globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT).inflate(
+    2 * globals.CULL_MARGIN, 2 * globals.CULL_MARGIN
+)
+
+
+"""Fit the view to a screen of the given size, e.g. once the window is created."""
+def set_view(width, height, margin=None):
+    margin = globals.CULL_MARGIN if margin is None else margin
+    VIEW.update(-margin, -margin, width + 2 * margin, height + 2 * margin)
+
+
+def visible(rect):
+    return VIEW.colliderect(rect)
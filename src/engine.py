@@ -1,20 +1,496 @@
+from collections import namedtuple
+from contextlib import contextmanager
 from pathlib import Path
+import logging
+import os
+import random
 import sys
+import time
 
 import pygame
 
 from . import globals
-from .Player import Player
-from .Asteroid import AsteroidManager
-from .UI import UI, Modal, Button, Text
-from .pickup import Pickup
+from . import assets
+from . import atlas
+from . import asset_cache
+from . import sounds
+from . import collision
+from . import culling
+from . import Player as player_module
+from . import projectile
+from . import pickup
+from .Player import Player, Shield
+from .Asteroid import AsteroidManager, ASTEROID_MANIFEST, ASTEROID_PATHS, ASTEROID_POOL
+from .Asteroid import ROTATION_CACHE as ASTEROID_ROTATIONS
+from .asteroid_field import AsteroidField
+from .UI import UI, Modal, Button, Text, PerfOverlay, font_report
+from .profiler import FrameProfiler
+from .renderer import DirtyRenderer
+from .pickup import PICKUP_POOL, spawn_pickup
+from .projectile import PROJECTILE_POOL
+from . import replay as replays
+from .replay import Recorder
+from .streamer import AssetStreamer
+from .governor import QUALITY
+
+log = logging.getLogger(__name__)
 
 
 bg_path = Path("assets", "art", "background.png")
 music_path = Path("assets", "sounds", "through_space.ogg")
+sound_dir = Path("assets", "sounds")
+
+"""Phases of a running frame, in the order engine.run marks them for the performance overlay."""
+FRAME_PHASES = (
+    "input", "spawner", "updates", "collision",
+    "background", "draw", "ui", "flip",
+)
+
+"""Use pre-decoded pixels and packed asteroid atlases when they have been built."""
+def register_asset_sources():
+    asset_cache.open_cache()
+    atlas.load_manifests()
+
+"""Return the (path, scale) images and the sound files the game can request, most urgent first.
+
+The ship, shots and pickups come first since starting a game needs them,
+then the asteroid sprites in order of how often the first wave spawns each
+size, then the sound effects.
+"""
+def startup_assets():
+    images = [
+        (player_module.sprite_path, 1),
+        (player_module.shield_path, player_module.SHIELD_SCALING),
+        (projectile.sprite_path, projectile.SPRITE_SCALING),
+        (projectile.upgrade_path, projectile.SPRITE_SCALING),
+        (pickup.shield_path, pickup.SPRITE_SCALING),
+        (pickup.damage_path, pickup.SPRITE_SCALING),
+    ]
+    for size_class in ("medium", "large", "small"):
+        images += [(path, 1) for path in ASTEROID_PATHS[size_class]]
+    sound_paths = []
+    if pygame.mixer.get_init():
+        sound_paths = [
+            path for path in sorted(sound_dir.iterdir())
+            if path.suffix in (".wav", ".ogg") and path != music_path
+        ]
+    return images, sound_paths
+
+"""Decode every sprite image and sound effect the game can request, so the RUNNING state never reads from disk."""
+def preload_assets():
+    register_asset_sources()
+    images, sound_paths = startup_assets()
+    assets.preload(images)
+    sounds.preload(sound_paths)
+
+"""Construct pooled projectiles and pickups up front so firing does not allocate sprites."""
+def prefill_pools():
+    PROJECTILE_POOL.prefill(globals.PROJECTILE_POOL_SIZE // 2, (0, 0), 0)
+    PICKUP_POOL.prefill(globals.PICKUP_POOL_SIZE // 2, (0, 0), 'shield')
+
+"""Player input sampled for one simulation step; aim is a screen position or None for the mouse."""
+Inputs = namedtuple(
+    "Inputs", ["up", "down", "left", "right", "fire", "aim"],
+    defaults=[False, False, False, False, False, None]
+)
+
+"""Read the live keyboard and mouse state the RUNNING state responds to."""
+def read_inputs():
+    keys = pygame.key.get_pressed()
+    left_mouse, middle_mouse, right_mouse = pygame.mouse.get_pressed()
+    return Inputs(
+        up=keys[pygame.K_w],
+        down=keys[pygame.K_s],
+        left=keys[pygame.K_a],
+        right=keys[pygame.K_d],
+        fire=keys[pygame.K_SPACE] or left_mouse,
+        aim=pygame.mouse.get_pos(),
+    )
+
+"""Game simulation for the RUNNING state, independent of any window, clock or input device.
+
+Each call to step advances spawning, sprite updates, collisions, pickups and
+lives by dt seconds using the given Inputs. advance runs whole steps of
+globals.FIXED_DT out of real elapsed time and returns how far the renderer
+is between the last two steps, so the same seed and inputs give the same
+game at any render rate. All randomness comes from globals.RNG, which the
+engine replaces with the given rng or a Random seeded with seed.
+"""
+class Engine:
+    def __init__(self, field=None, seed=None, rng=None):
+        globals.RNG = rng if rng is not None else random.Random(seed)
+        self.seed = seed
+        self.spawner = AsteroidManager(field)
+        self.player = None
+        self.respawn_timer = 3
+        self.frame = 0
+        self.accumulator = 0
+        self.previous = {}
+        self.recorder = None
+        self.profiler = None
+        self.reset()
+
+    """Start a new game: full lives, zero score, no sprites and the first wave."""
+    def reset(self):
+        globals.LIVES = 3
+        globals.SCORE = 0
+        globals.PROJECTILE_DAMAGE = 10
+        for group in (globals.PLAYER_SPRITE, globals.ASTEROID_SPRITES,
+                      globals.PROJECTILE_SPRITES, globals.PICKUP_SPRITES):
+            for sprite in group.sprites():
+                sprite.kill()
+        self.respawn_timer = 3
+        self.spawner.start_game()
+        self.spawn_player()
+
+    def spawn_player(self):
+        self.player = Player(
+            pygame.math.Vector2(globals.WINDOW_WIDTH / 2, globals.WINDOW_HEIGHT / 2)
+        )
+        globals.PLAYER_SPRITE.add(self.player)
+
+    """Advance the simulation by dt seconds; return "GAMEOVER" once the last life is lost."""
+    def step(self, dt, inputs):
+        # A recorder stores the inputs and hands back the exact values it will replay
+        if self.recorder is not None:
+            inputs = self.recorder.record(self, inputs)
+
+        globals.DT = dt
+        self.frame += 1
+        collision.begin_frame()
+
+        # If player is destroyed, respawn and reset wave
+        if len(globals.PLAYER_SPRITE) < 1:
+            self.respawn_timer -= dt
+            if self.respawn_timer <= 0:
+                self.respawn_timer = 3
+                self.spawner.reset_game()
+                self.spawn_player()
+
+        # Respond to continuous input
+        player = self.player
+        player.aim = inputs.aim
+        if inputs.up:
+            player.move("UP")
+        if inputs.down:
+            player.move("DOWN")
+        if inputs.left:
+            player.move("LEFT")
+        if inputs.right:
+            player.move("RIGHT")
+        if inputs.fire:
+            player.shoot()
+
+        # Update all sprites
+        profiler = self.profiler
+        self.spawner.update()
+        if profiler is not None:
+            profiler.mark("spawner")
+        globals.ASTEROID_SPRITES.update()
+        globals.PROJECTILE_SPRITES.update()
+        globals.PICKUP_SPRITES.update()
+        if profiler is not None:
+            profiler.mark("updates")
+
+        # Bucket asteroids and pickups once; the player and the projectiles both collide against them
+        collision.rebuild_grids()
+        globals.PLAYER_SPRITE.update()
+
+        # Handle collisions and increment score
+        points, resources = self.spawner.handle_collision()
+        globals.SCORE += points
+
+        #Spawn pickups for dropped resources
+        for (pos, type) in resources:
+            self.spawner.queue.post(spawn_pickup, pos, type)
+        if profiler is not None:
+            profiler.mark("collision")
+
+        # Check for game over
+        if self.game_over:
+            # Whatever follows a game over is recorded from a fresh keyframe
+            if self.recorder is not None:
+                self.recorder.restart()
+            return "GAMEOVER"
+        return None
+
+    @property
+    def game_over(self):
+        return globals.LIVES < 1
+
+    """Run as many fixed steps as fit in the elapsed real time; return the interpolation factor."""
+    def advance(self, elapsed, inputs):
+        dt = globals.FIXED_DT
+        # The spawn budget is per rendered frame, so catch-up steps share it
+        self.spawner.queue.begin_frame()
+        # Drop time we cannot catch up on rather than spiralling into ever longer frames
+        self.accumulator = min(
+            self.accumulator + elapsed, dt * globals.MAX_STEPS_PER_FRAME
+        )
+        # The tolerance keeps float rounding from dropping a step, e.g. two per 1/30 s frame
+        while self.accumulator >= dt - 1e-9 and not self.game_over:
+            self.capture()
+            self.step(dt, inputs)
+            self.accumulator -= dt
+        return max(0, self.accumulator) / dt
+
+    """Remember where every sprite was before a step, for render interpolation."""
+    def capture(self):
+        self.previous = {
+            sprite: sprite.rect.center
+            for group in (globals.PLAYER_SPRITE, globals.ASTEROID_SPRITES,
+                          globals.PROJECTILE_SPRITES)
+            for sprite in group
+        }
+
+    """Temporarily move sprite rects between their previous and current positions for drawing.
+
+    Sprites that jumped further than max_jump (screen wrap, respawn, reuse
+    from a pool) are drawn where they are. Rects are restored on exit.
+    """
+    @contextmanager
+    def interpolated(self, alpha, max_jump=100):
+        moved = []
+        for sprite, (px, py) in self.previous.items():
+            rect = sprite.rect
+            x, y = rect.center
+            if abs(x - px) > max_jump or abs(y - py) > max_jump:
+                continue
+            moved.append((rect, (x, y)))
+            rect.center = (px + (x - px) * alpha, py + (y - py) * alpha)
+        try:
+            yield
+        finally:
+            for rect, center in moved:
+                rect.center = center
+
+    """Capture the complete simulation state as plain data, e.g. for replay keyframes."""
+    def snapshot(self):
+        player = self.player
+        return {
+            "backend": "sprites" if self.spawner.field is None else "field",
+            "frame": self.frame,
+            "respawn_timer": self.respawn_timer,
+            "rng": globals.RNG.getstate(),
+            "lives": globals.LIVES,
+            "score": globals.SCORE,
+            "damage": globals.PROJECTILE_DAMAGE,
+            "spawner": {name: getattr(self.spawner, name) for name in SPAWNER_STATE},
+            "player": {
+                "alive": player.alive(),
+                "pos": tuple(player.pos),
+                "vel": tuple(player.vel),
+                "rect": tuple(player.rect),
+                "angle": getattr(player, "angle", None),
+                "last_shot": player.last_shot,
+                "damage_up": player.damage_up,
+                "shield_up": player.shield_up,
+                "shield": player.shield is not None,
+            },
+            # Culled asteroids turn past the frame they show, so the shown angle is kept as well
+            "asteroids": [
+                (str(a.sprite_path), tuple(a.pos), tuple(a.vel), tuple(a.rect),
+                 a.rotation, a.rotation_speed, a.image_angle, a.health, a.size, a.variant)
+                for a in globals.ASTEROID_SPRITES
+            ],
+            "projectiles": [
+                (p.path == projectile.upgrade_path, tuple(p.pos), tuple(p.rect),
+                 p.heading, p.time_alive)
+                for p in globals.PROJECTILE_SPRITES
+            ],
+            "pickups": [(p.type, p.rect.center) for p in globals.PICKUP_SPRITES],
+        }
+
+    """Replace the simulation state with one captured by snapshot."""
+    def restore(self, state):
+        # The backends round positions differently, so a game only replays on the one it was recorded with
+        backend = "sprites" if self.spawner.field is None else "field"
+        if state.get("backend", "sprites") != backend:
+            raise ValueError(
+                f"snapshot was taken with the {state['backend']} asteroid backend, "
+                f"this engine uses {backend}"
+            )
+
+        for group in (globals.PLAYER_SPRITE, globals.ASTEROID_SPRITES,
+                      globals.PROJECTILE_SPRITES, globals.PICKUP_SPRITES):
+            for sprite in group.sprites():
+                sprite.kill()
+
+        self.frame = state["frame"]
+        self.respawn_timer = state["respawn_timer"]
+        self.accumulator = 0
+        self.previous = {}
+        self.spawner.queue.clear()
+        globals.LIVES = state["lives"]
+        globals.SCORE = state["score"]
+        globals.PROJECTILE_DAMAGE = state["damage"]
+        for name, value in state["spawner"].items():
+            setattr(self.spawner, name, value)
+
+        saved = state["player"]
+        player = self.player = Player(pygame.math.Vector2(saved["pos"]))
+        player.vel.update(saved["vel"])
+        player.last_shot = saved["last_shot"]
+        player.damage_up = saved["damage_up"]
+        player.shield_up = saved["shield_up"]
+        if saved["angle"] is not None:
+            player.angle = saved["angle"]
+            player.image, player.mask = player_module.ROTATION_CACHE.frame(
+                player_module.sprite_path, player.start_img,
+                -player.angle + player.sprite_rotation_offset
+            )
+        player.rect = pygame.Rect(saved["rect"])
+        if player.damage_up > 0:
+            player.shoot_sound = sounds.load_sound(player_module.upgrade_shoot_sound_path)
+            player.shoot_volume = 1.0
+        if saved["alive"]:
+            globals.PLAYER_SPRITE.add(player)
+            if saved["shield"]:
+                player.shield = Shield(player)
+                globals.PLAYER_SPRITE.add(player.shield)
+
+        field = self.spawner.field
+        for (path, pos, vel, rect, rotation, rotation_speed, image_angle,
+             health, size, variant) in state["asteroids"]:
+            if field is not None:
+                asteroid = field.place(
+                    Path(path), pos, vel, rotation, rotation_speed, health, size,
+                    variant, image_angle
+                )
+                asteroid.rect = pygame.Rect(rect)
+                globals.ASTEROID_SPRITES.add(asteroid)
+                continue
+            asteroid = ASTEROID_POOL.acquire(pos, size, variant)
+            asteroid.sprite_path = Path(path)
+            asteroid.start_img = asteroid.large_image = assets.load_image(path)
+            asteroid.radius = ASTEROID_MANIFEST.radius(path)
+            asteroid.vel.update(vel)
+            asteroid.rotation = rotation
+            asteroid.rotation_speed = rotation_speed
+            asteroid.health = health
+            asteroid.image, asteroid.mask = ASTEROID_ROTATIONS.frame(
+                asteroid.sprite_path, asteroid.start_img, image_angle
+            )
+            asteroid.image_angle = image_angle
+            asteroid.frame_angle = None
+            asteroid.rect = pygame.Rect(rect)
+            globals.ASTEROID_SPRITES.add(asteroid)
+
+        for upgraded, pos, rect, heading, time_alive in state["projectiles"]:
+            shot = PROJECTILE_POOL.acquire(pos, heading, upgraded)
+            shot.time_alive = time_alive
+            shot.rect = pygame.Rect(rect)
+            globals.PROJECTILE_SPRITES.add(shot)
+
+        for type, center in state["pickups"]:
+            globals.PICKUP_SPRITES.add(PICKUP_POOL.acquire(center, type))
+
+        # Rebuilding sprites drew random numbers, so restore the generator last
+        globals.RNG.setstate(state["rng"])
+
+"""AsteroidManager attributes that make up its part of a snapshot."""
+SPAWNER_STATE = (
+    "spawn_timer", "spawn_rate", "level", "wave_active",
+    "wave_number", "wave_timer", "wave_duration", "break_duration",
+)
+
+"""States in which engine.run blocks on events instead of running frames."""
+IDLE_STATES = ("WAITING", "UNFOCUSED")
+
+"""Block until an event arrives or timeout_ms passes, then return every pending event."""
+def wait_events(timeout_ms):
+    event = pygame.event.wait(timeout_ms)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+"""Scripted input for headless runs: keep firing while sweeping the aim around the ship."""
+def autopilot(engine):
+    aim = engine.player.pos + pygame.math.Vector2.from_polar((100, engine.frame * 3))
+    return Inputs(fire=True, aim=(aim.x, aim.y))
+
+"""Initialize pygame on dummy video and audio drivers and load everything the simulation needs."""
+def init_headless():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    pygame.init()
+    pygame.display.set_mode((globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
+    culling.set_view(globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT)
+    preload_assets()
+    prefill_pools()
+
+"""Run the simulation without a window or frame cap and report simulated frames per second."""
+def run_headless(frames, seed=None, record=None):
+    init_headless()
+    field = AsteroidField() if globals.ASTEROID_BACKEND == "field" else None
+    engine = Engine(field, seed)
+    if record:
+        engine.recorder = Recorder(record, engine)
+
+    dt = globals.FIXED_DT
+    games = 1
+    start = time.perf_counter()
+    for _ in range(frames):
+        if engine.step(dt, autopilot(engine)) == "GAMEOVER":
+            games += 1
+            engine.reset()
+    elapsed = time.perf_counter() - start
+    if engine.recorder is not None:
+        engine.recorder.close()
+
+    print(
+        f"Simulated {frames} frames in {elapsed:.2f}s "
+        f"({frames / max(elapsed, 1e-9):.0f} frames/s): "
+        f"{games} game(s), wave {engine.spawner.wave_number}, "
+        f"score {globals.SCORE}, {len(globals.ASTEROID_SPRITES)} asteroids"
+    )
+    pygame.quit()
+    return engine
+
+"""Re-simulate a recorded replay headless as fast as possible, optionally from the start of a wave."""
+def run_replay(path, wave=None):
+    init_headless()
+    replay = replays.Replay(path)
+    # Re-simulate on the asteroid backend the replay was recorded with
+    backend = replay.load_state(replay.index()[0]).get("backend", "sprites")
+    engine = Engine(AsteroidField() if backend == "field" else None, replay.seed)
+
+    start = time.perf_counter()
+    frames = replays.play(replay, engine, wave)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Replayed {frames} frames in {elapsed:.2f}s "
+        f"({frames / max(elapsed, 1e-9):.0f} frames/s): "
+        f"wave {engine.spawner.wave_number}, score {globals.SCORE}, "
+        f"{len(globals.ASTEROID_SPRITES)} asteroids"
+    )
+    pygame.quit()
+    return engine
+
+"""Save any replay, log how often spawns waited on asset loads and exit."""
+def quit_game(engine, streamer):
+    if engine.recorder is not None:
+        engine.recorder.close()
+    streamer.shutdown()
+    spawner = engine.spawner
+    if spawner.spawns:
+        log.debug(
+            "%d of %d asteroid spawns (%.1f%%) waited on an asset load",
+            spawner.stalled_spawns, spawner.spawns,
+            100 * spawner.stalled_spawns / spawner.spawns,
+        )
+    if QUALITY.history:
+        log.debug(
+            "quality changed %d time(s), ending at level %d (%s)",
+            len(QUALITY.history), QUALITY.level, QUALITY.name,
+        )
+    pygame.quit()
+    sys.exit()
 
 """This method runs the game and is called in the top-level main module."""
-def run():
+def run(record=None):
     """Initialize audio mixer and engine, set up display, start clock, and set starting state"""
     pygame.mixer.pre_init(44100, -16, 2, 64)
     pygame.mixer.init()
@@ -26,13 +502,19 @@ def run():
 
     screen = pygame.display.set_mode(
         (globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
+    culling.set_view(globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT)
     pygame.display.set_caption("Modern Asteroids")
-    background = pygame.image.load(bg_path)
+    background = assets.load_image(bg_path, alpha=False)
+
+    # Decode the rest on worker threads while the start menu is up
+    register_asset_sources()
+    streamer = AssetStreamer(globals.STREAM_WORKERS)
+    streamer.stream(*startup_assets())
+    prefill_pools()
 
     clock = globals.CLOCK
     state = "START"
     mouse = (-1, -1)
-    respawn_timer = 3
 
     """Set up UI with reusable modal, text, and buttons"""
     ui = UI(screen)
@@ -76,49 +558,95 @@ def run():
     scoreboard = Text(
         (50,10), 32, (255,255,255),
         "Score: " + str(globals.SCORE),
-        "Courier", bold=True
+        "Courier", bold=True, glyphs=True
     )
     ui.add(scoreboard)
 
     lives = Text(
         (300,10), 32, (255,255,255),
         "Lives: " + str(globals.LIVES),
-        "Courier", bold=True
+        "Courier", bold=True, glyphs=True
     )
     ui.add(lives)
 
-    # Create Asteroid spawner and player
-    spawner = AsteroidManager()
-    spawner.start_game()
-
-    player = Player(
-        pygame.math.Vector2((screen.get_width() / 2, screen.get_height() / 2))
+    # Create the simulation with its Asteroid spawner and player
+    field = AsteroidField() if globals.ASTEROID_BACKEND == "field" else None
+    engine = Engine(field)
+    if record:
+        engine.recorder = Recorder(record, engine)
+    else:
+        # Spread bursts of spawns over frames; recordings must replay exactly, so they spawn at once
+        engine.spawner.queue.budget_us = globals.SPAWN_BUDGET_US
+
+    # Only redraw the parts of the screen that sprites and UI touched
+    renderer = DirtyRenderer(screen, background, globals.DIRTY_RECT_THRESHOLD)
+    # Every game session starts at full quality
+    QUALITY.reset()
+
+    # Frame timings are always recorded; F3 toggles the overlay that shows them
+    profiler = engine.profiler = FrameProfiler(FRAME_PHASES, globals.PERF_HISTORY)
+    overlay = PerfOverlay(
+        (globals.WINDOW_WIDTH - 430, 10), profiler,
+        {
+            "player": globals.PLAYER_SPRITE, "asteroids": globals.ASTEROID_SPRITES,
+            "shots": globals.PROJECTILE_SPRITES, "pickups": globals.PICKUP_SPRITES,
+        },
+        clock,
     )
-    globals.PLAYER_SPRITE.add(player)
+    if globals.SHOW_PERF_OVERLAY:
+        ui.add(overlay)
+    log.debug(font_report())
 
     pygame.mixer.music.play(loops=-1)
 
     # Enter game loop
     while True:
 
-        # limits FPS and returns value for framerate-independent physics
-        globals.DT = clock.tick(globals.FRAMERATE) / 1000
+        if state in IDLE_STATES:
+            # Nothing moves behind a modal or in the background, so sleep until an event arrives
+            events = wait_events(1000 // globals.IDLE_FRAMERATE)
+            # Restart the frame timer so the time spent idle is not simulated on resume
+            clock.tick()
+            elapsed = 0
+        else:
+            # limits FPS and returns the real time the simulation has to catch up on
+            elapsed = clock.tick(globals.FRAMERATE) / 1000
+            events = pygame.event.get()
+        profiler.begin()
+        culling.begin_frame()
+        if not streamer.done:
+            streamer.pump()
 
         # Set state based on input
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 state == "EXIT"
-                pygame.quit()
-                sys.exit()
+                quit_game(engine, streamer)
                 return
 
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+                # Only regaining focus leaves UNFOCUSED, since that is where the music resumes
+                if event.key == pygame.K_ESCAPE and state != "UNFOCUSED":
                     state = "PAUSED" if state == "RUNNING" else "RUNNING"
+                if event.key == pygame.K_F3:
+                    if overlay in ui.children:
+                        ui.remove(overlay)
+                    else:
+                        ui.add(overlay)
 
             if event.type == pygame.MOUSEBUTTONUP:
                 mouse = event.pos
 
+            # Pause while the window is in the background and pick up again as soon as it returns
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED):
+                if state == "RUNNING":
+                    state = "UNFOCUSED"
+                    pygame.mixer.music.pause()
+            if event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED):
+                if state == "UNFOCUSED":
+                    state = "RUNNING"
+                    pygame.mixer.music.unpause()
+
         # Run the correct logic based  on current state
         if state == "START":
             globals.LIVES = 3
@@ -164,8 +692,15 @@ def run():
             state = "WAITING"
             continue
             
+        # While unfocused the window may have been hidden, so redraw it in full on return
+        if state == "UNFOCUSED":
+            renderer.invalidate()
+            continue
+
         #Transition to waiting state while modal is presented
         if state == "WAITING":
+            # The modal covers the screen, so the next game frame is drawn in full
+            renderer.invalidate()
             clicked = modal.check_click(mouse)
             match clicked:
                 case 'Retry':
@@ -175,8 +710,7 @@ def run():
                     mouse = (-1, -1)
                     state = 'RUNNING'
                 case 'Quit':
-                    pygame.quit()
-                    sys.exit()
+                    quit_game(engine, streamer)
                     return
             continue
 
@@ -184,58 +718,32 @@ def run():
         if state == "RUNNING":
             if(modal in ui.children):
               ui.remove(modal)
-            # If player is destroyed, respawn and reset wave
-            if len(globals.PLAYER_SPRITE) < 1:
-                respawn_timer -= globals.DT
-                if respawn_timer <= 0:
-                    respawn_timer = 3
-                    spawner.reset_game()
-                    player = Player(
-                        pygame.Vector2(screen.get_width() / 2,
-                                       screen.get_height() / 2)
-                    )
-                    globals.PLAYER_SPRITE.add(player)
-
-            # Respond to continuous input from keys and mouse
-            keys = pygame.key.get_pressed()
-            left_mouse, middle_mouse, right_mouse = pygame.mouse.get_pressed()
-            if keys[pygame.K_w]:
-                player.move("UP")
-            if keys[pygame.K_s]:
-                player.move("DOWN")
-            if keys[pygame.K_a]:
-                player.move("LEFT")
-            if keys[pygame.K_d]:
-                player.move("RIGHT")
-            if keys[pygame.K_SPACE] or left_mouse:
-                player.shoot()
-
-            # Update all sprites and the UI
-            spawner.update()
-            globals.PLAYER_SPRITE.update()
-            globals.ASTEROID_SPRITES.update()
-            globals.PROJECTILE_SPRITES.update()
-            globals.PICKUP_SPRITES.update()
-            scoreboard.set_text("Score: " + str(globals.SCORE))
-            lives.set_text("Lives: " + str(globals.LIVES))
-            screen.blit(background, (0, 0))
-
-            # Handle collisions and increment score
-            points, resources = spawner.handle_collision()
-            globals.SCORE += points
-
-            #Spawn pickups for dropped resources
-            for (pos, type) in resources:
-                globals.PICKUP_SPRITES.add(Pickup(pos, type))
-
-            # Check for game over
-            if globals.LIVES < 1:
+            # Advance the simulation in fixed steps with the live keyboard and mouse state
+            inputs = read_inputs()
+            profiler.mark("input")
+            alpha = engine.advance(elapsed, inputs)
+            if engine.game_over:
                 state = "GAMEOVER"
 
-            # Draw all sprites to display
-            globals.PLAYER_SPRITE.draw(screen)
-            globals.ASTEROID_SPRITES.draw(screen)
-            globals.PROJECTILE_SPRITES.draw(screen)
-            globals.PICKUP_SPRITES.draw(screen)
-            ui.draw()
-            pygame.display.flip()
+            # Update the UI
+            scoreboard.set_text("Score: " + str(globals.SCORE))
+            lives.set_text("Lives: " + str(globals.LIVES))
+            renderer.erase()
+            profiler.mark("background")
+
+            # Draw all sprites to display, interpolated between the last two steps
+            with engine.interpolated(alpha):
+                renderer.draw(
+                    globals.PLAYER_SPRITE, globals.ASTEROID_SPRITES,
+                    globals.PROJECTILE_SPRITES, globals.PICKUP_SPRITES,
+                )
+            profiler.mark("draw")
+            renderer.add(ui.draw())
+            profiler.mark("ui")
+            renderer.present()
+            profiler.mark("flip")
+            profiler.end()
+            # Recorded games must replay exactly, so their spawning ignores how long frames take
+            if engine.recorder is None:
+                engine.spawner.governor.frame(profiler.last_ms())
+                QUALITY.frame(profiler.last_ms())
@@ -0,0 +1,308 @@
+import math
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import pygame
+from . import globals
+from .context import GameContext
+from .engine import Engine, Inputs, init_headless
+from .Player import BOOST_DURATION
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the bot environments
+    np = None
+
+
+"""Fixed sizes of the entity observation arrays; the nearest entities to the player are kept."""
+MAX_ASTEROIDS = 32
+MAX_PROJECTILES = 16
+MAX_PICKUPS = 8
+
+"""Movement choices of an action, and how many directions the aim is quantized into."""
+MOVES = (None, "UP", "DOWN", "LEFT", "RIGHT")
+AIM_BINS = 16
+
+"""Raster intensity of each kind of entity."""
+RASTER_COLORS = {
+    "PICKUP_SPRITES": 64, "ASTEROID_SPRITES": 128,
+    "PROJECTILE_SPRITES": 192, "PLAYER_SPRITE": 255,
+}
+
+
+"""Return the name, shape and dtype of every observation array for a raster shape (or None)."""
+def observation_spec(raster=None):
+    spec = {
+        "player": ((10,), np.float32),
+        "asteroids": ((MAX_ASTEROIDS, 7), np.float32),
+        "projectiles": ((MAX_PROJECTILES, 5), np.float32),
+        "pickups": ((MAX_PICKUPS, 4), np.float32),
+    }
+    if raster is not None:
+        spec["raster"] = (tuple(raster), np.uint8)
+    return spec
+
+
+"""A single game driven by actions instead of the keyboard, in the style of a Gym environment.
+
+reset(seed) starts a new game and returns (observation, info); step(action)
+runs frame_skip fixed simulation steps and returns (observation, reward,
+terminated, truncated, info). An action is an Inputs tuple or a
+(move, fire, aim) triple of ints: an index into MOVES, 0 or 1, and one of
+AIM_BINS directions around the ship. The reward is the score gained, less
+life_penalty per life lost.
+
+Observations are dicts of NumPy arrays (see observation_spec): player
+features, and for asteroids, projectiles and pickups one row per entity,
+nearest to the player first, with a leading presence flag. With raster set
+to (height, width) a coarse grayscale image of the playfield is included.
+Each environment keeps its globals in a GameContext, so several can share a
+process.
+"""
+class AsteroidsEnv:
+    def __init__(self, seed=None, frame_skip=4, max_steps=None, raster=None, life_penalty=0):
+        if np is None:
+            raise ImportError("AsteroidsEnv requires NumPy (pip install numpy)")
+        if pygame.display.get_surface() is None:
+            init_headless()
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.raster = raster
+        self.life_penalty = life_penalty
+        self.spec = observation_spec(raster)
+        self.raster_surface = None
+        if raster is not None:
+            self.raster_surface = pygame.Surface((raster[1], raster[0]))
+        self.steps = 0
+        self.context = GameContext(seed)
+        with self.context.active():
+            self.engine = Engine(seed=seed)
+
+    def reset(self, seed=None, out=None):
+        with self.context.active():
+            if seed is not None:
+                globals.RNG.seed(seed)
+            self.engine.reset()
+            self.engine.frame = 0
+            self.steps = 0
+            return self.observe(out), self.info()
+
+    def step(self, action, out=None):
+        with self.context.active():
+            inputs = self.inputs(action)
+            score, lives = globals.SCORE, globals.LIVES
+            terminated = False
+            for _ in range(self.frame_skip):
+                if self.engine.step(globals.FIXED_DT, inputs) == "GAMEOVER":
+                    terminated = True
+                    break
+            self.steps += 1
+            reward = globals.SCORE - score - self.life_penalty * (lives - globals.LIVES)
+            truncated = self.max_steps is not None and self.steps >= self.max_steps
+            return self.observe(out), reward, terminated, truncated, self.info()
+
+    """Translate an action into the Inputs of a simulation step."""
+    def inputs(self, action):
+        if isinstance(action, Inputs):
+            return action
+        move, fire, aim = (int(value) for value in action)
+        direction = MOVES[move]
+        target = self.engine.player.pos + pygame.math.Vector2.from_polar(
+            (100, aim * 360 / AIM_BINS)
+        )
+        return Inputs(
+            up=direction == "UP", down=direction == "DOWN",
+            left=direction == "LEFT", right=direction == "RIGHT",
+            fire=bool(fire), aim=(target.x, target.y),
+        )
+
+    def info(self):
+        return {
+            "score": globals.SCORE,
+            "lives": globals.LIVES,
+            "wave": self.engine.spawner.wave_number,
+            "frame": self.engine.frame,
+        }
+
+    """Fill the observation arrays (new ones, or the given dict of arrays) from the current game."""
+    def observe(self, out=None):
+        if out is None:
+            out = {name: np.zeros(shape, dtype) for name, (shape, dtype) in self.spec.items()}
+        width, height = globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT
+        speed = globals.PROJECTILE_SPEED
+        player = self.engine.player
+        angle = math.radians(getattr(player, "angle", 0))
+        out["player"][:] = (
+            player.alive(), player.pos.x / width, player.pos.y / height,
+            player.vel.x / speed, player.vel.y / speed, math.cos(angle), math.sin(angle),
+            player.shield_up / BOOST_DURATION, player.damage_up / BOOST_DURATION,
+            globals.LIVES / 3,
+        )
+
+        origin = player.pos
+        nearest(out["asteroids"], globals.ASTEROID_SPRITES, origin, lambda a: (
+            1, a.pos.x / width, a.pos.y / height, a.vel.x / speed, a.vel.y / speed,
+            a.size / 3, a.health / 30,
+        ))
+        nearest(out["projectiles"], globals.PROJECTILE_SPRITES, origin, lambda p: (
+            1, p.pos.x / width, p.pos.y / height, p.vel.x / speed, p.vel.y / speed,
+        ))
+        nearest(out["pickups"], globals.PICKUP_SPRITES, origin, lambda p: (
+            1, p.rect.centerx / width, p.rect.centery / height, p.type == "shield",
+        ))
+
+        if self.raster_surface is not None:
+            out["raster"][:] = self.render_raster()
+        return out
+
+    """Draw every entity as a filled rect of its intensity onto the small raster surface."""
+    def render_raster(self):
+        surface = self.raster_surface
+        surface.fill((0, 0, 0))
+        scale_x = surface.get_width() / globals.WINDOW_WIDTH
+        scale_y = surface.get_height() / globals.WINDOW_HEIGHT
+        for name, value in RASTER_COLORS.items():
+            for sprite in getattr(globals, name):
+                rect = sprite.rect
+                surface.fill((value, 0, 0), (
+                    int(rect.x * scale_x), int(rect.y * scale_y),
+                    max(1, int(rect.w * scale_x)), max(1, int(rect.h * scale_y)),
+                ))
+        return pygame.surfarray.pixels_red(surface).T
+
+
+"""Write the features of the sprites nearest to origin into the rows of out, zeroing the rest."""
+def nearest(out, sprites, origin, features):
+    out[:] = 0
+    if not sprites:
+        return
+    ordered = sorted(sprites, key=lambda sprite: origin.distance_squared_to(sprite.rect.center))
+    for row, sprite in zip(out, ordered):
+        row[:] = features(sprite)
+
+
+"""Attach to the shared observation buffers of a VectorEnv as arrays of (num_envs, *shape)."""
+def attach_buffers(names, spec, num_envs):
+    buffers, arrays = [], {}
+    for name, (shape, dtype) in spec.items():
+        memory = shared_memory.SharedMemory(name=names[name])
+        buffers.append(memory)
+        arrays[name] = np.ndarray((num_envs,) + shape, dtype, buffer=memory.buf)
+    return buffers, arrays
+
+
+"""Worker process of a VectorEnv: steps its share of the games and writes their observations."""
+def run_worker(pipe, indices, seeds, env_kwargs, names, num_envs):
+    envs = {i: AsteroidsEnv(seed=seeds[i], **env_kwargs) for i in indices}
+    buffers, arrays = attach_buffers(names, envs[indices[0]].spec, num_envs)
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "reset":
+                infos = []
+                for i in indices:
+                    out = {name: array[i] for name, array in arrays.items()}
+                    infos.append(envs[i].reset(data[i], out)[1])
+                pipe.send(infos)
+            elif command == "step":
+                results = []
+                for i, action in zip(indices, data):
+                    out = {name: array[i] for name, array in arrays.items()}
+                    _, reward, terminated, truncated, info = envs[i].step(action, out)
+                    # Finished games restart at once; the info still describes the game that ended
+                    if terminated or truncated:
+                        envs[i].reset(None, out)
+                    results.append((reward, terminated, truncated, info))
+                pipe.send(results)
+            else:
+                break
+    finally:
+        del arrays
+        for memory in buffers:
+            memory.close()
+        pipe.close()
+
+
+"""Runs num_envs independent games across worker processes, stepped together.
+
+Each worker process owns a share of the games (in their own GameContexts)
+and writes observations straight into shared memory, so only actions,
+rewards and small info dicts travel over the pipes. Observations are
+returned as dicts of (num_envs, *shape) arrays. Games that end are reset
+automatically; their step still reports terminated or truncated.
+"""
+class VectorEnv:
+    def __init__(self, num_envs, seed=None, processes=None, start_method="spawn", **env_kwargs):
+        if np is None:
+            raise ImportError("VectorEnv requires NumPy (pip install numpy)")
+        self.num_envs = num_envs
+        self.spec = observation_spec(env_kwargs.get("raster"))
+        self.buffers = {}
+        for name, (shape, dtype) in self.spec.items():
+            size = max(1, num_envs * int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            self.buffers[name] = shared_memory.SharedMemory(create=True, size=size)
+        self.observations = {
+            name: np.ndarray((num_envs,) + shape, dtype, buffer=self.buffers[name].buf)
+            for name, (shape, dtype) in self.spec.items()
+        }
+        names = {name: memory.name for name, memory in self.buffers.items()}
+        seeds = [None if seed is None else seed + i for i in range(num_envs)]
+
+        processes = min(num_envs, processes or os.cpu_count() or 1)
+        context = multiprocessing.get_context(start_method)
+        self.shares = [list(range(num_envs))[i::processes] for i in range(processes)]
+        self.pipes, self.workers = [], []
+        for indices in self.shares:
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=run_worker, daemon=True,
+                args=(child, indices, seeds, env_kwargs, names, num_envs),
+            )
+            worker.start()
+            child.close()
+            self.pipes.append(parent)
+            self.workers.append(worker)
+
+    def reset(self, seed=None):
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        for pipe in self.pipes:
+            pipe.send(("reset", seeds))
+        infos = [None] * self.num_envs
+        for pipe, indices in zip(self.pipes, self.shares):
+            for i, info in zip(indices, pipe.recv()):
+                infos[i] = info
+        return self.copy_observations(), infos
+
+    """Step every game with its action; return observations, rewards, terminated, truncated and infos."""
+    def step(self, actions):
+        for pipe, indices in zip(self.pipes, self.shares):
+            pipe.send(("step", [actions[i] for i in indices]))
+        rewards = np.zeros(self.num_envs, np.float32)
+        terminated = np.zeros(self.num_envs, bool)
+        truncated = np.zeros(self.num_envs, bool)
+        infos = [None] * self.num_envs
+        for pipe, indices in zip(self.pipes, self.shares):
+            for i, result in zip(indices, pipe.recv()):
+                rewards[i], terminated[i], truncated[i], infos[i] = result
+        return self.copy_observations(), rewards, terminated, truncated, infos
+
+    def copy_observations(self):
+        return {name: array.copy() for name, array in self.observations.items()}
+
+    def close(self):
+        for pipe in self.pipes:
+            pipe.send(("close", None))
+        for worker in self.workers:
+            worker.join()
+        self.pipes, self.workers = [], []
+        self.observations = {}
+        for memory in self.buffers.values():
+            memory.close()
+            memory.unlink()
+        self.buffers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
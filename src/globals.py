@@ -1,3 +1,4 @@
+import random
 import pygame
 
 """Define configuration of scene settings."""
@@ -9,10 +10,56 @@ DT = 0
 LIVES = 3
 SCORE = 0
 
+"""Loop rate while a menu is up or the window is in the background, when the game only waits for events."""
+IDLE_FRAMERATE = 4
+
+"""Worker threads that decode images and sounds in the background at startup."""
+STREAM_WORKERS = 4
+
+"""Configure the fixed simulation timestep, decoupled from the render framerate."""
+FIXED_DT = 1 / 60
+MAX_STEPS_PER_FRAME = 5
+
+"""Single source of randomness for the simulation; seed or replace it for reproducible runs."""
+RNG = random.Random()
+
 """Configure behavior of player-fired projectiles."""
 PROJECTILE_SPEED = 500
 PROJECTILE_DAMAGE = 10
 
+"""Configure pre-rendered asteroid rotation frames (degrees per frame, memory cap in bytes)."""
+ASTEROID_ROTATION_STEP = 3
+ROTATION_CACHE_BYTES = 256 * 1024 * 1024
+
+"""Configure how many killed sprites each object pool keeps for reuse."""
+PROJECTILE_POOL_SIZE = 64
+ASTEROID_POOL_SIZE = 256
+PICKUP_POOL_SIZE = 16
+
+"""Microseconds per rendered frame, across all its steps, spent creating queued fragments, wave spawns and pickups (None creates them at once)."""
+SPAWN_BUDGET_US = 1000
+
+"""Cap on live asteroids and their total mass (a large asteroid weighs 4, a medium 2 and a small 1)."""
+MAX_ASTEROIDS = 80
+MAX_ASTEROID_MASS = 160
+
+"""Frame time in milliseconds above which wave spawns are throttled, and how many frames are averaged to decide."""
+FRAME_BUDGET_MS = 14
+FRAME_WINDOW = 60
+
+"""Pixels beyond the screen edge within which asteroids still update their rotation frame."""
+CULL_MARGIN = 32
+
+"""Select how asteroids are stored: "sprites" (one Asteroid each) or "field" (NumPy arrays, needs numpy)."""
+ASTEROID_BACKEND = "sprites"
+
+"""Fraction of the screen that may change before a frame is redrawn in full rather than by dirty rects (0 always redraws)."""
+DIRTY_RECT_THRESHOLD = 0.4
+
+"""Configure the performance overlay (toggled in game with F3) and how many frames it keeps."""
+SHOW_PERF_OVERLAY = False
+PERF_HISTORY = 240
+
 """Create globally-accessible sprite groups."""
 PLAYER_SPRITE = pygame.sprite.Group()
 ASTEROID_SPRITES = pygame.sprite.Group()
@@ -0,0 +1,216 @@
+import logging
+import time
+from collections import deque
+from . import globals
+
+log = logging.getLogger(__name__)
+
+"""Rolling frame times that yield their average once every `size` frames.
+
+Governors judge a change on a whole window of frames rather than on single
+slow frames, and restart the window after each change so the next decision
+only sees frames that ran with it.
+"""
+class FrameWindow:
+    def __init__(self, size=60):
+        self.frame_times = deque(maxlen=size)
+
+    """Record a frame time in milliseconds; return the window's average once it is full, else None."""
+    def add(self, ms):
+        frame_times = self.frame_times
+        frame_times.append(ms)
+        if len(frame_times) < frame_times.maxlen:
+            return None
+        return sum(frame_times) / len(frame_times)
+
+    def clear(self):
+        self.frame_times.clear()
+
+"""Mass of an asteroid by size: the number of small asteroids it eventually breaks into."""
+ASTEROID_MASS = {3: 4, 2: 2, 1: 1}
+
+"""Keeps the asteroid population within what the game and the machine can handle.
+
+Wave spawns are refused while the field holds max_count asteroids or a
+new one would take the total mass past max_mass; fragments of destroyed
+asteroids are never refused. frame(ms) feeds it the measured frame time:
+whenever a full window of frames averages over budget_ms, the share of the
+wave's spawn rate actually used (throttle) drops by step, down to floor,
+and climbs back once frames average under headroom times the budget. Fewer
+spawns are made up for with faster rocks and more large ones, so a slow
+machine is not an easier game. Every change is logged.
+
+Only engine.run feeds frame times, and never while recording; without
+them the throttle stays at 1 and spawning is exactly as configured, so
+seeded, headless and replayed games do not depend on the machine.
+"""
+class SpawnGovernor:
+    def __init__(self, max_count, max_mass, budget_ms, window=60,
+                 floor=0.25, step=0.75, headroom=0.75):
+        self.max_count = max_count
+        self.max_mass = max_mass
+        self.budget_ms = budget_ms
+        self.floor = floor
+        self.step = step
+        self.headroom = headroom
+        self.window = FrameWindow(window)
+        self.throttle = 1.0
+        self.capped = None
+        self.refused = 0
+
+    """Record the time of a finished frame and adjust the throttle once a window of frames is in."""
+    def frame(self, ms):
+        average = self.window.add(ms)
+        if average is None:
+            return
+        if average > self.budget_ms and self.throttle > self.floor:
+            throttle = max(self.floor, self.throttle * self.step)
+        elif average < self.budget_ms * self.headroom and self.throttle < 1:
+            throttle = min(1.0, self.throttle / self.step)
+        else:
+            return
+        log.info(
+            "frame time %.1f ms (budget %.1f ms): spawn rate x%.2f -> x%.2f, speed x%.2f",
+            average, self.budget_ms, self.throttle, throttle, throttle ** -0.5,
+        )
+        self.throttle = throttle
+        self.window.clear()
+
+    """Return the spawn rate to use for a wave's nominal rate."""
+    def spawn_rate(self, rate):
+        return rate * self.throttle
+
+    """Speed multiplier for spawned asteroids that makes up for a throttled spawn rate."""
+    @property
+    def speed(self):
+        return self.throttle ** -0.5
+
+    """Return size weights for (large, medium, small) spawns, favouring large ones while throttled."""
+    def size_weights(self, weights):
+        large, medium, small = weights
+        return [large / self.throttle, medium, small]
+
+    """Return whether an asteroid of the given size may join the asteroids already in play."""
+    def admit(self, asteroids, size):
+        count = len(asteroids)
+        mass = sum(ASTEROID_MASS[asteroid.size] for asteroid in asteroids)
+        if count >= self.max_count:
+            reason = "count"
+        elif mass + ASTEROID_MASS[size] > self.max_mass:
+            reason = "mass"
+        else:
+            reason = None
+
+        if reason != self.capped:
+            if reason is None:
+                log.info("asteroid spawns resumed: %d asteroids, mass %d", count, mass)
+            else:
+                log.info(
+                    "asteroid spawns held by %s cap: %d asteroids (max %d), mass %d (max %d)",
+                    reason, count, self.max_count, mass, self.max_mass,
+                )
+            self.capped = reason
+        if reason is not None:
+            self.refused += 1
+            return False
+        return True
+
+    def stats(self):
+        return {
+            "throttle": self.throttle,
+            "speed": self.speed,
+            "capped": self.capped,
+            "refused": self.refused,
+        }
+
+
+"""Quality levels from full detail down; each level keeps the savings of the levels above it.
+
+rotation_step multiplies the rotation cache's angle step, so asteroids turn
+in coarser increments and fetch a new frame less often. rotate_small=False
+freezes the frame of small asteroids. max_sounds limits the explosions heard
+per collision pass. offscreen_interval moves asteroids outside the culling
+view once every that many steps, by all the steps at once.
+"""
+QUALITY_LEVELS = (
+    {"name": "full", "rotation_step": 1, "rotate_small": True,
+     "max_sounds": None, "offscreen_interval": 1},
+    {"name": "coarse rotation", "rotation_step": 2, "rotate_small": True,
+     "max_sounds": None, "offscreen_interval": 1},
+    {"name": "still small rocks", "rotation_step": 2, "rotate_small": False,
+     "max_sounds": None, "offscreen_interval": 1},
+    {"name": "fewer sounds", "rotation_step": 2, "rotate_small": False,
+     "max_sounds": 2, "offscreen_interval": 1},
+    {"name": "slow off-screen", "rotation_step": 2, "rotate_small": False,
+     "max_sounds": 2, "offscreen_interval": 4},
+)
+
+"""Trades detail for frame time while the game runs slow and restores it when it catches up.
+
+frame(ms) feeds it the measured frame time. Whenever a full window of
+frames averages over budget_ms, quality drops one level of QUALITY_LEVELS;
+once frames average under headroom times the budget it climbs back one
+level. The settings of the current level are attributes read by
+Asteroid.update and AsteroidManager.handle_collision. Each change is logged
+and kept in history as (monotonic time, frames seen, old level, new level,
+average frame ms) for correlating with reports.
+
+Only engine.run feeds frame times, and never while recording, so seeded,
+headless and replayed games always run at full quality.
+"""
+class QualityGovernor:
+    def __init__(self, budget_ms, window=60, headroom=0.75, history=100):
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.window = FrameWindow(window)
+        self.history = deque(maxlen=history)
+        self.frames = 0
+        self.set_level(0)
+
+    """Record the time of a finished frame and step quality down or up once a window of frames is in."""
+    def frame(self, ms):
+        self.frames += 1
+        average = self.window.add(ms)
+        if average is None:
+            return
+        if average > self.budget_ms and self.level < len(QUALITY_LEVELS) - 1:
+            level = self.level + 1
+        elif average < self.budget_ms * self.headroom and self.level > 0:
+            level = self.level - 1
+        else:
+            return
+        log.info(
+            "frame time %.1f ms (budget %.1f ms): quality %s -> %s",
+            average, self.budget_ms, self.name, QUALITY_LEVELS[level]["name"],
+        )
+        self.history.append((time.monotonic(), self.frames, self.level, level, average))
+        self.set_level(level)
+        self.window.clear()
+
+    def set_level(self, level):
+        self.level = level
+        settings = QUALITY_LEVELS[level]
+        self.name = settings["name"]
+        self.rotation_step = settings["rotation_step"]
+        self.rotate_small = settings["rotate_small"]
+        self.max_sounds = settings["max_sounds"]
+        self.offscreen_interval = settings["offscreen_interval"]
+
+    """Return to full quality and forget the history, e.g. between tests."""
+    def reset(self):
+        self.window.clear()
+        self.history.clear()
+        self.frames = 0
+        self.set_level(0)
+
+    def stats(self):
+        return {
+            "level": self.level,
+            "name": self.name,
+            "changes": len(self.history),
+            "frames": self.frames,
+        }
+
+
+"""Quality settings shared by every asteroid; fed by engine.run."""
+QUALITY = QualityGovernor(globals.FRAME_BUDGET_MS, globals.FRAME_WINDOW)
@@ -0,0 +1,91 @@
+import json
+import math
+import sys
+from pathlib import Path
+import pygame
+
+"""Index of the asteroid sprites by size class and variant family, with per-sprite metadata.
+
+The manifest is generated (python -m src.manifest) from the files in
+asteroid_dir and lists, per size class and family (the first two letters of
+a file name, e.g. "a1"), every sprite with the radius of a circle around its
+center that covers its opaque pixels. At runtime it answers "all sprites of
+a size" and "all sprites of a family" with a dictionary lookup, and gives
+asteroids the radius that collision.collide checks before testing masks.
+Without a manifest file the directories are scanned instead, without
+metadata.
+"""
+asteroid_dir = Path("assets", "art", "asteroids")
+manifest_path = asteroid_dir / "manifest.json"
+SIZE_CLASSES = ("large", "medium", "small")
+"""Pixels added to a stored radius for pixel edges, odd frame sizes and rotation resampling."""
+RADIUS_SLACK = 2
+
+
+"""Return the metadata of one sprite: the radius around its center that covers its opaque pixels."""
+def describe(path):
+    image = pygame.image.load(path)
+    mask = pygame.mask.from_surface(image)
+    width, height = image.get_size()
+    radius = max(
+        (math.hypot(x + 0.5 - width / 2, y + 0.5 - height / 2) for x, y in mask.outline()),
+        default=0,
+    )
+    return {"radius": math.ceil(radius)}
+
+
+"""Scan the size class directories; return {size class: {family: {file name: metadata or None}}}."""
+def scan(directory=asteroid_dir, metadata=True):
+    classes = {}
+    for size_class in SIZE_CLASSES:
+        families = classes[size_class] = {}
+        for path in sorted(Path(directory, size_class).glob("*.png")):
+            entry = describe(path) if metadata else None
+            families.setdefault(path.name[:2], {})[path.name] = entry
+    return classes
+
+
+def build(directory=asteroid_dir, path=manifest_path):
+    Path(path).write_text(json.dumps(scan(directory), separators=(",", ":")))
+
+
+class AssetManifest:
+    def __init__(self, classes, directory=asteroid_dir):
+        self.families = {}
+        self.paths = {}
+        self.metadata = {}
+        for size_class, families in classes.items():
+            self.paths[size_class] = []
+            for family, files in sorted(families.items()):
+                paths = self.families[size_class, family] = []
+                for name, entry in sorted(files.items()):
+                    path = Path(directory, size_class, name)
+                    paths.append(path)
+                    self.paths[size_class].append(path)
+                    self.metadata[path] = entry
+
+    """Load the generated manifest, or scan the directories if it has not been built."""
+    @classmethod
+    def load(cls, path=manifest_path, directory=asteroid_dir):
+        if Path(path).is_file():
+            return cls(json.loads(Path(path).read_text()), directory)
+        return cls(scan(directory, metadata=False), directory)
+
+    """Return the sprites of one family in a size class, or an empty list."""
+    def family(self, size_class, family):
+        return self.families.get((size_class, family), [])
+
+    """Return the covering radius of a sprite, with slack for rounding, or None without metadata.
+
+    Rotating about the center keeps the opaque pixels inside the circle, so
+    the radius holds for every rotation frame of the sprite.
+    """
+    def radius(self, path):
+        entry = self.metadata.get(Path(path))
+        if entry is None:
+            return None
+        return entry["radius"] + RADIUS_SLACK
+
+
+if __name__ == "__main__":
+    build(path=sys.argv[1] if len(sys.argv) > 1 else manifest_path)
@@ -1,23 +1,48 @@
 import pygame
 from pathlib import Path
+from . import assets
+from . import globals
+from . import sounds
+from .pool import Pool
 
 shield_path = Path("assets", "art", "pickups", "shield.png")
 damage_path = Path("assets", "art", "pickups", "damage.png")
 sound_path = Path("assets", "sounds", "power_up.wav")
+SPRITE_SCALING = 0.2
 
 """Class to manage sprites for pickups that provide player boosts"""
 class Pickup(pygame.sprite.Sprite):
+  pool = None
+
   def __init__(self, pos, type):
     super().__init__()
+    self.reset(pos, type)
+
+  """Reinitialise in place so a pooled pickup can be dropped again"""
+  def reset(self, pos, type):
     self.type = type
+    self.sprite_scaling = SPRITE_SCALING
     if type == 'shield':
-        self.image = pygame.image.load(shield_path).convert_alpha()
+        self.image = assets.load_image(shield_path, self.sprite_scaling)
     elif type == 'damage':
-        self.image = pygame.image.load(damage_path).convert_alpha()
-    self.sprite_scaling = 0.2
-    self.image = pygame.transform.scale_by(self.image, self.sprite_scaling)
+        self.image = assets.load_image(damage_path, self.sprite_scaling)
     self.rect = self.image.get_rect(center=pos)
-    self.sound = pygame.mixer.Sound(sound_path)
+    self.sound = sounds.load_sound(sound_path)
   
   def update(self):
-     pass
\ No newline at end of file
+     pass
+
+  def kill(self):
+    super().kill()
+    if self.pool is not None:
+        self.pool.release(self)
+
+"""Free list of collected pickups, reused when asteroids drop resources"""
+PICKUP_POOL = Pool(Pickup, globals.PICKUP_POOL_SIZE)
+
+
+"""Drop a pickup into the game at a position and return it."""
+def spawn_pickup(pos, type):
+    pickup = PICKUP_POOL.acquire(pos, type)
+    globals.PICKUP_SPRITES.add(pickup)
+    return pickup
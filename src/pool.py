@@ -0,0 +1,60 @@
+"""Free list of reusable sprites of one class.
+
+acquire() hands out a released sprite reinitialised through its reset()
+method, or constructs a new one when the free list is empty. Pooled sprites
+return themselves to the free list from kill(), so callers keep using the
+normal sprite lifecycle. Up to max_size released sprites are kept; any more
+are left to the garbage collector.
+"""
+class Pool:
+    def __init__(self, cls, max_size=64):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    """Return a sprite initialised with the given arguments, reusing a released one if possible."""
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+        else:
+            sprite = self.cls(*args)
+            sprite.pool = self
+            self.created += 1
+        sprite.pooled = False
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return sprite
+
+    """Take back a killed sprite; releasing the same sprite twice is a no-op."""
+    def release(self, sprite):
+        if sprite.pooled:
+            return
+        sprite.pooled = True
+        self.in_use -= 1
+        if len(self.free) < self.max_size:
+            self.free.append(sprite)
+
+    """Construct sprites ahead of time so the first frames of play do not allocate."""
+    def prefill(self, count, *args):
+        sprites = [self.acquire(*args) for _ in range(count)]
+        for sprite in sprites:
+            self.release(sprite)
+
+    """Drop the released sprites; sprites still in use keep counting until they are killed."""
+    def clear(self):
+        self.free.clear()
+
+    def stats(self):
+        return {
+            "free": len(self.free),
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
@@ -0,0 +1,75 @@
+from array import array
+import time
+
+"""Per-phase frame timings kept in fixed-size ring buffers.
+
+Call begin() at the start of a frame, mark(phase) after each phase and
+end() once the frame is done. mark charges the time since the previous mark
+to the phase, adding to it if the phase runs more than once in a frame (one
+simulation step per fixed timestep). Each phase keeps the last `size`
+frames in an array of nanoseconds, so recording costs a clock read and an
+addition and nothing is allocated while the game runs.
+"""
+class FrameProfiler:
+    def __init__(self, phases, size=240):
+        self.phases = tuple(phases)
+        self.size = size
+        self.samples = {phase: array("q", [0]) * size for phase in self.phases}
+        self.totals = array("q", [0]) * size
+        self.index = 0
+        self.count = 0
+        self.start = self.last = time.perf_counter_ns()
+
+    def begin(self):
+        index = self.index
+        for samples in self.samples.values():
+            samples[index] = 0
+        self.start = self.last = time.perf_counter_ns()
+
+    """Charge the time since the previous mark to a phase of the current frame."""
+    def mark(self, phase):
+        now = time.perf_counter_ns()
+        self.samples[phase][self.index] += now - self.last
+        self.last = now
+
+    def end(self):
+        self.totals[self.index] = time.perf_counter_ns() - self.start
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    """Return the recorded frames of a phase (or frame totals) in nanoseconds, oldest first."""
+    def history(self, phase=None):
+        samples = self.totals if phase is None else self.samples[phase]
+        if self.count < self.size:
+            return samples[:self.count]
+        return samples[self.index:] + samples[:self.index]
+
+    """Return the time of a phase (or whole frame) in the last finished frame, in milliseconds."""
+    def last_ms(self, phase=None):
+        if not self.count:
+            return 0
+        samples = self.totals if phase is None else self.samples[phase]
+        return samples[self.index - 1] / 1e6
+
+    """Return the average time of a phase (or whole frame) over the recorded frames, in milliseconds."""
+    def average_ms(self, phase=None):
+        history = self.history(phase)
+        return sum(history) / len(history) / 1e6 if history else 0
+
+
+"""Named counts for the current frame, e.g. collision tests or culled sprites.
+
+Call sites add to it like a dict (counters["hits"] += 1). begin_frame()
+copies the counts into last_frame, for overlays and benchmarks, and starts
+the next frame from zero.
+"""
+class FrameCounters(dict):
+    def __init__(self, *names):
+        super().__init__(dict.fromkeys(names, 0))
+        self.last_frame = dict(self)
+
+    """Close the current frame's counts and start counting the next one."""
+    def begin_frame(self):
+        self.last_frame.update(self)
+        for key in self:
+            self[key] = 0
@@ -1,45 +1,68 @@
 from pathlib import Path
 import pygame
 from . import globals
+from . import assets
+from .rotation import RotationCache
+from .pool import Pool
 
 """Load asset file paths at import"""
 sprite_path = Path("assets", "art", "projectiles", "laserBullet.png")
 upgrade_path = Path("assets", "art", "projectiles", "laserBulletUp.png")
+SPRITE_SCALING = 0.4
+
+"""Rotated images and masks shared by all projectiles, one per whole degree of heading."""
+ROTATION_CACHE = RotationCache(1, 16 * 1024 * 1024)
 
 """Class to handle projectiles fired from Player object."""
 class Projectile(pygame.sprite.Sprite):
+    pool = None
+
     """Initialize with sprite properties and initial custom gameplay settings."""
     def __init__(self, pos, heading, upgraded=False):
         super().__init__()
+        self.pos = pygame.math.Vector2()
+        self.vel = pygame.math.Vector2()
+        self.reset(pos, heading, upgraded)
+
+    """Reinitialise in place so a pooled projectile can be fired again."""
+    def reset(self, pos, heading, upgraded=False):
         self.ttl = 2500
-        self.sprite_scaling = 0.4
+        self.sprite_scaling = SPRITE_SCALING
         #Update sprite image for damage boost projectiles
-        if upgraded:
-            self.large_image = pygame.image.load(upgrade_path).convert_alpha()
-        else:
-            self.large_image = pygame.image.load(sprite_path).convert_alpha()
-        self.image = pygame.transform.scale_by(self.large_image, self.sprite_scaling)
+        self.path = upgrade_path if upgraded else sprite_path
+        self.large_image = assets.load_image(self.path)
+        self.image = assets.load_image(self.path, self.sprite_scaling)
         self.start_img = self.image
-        self.mask = pygame.mask.from_surface(self.image)
-        self.pos = pygame.math.Vector2(pos)
+        self.pos.update(pos)
         self.rect = self.image.get_rect(center=self.pos)
         self.speed = globals.PROJECTILE_SPEED
         self.heading = heading
-        self.vel = pygame.math.Vector2.from_polar((self.speed, heading))
+        # Heading never changes after firing, so rotate once up front
+        self.rotate()
+        self.vel.from_polar((self.speed, heading))
         self.time_alive = 0
 
     """Called on every frame, update state and position."""
     def update(self):
-        self.time_alive += globals.CLOCK.get_time()
+        self.time_alive += globals.DT * 1000
         if self.time_alive > self.ttl:
             self.kill()
             return
-        self.rotate()
         self.pos += self.vel * globals.DT
         self.rect.center = self.pos
-        self.mask = pygame.mask.from_surface(self.image)
 
-    """Rotate sprite in the direction of velocity."""
+    """Rotate sprite and mask in the direction of velocity."""
     def rotate(self):
-        self.image = pygame.transform.rotozoom(self.start_img, -self.heading - 90, 1)
+        self.image, self.mask = ROTATION_CACHE.frame(
+            (str(self.path), self.sprite_scaling), self.start_img, -self.heading - 90
+        )
         self.rect = self.image.get_rect(center=self.rect.center)
+
+    """Remove from all groups and hand the sprite back to its pool."""
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+"""Free list of expired projectiles, reused by Player.shoot."""
+PROJECTILE_POOL = Pool(Projectile, globals.PROJECTILE_POOL_SIZE)
@@ -0,0 +1,71 @@
+import pygame
+from . import culling
+
+"""Draws frames by redrawing only the parts of the screen that changed.
+
+Each frame, erase() restores the background under everything drawn in the
+previous frame, draw() blits sprite groups and remembers where they went,
+and present() pushes only the previous and current rects to the display
+with pygame.display.update. When the dirty area grows past `threshold` of
+the screen (or after invalidate(), e.g. when a menu covered the screen) the
+whole background is blitted and the display flipped instead, which is
+cheaper than many overlapping small updates.
+"""
+class DirtyRenderer:
+    def __init__(self, screen, background, threshold=0.4):
+        self.screen = screen
+        self.background = background
+        self.threshold = threshold * screen.get_width() * screen.get_height()
+        self.previous = []
+        self.current = []
+        self.full = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    """Redraw the whole screen next frame."""
+    def invalidate(self):
+        self.full = True
+
+    """Restore the background under everything drawn last frame."""
+    def erase(self):
+        if not self.full and self.area(self.previous) > self.threshold:
+            self.full = True
+        if self.full:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            background = self.background
+            self.screen.blits([(background, rect, rect) for rect in self.previous], False)
+
+    """Draw sprite groups and track the rects they covered, skipping sprites entirely off the screen."""
+    def draw(self, *groups):
+        screen = self.screen
+        bounds = screen.get_rect()
+        culled = 0
+        for group in groups:
+            sprites = group.sprites()
+            blits = [(sprite.image, sprite.rect) for sprite in sprites
+                     if bounds.colliderect(sprite.rect)]
+            culled += len(sprites) - len(blits)
+            self.current += screen.blits(blits)
+        culling.STATS["draws"] += culled
+
+    """Track rects drawn outside of draw(), e.g. by UI.draw."""
+    def add(self, rects):
+        self.current += rects
+
+    """Send this frame's changes to the display and start tracking the next frame."""
+    def present(self):
+        dirty = self.previous + self.current
+        if self.full or self.area(dirty) > self.threshold:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self.previous = self.current
+        self.current = []
+        self.full = False
+
+    @staticmethod
+    def area(rects):
+        return sum(rect.w * rect.h for rect in rects)
@@ -0,0 +1,253 @@
+import json
+import struct
+import zlib
+
+from . import globals
+
+"""Binary input replays with full-state keyframes.
+
+A replay file holds the seed and timestep of a game, one input record per
+simulation step and a keyframe (a zlib-compressed JSON Engine.snapshot) at the
+start of every wave and every KEYFRAME_INTERVAL steps, followed by an index of
+the keyframes so playback can jump straight to any wave.
+
+Input records are one flag byte, plus zigzag varint deltas of the aim
+position when it moved. A run of identical records is stored as a single
+REPEAT byte and a varint count. Every keyframe starts a fresh record so the
+stream can be decoded from its offset.
+"""
+MAGIC = b"ASTR"
+FOOTER_MAGIC = b"RPLY"
+VERSION = 3
+KEYFRAME_INTERVAL = 1800
+
+HEADER = struct.Struct("<4sBBqdHH")
+INDEX_ENTRY = struct.Struct("<IIQiiBQI")
+FOOTER = struct.Struct("<QI4s")
+
+UP, DOWN, LEFT, RIGHT, FIRE, AIM_MOVED, NO_AIM = (1 << i for i in range(7))
+REPEAT = 0x80
+
+
+def _write_varint(out, value):
+    value = (value << 1) ^ (value >> 63)  # Zigzag so small negative deltas stay short
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, offset):
+    shift = value = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return (value >> 1) ^ -(value & 1), offset
+
+
+"""Encode an Engine.snapshot as JSON, so loading a replay from anywhere can never run code."""
+def encode_state(state):
+    return json.dumps(state, separators=(",", ":")).encode()
+
+
+"""Decode a keyframe written by encode_state into a state Engine.restore accepts.
+
+JSON has no tuples, so the generator state comes back as the nested tuple
+random.setstate requires; everything else restore reads works from lists.
+"""
+def decode_state(data):
+    state = json.loads(data)
+    version, internal, gauss = state["rng"]
+    state["rng"] = (version, tuple(internal), gauss)
+    return state
+
+
+"""Records the inputs of every simulation step of an Engine and writes them on close.
+
+Attach it with engine.recorder = Recorder(path, engine). The Engine then
+passes each step's inputs through record, which quantizes the aim to whole
+pixels and returns what will be replayed, so the live game runs on exactly
+the recorded values.
+"""
+class Recorder:
+    def __init__(self, path, engine, keyframe_interval=KEYFRAME_INTERVAL):
+        self.path = path
+        self.seed = engine.seed
+        self.keyframe_interval = keyframe_interval
+        self.stream = bytearray()
+        self.keyframes = []
+        self.blobs = bytearray()
+        self.frames = 0
+        self.wave = None
+        self.previous = None
+        self.repeats = 0
+        self.aim = (0, 0)
+
+    def record(self, engine, inputs):
+        wave = engine.spawner.wave_number
+        if wave != self.wave or self.frames % self.keyframe_interval == 0:
+            self.keyframe(engine, wave)
+
+        aim = None if inputs.aim is None else (round(inputs.aim[0]), round(inputs.aim[1]))
+        inputs = inputs._replace(
+            up=bool(inputs.up), down=bool(inputs.down), left=bool(inputs.left),
+            right=bool(inputs.right), fire=bool(inputs.fire), aim=aim
+        )
+        if inputs == self.previous:
+            self.repeats += 1
+        else:
+            self.flush()
+            self.encode(inputs)
+            self.previous = inputs
+        self.frames += 1
+        return inputs
+
+    def encode(self, inputs):
+        flags = (
+            UP * inputs.up | DOWN * inputs.down | LEFT * inputs.left
+            | RIGHT * inputs.right | FIRE * inputs.fire
+        )
+        if inputs.aim is None:
+            self.stream.append(flags | NO_AIM)
+            return
+        if inputs.aim == self.aim:
+            self.stream.append(flags)
+            return
+        self.stream.append(flags | AIM_MOVED)
+        _write_varint(self.stream, inputs.aim[0] - self.aim[0])
+        _write_varint(self.stream, inputs.aim[1] - self.aim[1])
+        self.aim = inputs.aim
+
+    def flush(self):
+        if self.repeats:
+            self.stream.append(REPEAT)
+            _write_varint(self.stream, self.repeats)
+            self.repeats = 0
+
+    """Start the next step from a keyframe, e.g. after the engine was reset outside a step."""
+    def restart(self):
+        self.wave = None
+
+    """Store the full engine state so playback can start from this step."""
+    def keyframe(self, engine, wave):
+        self.flush()
+        self.previous = None
+        blob = zlib.compress(encode_state(engine.snapshot()))
+        self.keyframes.append(
+            (self.frames, wave, len(self.stream), self.aim, len(self.blobs), len(blob))
+        )
+        self.blobs += blob
+        self.wave = wave
+
+    def close(self):
+        self.flush()
+        seed = self.seed if self.seed is not None else 0
+        with open(self.path, "wb") as file:
+            file.write(HEADER.pack(
+                MAGIC, VERSION, self.seed is not None, seed, globals.FIXED_DT,
+                globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT
+            ))
+            stream_offset = HEADER.size
+            file.write(self.stream)
+            blob_offset = stream_offset + len(self.stream)
+            file.write(self.blobs)
+            index_offset = blob_offset + len(self.blobs)
+            for frame, wave, offset, aim, blob_start, blob_size in self.keyframes:
+                file.write(INDEX_ENTRY.pack(
+                    frame, wave, stream_offset + offset, aim[0], aim[1], 0,
+                    blob_offset + blob_start, blob_size
+                ))
+            file.write(FOOTER.pack(index_offset, self.frames, FOOTER_MAGIC))
+
+
+"""A replay file loaded for playback."""
+class Replay:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = data = file.read()
+        magic, version, has_seed, seed, self.fixed_dt, width, height = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+        self.seed = seed if has_seed else None
+        self.window_size = (width, height)
+        self.index_offset, self.frames, footer = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        if footer != FOOTER_MAGIC:
+            raise ValueError(f"{path} is truncated")
+        self.stream_end = min(
+            (entry[6] for entry in self.index()), default=self.index_offset
+        )
+
+    """Return the keyframe index as (frame, wave, input offset, aim x, aim y, unused, blob offset, blob size)."""
+    def index(self):
+        count = (len(self.data) - FOOTER.size - self.index_offset) // INDEX_ENTRY.size
+        return [
+            INDEX_ENTRY.unpack_from(self.data, self.index_offset + i * INDEX_ENTRY.size)
+            for i in range(count)
+        ]
+
+    """Return the first keyframe at or after the start of a wave, or the last one before it."""
+    def keyframe_for_wave(self, wave):
+        index = self.index()
+        for entry in index:
+            if entry[1] >= wave:
+                return entry
+        return index[-1]
+
+    def load_state(self, entry):
+        blob = self.data[entry[6]:entry[6] + entry[7]]
+        return decode_state(zlib.decompress(blob))
+
+    """Yield the recorded Inputs of every step from a keyframe, or from the first step."""
+    def inputs(self, entry=None):
+        from .engine import Inputs
+        data = self.data
+        if entry is None:
+            entry = self.index()[0]
+        offset, aim = entry[2], (entry[3], entry[4])
+        frames = self.frames - entry[0]
+        previous = None
+        while frames > 0 and offset < self.stream_end:
+            flags = data[offset]
+            offset += 1
+            if flags == REPEAT:
+                count, offset = _read_varint(data, offset)
+                for _ in range(min(count, frames)):
+                    yield previous
+                frames -= count
+                continue
+            if flags & AIM_MOVED:
+                dx, offset = _read_varint(data, offset)
+                dy, offset = _read_varint(data, offset)
+                aim = (aim[0] + dx, aim[1] + dy)
+            previous = Inputs(
+                up=bool(flags & UP), down=bool(flags & DOWN), left=bool(flags & LEFT),
+                right=bool(flags & RIGHT), fire=bool(flags & FIRE),
+                aim=None if flags & NO_AIM else aim,
+            )
+            yield previous
+            frames -= 1
+
+
+"""Re-simulate a replay on an engine from its first keyframe, or from the start of a wave.
+
+The engine is restored from the keyframe, then stepped with the recorded
+inputs. When the recorded game ended, the game that followed is picked up
+from its keyframe. Returns the number of steps simulated.
+"""
+def play(replay, engine, wave=None):
+    index = replay.index()
+    entry = index[0] if wave is None else replay.keyframe_for_wave(wave)
+    restarts = {e[0]: e for e in index if e[0] > entry[0]}
+    engine.restore(replay.load_state(entry))
+
+    frame = entry[0]
+    ended = False
+    for inputs in replay.inputs(entry):
+        if ended and frame in restarts:
+            engine.restore(replay.load_state(restarts[frame]))
+        ended = engine.step(replay.fixed_dt, inputs) == "GAMEOVER"
+        frame += 1
+    return frame - entry[0]
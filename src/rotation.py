@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import pygame
+
+"""Cache of pre-rendered rotation frames, shared by every sprite drawn from the same source image.
+
+Each frame is an (image, mask) pair, so collision masks are built once per
+frame instead of once per sprite per update. Angles are quantized to a fixed
+step so each source image is rotated at most 360 / step times while it stays
+cached. Frames are evicted in least-recently-used order once the cache
+exceeds its memory cap, so variants that have not been seen recently go
+first while the frames in use on screen stay resident.
+"""
+class RotationCache:
+    def __init__(self, step=3, max_bytes=256 * 1024 * 1024):
+        self.step = step
+        self.frame_count = max(1, round(360 / step))
+        self.max_bytes = max_bytes
+        self.frames = OrderedDict()
+        self.bytes = 0
+        self.renders = 0
+        self.evictions = 0
+
+    """Return the index of the quantized frame closest to an angle in degrees."""
+    def index(self, angle):
+        return round(angle / self.step) % self.frame_count
+
+    """Return the (image, mask) frame of a variant closest to an angle, rendering it on first use."""
+    def frame(self, key, source, angle):
+        i = self.index(angle)
+        frame = self.frames.get((key, i))
+        if frame is None:
+            frame = self.frames[key, i] = self.render(source, i)
+            self.evict()
+        else:
+            self.frames.move_to_end((key, i))
+        return frame
+
+    """Render every frame of a variant up front, e.g. while a loading screen is shown."""
+    def prerender(self, key, source):
+        for i in range(self.frame_count):
+            self.frame(key, source, i * self.step)
+
+    """Rotate the source image to the angle of frame i, build its mask and account for its memory."""
+    def render(self, source, i):
+        image = pygame.transform.rotozoom(source, i * self.step, 1)
+        frame = (image, pygame.mask.from_surface(image))
+        self.bytes += self.frame_bytes(frame)
+        self.renders += 1
+        return frame
+
+    """Drop least-recently-used frames until the cache fits its memory cap."""
+    def evict(self):
+        while self.bytes > self.max_bytes and len(self.frames) > 1:
+            _, frame = self.frames.popitem(last=False)
+            self.bytes -= self.frame_bytes(frame)
+            self.evictions += 1
+
+    def clear(self):
+        self.frames.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "variants": len({key for key, _ in self.frames}),
+            "frames": len(self.frames),
+            "bytes": self.bytes,
+            "renders": self.renders,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def frame_bytes(frame):
+        image, _ = frame
+        width, height = image.get_size()
+        return width * height * image.get_bytesize() + width * height // 8
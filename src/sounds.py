@@ -0,0 +1,52 @@
+import pygame
+
+"""Process-wide bank of decoded sound effects, keyed by file path.
+
+Each file is decoded into a single shared pygame Sound. Volume is applied to
+the channel a sound is played on rather than to the Sound itself, so one
+caller's volume never leaks into another's.
+"""
+SOUNDS = {}
+
+"""Decodes running in the background (see streamer), keyed by path; load_sound uses these instead of decoding again."""
+PENDING = {}
+
+"""Count lookups into the bank and actual file decodes since startup."""
+STATS = {"lookups": 0, "decodes": 0}
+
+
+"""Return the shared Sound for a file, decoding it on first use."""
+def load_sound(path):
+    STATS["lookups"] += 1
+    key = str(path)
+    sound = SOUNDS.get(key)
+    if sound is None:
+        future = PENDING.pop(key, None)
+        if future is not None:
+            sound = SOUNDS[key] = future.result()
+        else:
+            STATS["decodes"] += 1
+            sound = SOUNDS[key] = pygame.mixer.Sound(path)
+    return sound
+
+
+"""Play a shared Sound at the given volume and return the channel it landed on."""
+def play(sound, volume=1.0):
+    channel = sound.play()
+    # Channel.play resets the channel volume, so set it after playback starts
+    if channel is not None:
+        channel.set_volume(volume)
+    return channel
+
+
+"""Decode a batch of sound files ahead of time, e.g. before the game loop starts."""
+def preload(paths):
+    for path in paths:
+        load_sound(path)
+
+
+def clear():
+    SOUNDS.clear()
+    PENDING.clear()
+    for key in STATS:
+        STATS[key] = 0
@@ -0,0 +1,103 @@
+from collections import deque
+import time
+
+"""Asteroid and pickup spawns spread over several frames under a time budget.
+
+post() queues a spawn function with its arguments; drain() then runs
+queued spawns oldest first until budget_us microseconds have been spent in
+the rendered frame, so a burst of kills splits into fragments over a few
+frames instead of constructing every sprite at once. The budget is shared
+by every simulation step of a frame: call begin_frame() once per rendered
+frame, and once a catch-up frame has spent it, drains in its later steps
+run nothing. The first drain of a frame runs at least one spawn, so the
+queue always makes progress. A spawn that waited is caught up
+by calling advance(seconds) on the sprite it returns (if it has one), so a
+fragment appears where it would have been had it spawned on time. The
+queue's clock counts simulated time: call tick(dt) once per step, after the
+step's spawns have been drained and before anything new is placed.
+
+With budget_us set to None there is no queue: post() runs the spawn at once
+and returns its sprite, exactly as a direct call would. Deterministic runs
+(seeded, headless, recorded or replayed) use that mode, since how much fits
+in a frame depends on the machine.
+"""
+class SpawnQueue:
+    def __init__(self, budget_us=None):
+        self.budget_us = budget_us
+        self.pending = deque()
+        self.time = 0
+        self.spawned = 0
+        self.deferred = 0
+        self.peak = 0
+        # Nanoseconds spent draining since begin_frame, and whether a drain ran in that frame
+        self.spent_ns = 0
+        self.drained = False
+
+    """Run a spawn now (no budget) and return its sprite, or queue it for the next drain and return None."""
+    def post(self, spawn, *args):
+        if self.budget_us is None:
+            self.spawned += 1
+            return spawn(*args)
+        self.pending.append((self.time, spawn, args))
+        self.peak = max(self.peak, len(self.pending))
+        return None
+
+    """Advance the queue clock by one simulation step of dt seconds."""
+    def tick(self, dt):
+        self.time += dt
+
+    """Start a rendered frame with the whole budget, however many steps it runs."""
+    def begin_frame(self):
+        self.spent_ns = 0
+        self.drained = False
+
+    """Run queued spawns, oldest first, until the frame budget is spent; return how many ran."""
+    def drain(self):
+        if not self.pending:
+            return 0
+        deadline = None
+        if self.budget_us is not None:
+            start = time.perf_counter_ns()
+            remaining = self.budget_us * 1000 - self.spent_ns
+            if remaining <= 0 and self.drained:
+                return 0
+            deadline = start + remaining
+        ran = 0
+        while self.pending:
+            posted, spawn, args = self.pending.popleft()
+            sprite = spawn(*args)
+            elapsed = self.time - posted
+            if elapsed > 0 and hasattr(sprite, "advance"):
+                sprite.advance(elapsed)
+                self.deferred += 1
+            ran += 1
+            if deadline is not None and time.perf_counter_ns() >= deadline:
+                break
+        if deadline is not None:
+            self.spent_ns += time.perf_counter_ns() - start
+            self.drained = True
+        self.spawned += ran
+        return ran
+
+    """Run every queued spawn regardless of the budget."""
+    def flush(self):
+        budget, self.budget_us = self.budget_us, None
+        try:
+            self.drain()
+        finally:
+            self.budget_us = budget
+
+    """Drop queued spawns, e.g. when a new game starts."""
+    def clear(self):
+        self.pending.clear()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def stats(self):
+        return {
+            "pending": len(self.pending),
+            "peak": self.peak,
+            "spawned": self.spawned,
+            "deferred": self.deferred,
+        }
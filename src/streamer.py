@@ -0,0 +1,73 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pygame
+from . import assets
+from . import sounds
+
+"""Posted from a worker thread whenever a background decode finishes, to wake an idle event wait."""
+ASSET_LOADED = pygame.event.custom_type()
+
+"""Decodes images and sounds on a thread pool while the game shows its menu.
+
+stream() submits files in priority order; pygame's image and sound loaders
+release the GIL, so the decodes run in parallel. The futures are registered
+with the assets and sounds modules, so a load_image or load_sound call for a
+file still in flight waits for that decode instead of starting another one.
+pump() finishes completed images on the main thread, where convert_alpha()
+must run, in the order they were requested.
+"""
+class AssetStreamer:
+    def __init__(self, workers=4):
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="assets")
+        self.images = deque()
+
+    """Start decoding (path, scale) image entries and sound paths, most urgent first."""
+    def stream(self, images, sound_paths=()):
+        for path, scale in images:
+            self.images.append((path, scale))
+            # Sprites packed into an atlas are served from the atlas file
+            key = Path(path).as_posix()
+            region = assets.REGIONS.get(key)
+            source = region[0] if region is not None else path
+            key = Path(source).as_posix()
+            if key in assets.PENDING or assets.image_key(source) in assets.IMAGES:
+                continue
+            if assets.DECODED is not None and assets.DECODED.contains(source):
+                continue
+            assets.PENDING[key] = self.submit(pygame.image.load, source)
+        for path in sound_paths:
+            if str(path) not in sounds.SOUNDS:
+                sounds.PENDING[str(path)] = self.submit(pygame.mixer.Sound, path)
+
+    def submit(self, load, path):
+        future = self.executor.submit(load, path)
+        future.add_done_callback(lambda _: pygame.event.post(pygame.event.Event(ASSET_LOADED)))
+        return future
+
+    """Finish every image whose decode is done, stopping at the first one still in flight."""
+    def pump(self):
+        while self.images:
+            path, scale = self.images[0]
+            region = assets.REGIONS.get(Path(path).as_posix())
+            source = region[0] if region is not None else path
+            future = assets.PENDING.get(Path(source).as_posix())
+            if future is not None and not future.done():
+                break
+            assets.load_image(path, scale)
+            self.images.popleft()
+        for path, future in list(sounds.PENDING.items()):
+            if future.done():
+                sounds.load_sound(path)
+
+    @property
+    def done(self):
+        return not self.images and not sounds.PENDING
+
+    """Drop decodes that have not started and wait for running ones, so pygame can be shut down after."""
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for pending in (assets.PENDING, sounds.PENDING):
+            for key, future in list(pending.items()):
+                if future.cancelled():
+                    del pending[key]
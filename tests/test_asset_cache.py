@@ -0,0 +1,90 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import assets
+from src import asset_cache
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        assets.clear()
+        self.addCleanup(assets.clear)
+
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.paths = []
+        for i, size in enumerate([(30, 20), (17, 9)]):
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            image.fill((40 * i, 200, 50, 255))
+            image.set_at((1, 1), (255, 0, 0, 128))
+            path = self.directory / f"img{i}.png"
+            pygame.image.save(image, path)
+            self.paths.append(path)
+        self.cache_path = self.directory / "art.cache"
+
+    def tearDown(self):
+        pygame.quit()
+
+    def decoded(self, path):
+        return pygame.image.tobytes(pygame.image.load(path).convert_alpha(), "RGBA")
+
+    def test_cached_images_match_decoded_files(self):
+        """Test that mapped surfaces have the pixels of the decoded PNGs without decoding them"""
+        self.assertEqual(asset_cache.build(self.directory, self.cache_path), 2)
+        self.assertIsNotNone(asset_cache.open_cache(self.cache_path))
+        for path in self.paths:
+            image = assets.load_image(path)
+            self.assertEqual(pygame.image.tobytes(image, "RGBA"), self.decoded(path))
+        self.assertEqual(assets.STATS["mapped"], 2)
+        self.assertEqual(assets.loads(), 0)
+
+    def test_stale_entries_fall_back_to_png(self):
+        """Test that a changed source file is decoded from disk instead of the cache"""
+        asset_cache.build(self.directory, self.cache_path)
+        changed = pygame.Surface((30, 21), pygame.SRCALPHA)
+        changed.fill((1, 2, 3, 255))
+        pygame.image.save(changed, self.paths[0])
+
+        cache = asset_cache.AssetCache(self.cache_path)
+        self.assertIsNone(cache.load(self.paths[0]))
+        self.assertIsNotNone(cache.load(self.paths[1]))
+        self.assertIsNone(cache.load(self.directory / "missing.png"))
+
+    def test_touched_but_identical_files_stay_valid(self):
+        """Test that a new modification time alone does not invalidate an entry"""
+        asset_cache.build(self.directory, self.cache_path)
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        cache = asset_cache.AssetCache(self.cache_path)
+        self.assertIsNotNone(cache.load(self.paths[0]))
+
+    def test_skipped_paths_are_not_cached(self):
+        """Test that the build leaves out the paths it is told to skip"""
+        asset_cache.build(self.directory, self.cache_path, skip={self.paths[1].as_posix()})
+        cache = asset_cache.AssetCache(self.cache_path)
+        self.assertEqual(list(cache.index), [self.paths[0].as_posix()])
+
+    def test_missing_or_corrupt_cache_is_ignored(self):
+        """Test that the game loads normally without a usable cache"""
+        self.assertIsNone(asset_cache.open_cache(self.directory / "missing.cache"))
+        self.cache_path.write_bytes(b"garbage" * 4)
+        self.assertIsNone(asset_cache.open_cache(self.cache_path))
+        self.assertIsNone(assets.DECODED)
+        assets.load_image(self.paths[0])
+        self.assertEqual(assets.loads(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
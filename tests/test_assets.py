@@ -0,0 +1,67 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import assets
+
+
+class TestAssets(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        assets.clear()
+
+        # Mock image loading so we can count decodes
+        self.original_load = pygame.image.load
+        surface = pygame.Surface((50, 40), pygame.SRCALPHA)
+        pygame.image.load = MagicMock(return_value=surface)
+
+    def tearDown(self):
+        pygame.image.load = self.original_load
+        assets.clear()
+        pygame.quit()
+
+    def test_image_is_decoded_once(self):
+        """Test that repeated loads of a path share one decoded surface"""
+        first = assets.load_image(Path("assets", "rock.png"))
+        second = assets.load_image(Path("assets", "rock.png"))
+        self.assertIs(first, second)
+        self.assertEqual(pygame.image.load.call_count, 1)
+        self.assertEqual(assets.STATS, {"hits": 1, "misses": 1, "loads": 1, "mapped": 0, "waits": 0})
+
+    def test_scaled_image_reuses_source_decode(self):
+        """Test that a scaled variant is cached separately without decoding again"""
+        base = assets.load_image("rock.png")
+        scaled = assets.load_image("rock.png", 0.5)
+        self.assertIsNot(base, scaled)
+        self.assertEqual(scaled.get_size(), (25, 20))
+        self.assertIs(assets.load_image("rock.png", 0.5), scaled)
+        self.assertEqual(assets.loads(), 1)
+
+    def test_clear_drops_atlas_regions(self):
+        """Test that clearing the registry does not leave regions of a discarded atlas behind"""
+        assets.register_atlas("atlas.png", {"rock.png": [0, 0, 10, 10]})
+        self.assertEqual(assets.load_image("rock.png").get_size(), (10, 10))
+        assets.clear()
+        self.assertEqual(assets.REGIONS, {})
+        self.assertEqual(assets.load_image("rock.png").get_size(), (50, 40))
+
+    def test_no_loads_after_preload(self):
+        """Test that preloaded entries never touch the disk again"""
+        assets.preload([("ship.png", 1), ("shot.png", 0.4)])
+        mark = assets.loads()
+        assets.load_image("ship.png")
+        assets.load_image("shot.png", 0.4)
+        self.assertEqual(assets.loads(), mark)
+
+
+if __name__ == '__main__':
+    unittest.main()
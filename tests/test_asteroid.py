@@ -9,8 +9,12 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 # Now you can import from src
-from src.Asteroid import Asteroid, AsteroidManager
+from src.Asteroid import Asteroid, AsteroidManager, ROTATION_CACHE
 from src import globals
+from src import collision
+from src import culling
+from src import assets
+from src import sounds
 
 class TestAsteroid(unittest.TestCase):
     def setUp(self):
@@ -26,6 +30,9 @@ class TestAsteroid(unittest.TestCase):
         globals.ASTEROID_SPRITES = pygame.sprite.Group()
         globals.PROJECTILE_SPRITES = pygame.sprite.Group()
         globals.PROJECTILE_DAMAGE = 10
+        ROTATION_CACHE.clear()
+        assets.clear()
+        sounds.clear()
 
         # Create a test surface
         self.screen = pygame.Surface((globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
@@ -89,6 +96,41 @@ class TestAsteroid(unittest.TestCase):
         # Rotation should have changed
         self.assertNotEqual(asteroid.rotation, initial_rotation)
 
+    def test_asteroid_mask_follows_rotation_frame(self):
+        """Test that asteroids carry a cached mask matching their current image"""
+        asteroid = Asteroid((400, 300), 2)
+        self.assertEqual(asteroid.mask.get_size(), asteroid.image.get_size())
+        asteroid.rotation_speed = 45
+        asteroid.update()
+        frame = ROTATION_CACHE.frame(asteroid.sprite_path, asteroid.start_img, 45)
+        self.assertIs(asteroid.image, frame[0])
+        self.assertIs(asteroid.mask, frame[1])
+
+    def test_asteroid_out_of_view_keeps_frame(self):
+        """Test that asteroids outside the view move and turn but skip their rotation frame"""
+        self.addCleanup(culling.VIEW.update, culling.VIEW.copy())
+        culling.set_view(800, 600)
+        culling.begin_frame()
+        asteroid = Asteroid((-90, 300), 2)
+        asteroid.vel.update(60, 0)
+        asteroid.rotation_speed = 45
+        image = asteroid.image
+        asteroid.update()
+        self.assertIs(asteroid.image, image)
+        self.assertEqual(asteroid.rotation, 45)
+        self.assertAlmostEqual(asteroid.pos.x, -90 + 60 * globals.DT)
+        self.assertEqual(culling.STATS["updates"], 1)
+
+        # Back in view it picks up the frame of its current angle
+        asteroid.pos.x = 10
+        asteroid.rect.center = asteroid.pos
+        asteroid.update()
+        frame = ROTATION_CACHE.frame(asteroid.sprite_path, asteroid.start_img, 90)
+        self.assertIs(asteroid.image, frame[0])
+        self.assertEqual(culling.STATS["updates"], 1)
+        culling.begin_frame()
+        self.assertEqual(culling.LAST_FRAME["updates"], 1)
+
     def test_asteroid_take_damage(self):
         """Test that asteroid takes damage correctly"""
         asteroid = Asteroid((400, 300), 2)
@@ -171,6 +213,40 @@ class TestAsteroid(unittest.TestCase):
         self.assertEqual(manager.wave_number, 1)
         self.assertEqual(manager.spawn_rate, 1.0)
 
+    def test_projectile_damages_one_of_overlapping_asteroids(self):
+        """Test that a shot overlapping two asteroids only damages the first of them"""
+        manager = AsteroidManager()
+        first = Asteroid((400, 300), 2)
+        second = Asteroid((410, 300), 2)
+        globals.ASTEROID_SPRITES.add(first, second)
+        shot = pygame.sprite.Sprite()
+        shot.rect = pygame.Rect(400, 295, 10, 10)
+        globals.PROJECTILE_SPRITES.add(shot)
+
+        collision.rebuild_grids()
+        with patch('src.collision.collide', lambda a, b: a.rect.colliderect(b.rect)):
+            manager.handle_collision()
+
+        self.assertEqual((first.health, second.health), (10, 20))
+        self.assertFalse(shot.alive())
+
+    def test_projectile_skips_asteroid_destroyed_since_grid_build(self):
+        """Test that an asteroid killed after the grid was built, e.g. by the shield, cannot be hit"""
+        manager = AsteroidManager()
+        asteroid = Asteroid((400, 300), 2)
+        globals.ASTEROID_SPRITES.add(asteroid)
+        shot = pygame.sprite.Sprite()
+        shot.rect = pygame.Rect(400, 295, 10, 10)
+        globals.PROJECTILE_SPRITES.add(shot)
+
+        collision.rebuild_grids()
+        asteroid.kill()
+        with patch('src.collision.collide', lambda a, b: a.rect.colliderect(b.rect)):
+            points, _ = manager.handle_collision()
+
+        self.assertEqual(points, 0)
+        self.assertTrue(shot.alive())
+
     def test_asteroid_manager_spawn_asteroid(self):
         """Test that AsteroidManager spawns asteroids correctly"""
         manager = AsteroidManager()
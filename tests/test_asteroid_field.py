@@ -0,0 +1,139 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.asteroid_field import AsteroidField, AsteroidView, np
+from src.Asteroid import AsteroidManager, ROTATION_CACHE
+from src import globals
+from src import culling
+from src import assets
+from src import sounds
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestAsteroidField(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+        # Mock globals
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        globals.DT = 0.016  # 60 FPS
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        ROTATION_CACHE.clear()
+        assets.clear()
+        sounds.clear()
+
+        # Mock image loading and sound
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_spawn_creates_view(self):
+        """Test that spawning fills a slot and returns a sprite view of it"""
+        field = AsteroidField(capacity=4)
+        view = field.spawn((400, 300), 2)
+        self.assertIsInstance(view, AsteroidView)
+        self.assertEqual(len(field), 1)
+        self.assertEqual(view.pos, pygame.math.Vector2(400, 300))
+        self.assertEqual(view.size, 2)
+        self.assertEqual(view.health, 20)
+        self.assertEqual(view.points, 20)
+        self.assertEqual(view.rect.center, (400, 300))
+
+    def test_step_moves_and_wraps_all_asteroids(self):
+        """Test that one step integrates every asteroid and wraps those past the margin"""
+        field = AsteroidField(capacity=4)
+        moving = field.spawn((400, 300), 2)
+        leaving = field.spawn((-99, 300), 2)
+        field.vel[moving.index] = (100, 0)
+        field.vel[leaving.index] = (-100, 0)
+        field.step(0.1)
+        self.assertAlmostEqual(moving.pos.x, 410)
+        self.assertEqual(leaving.pos.x, globals.WINDOW_WIDTH + 100)
+        self.assertEqual(moving.rect.center, (410, 300))
+
+    def test_views_out_of_view_keep_frame(self):
+        """Test that only asteroids inside the view get a new rotation frame"""
+        self.addCleanup(culling.VIEW.update, culling.VIEW.copy())
+        culling.set_view(800, 600)
+        culling.begin_frame()
+        field = AsteroidField(capacity=4)
+        inside = field.spawn((400, 300), 2)
+        outside = field.spawn((-90, 300), 2)
+        images = inside.image, outside.image
+        field.rotation_speed[:2] = 45
+        field.step(0.1)
+        self.assertIsNot(inside.image, images[0])
+        self.assertIs(outside.image, images[1])
+        self.assertEqual(culling.STATS["updates"], 1)
+
+    def test_spawn_out_of_view_keeps_rect_on_asteroid(self):
+        """Test that asteroids spawned out of view, also into reused slots, are drawn where they are"""
+        self.addCleanup(culling.VIEW.update, culling.VIEW.copy())
+        culling.set_view(800, 600)
+        field = AsteroidField(capacity=4)
+        field.spawn((400, 300), 3).kill()
+        outside = field.spawn((-60, 300), 3)
+        field.step(0.1)
+        # Integer rects put the centre within a pixel of the position
+        self.assertAlmostEqual(outside.rect.centerx, outside.pos.x, delta=1.5)
+        self.assertAlmostEqual(outside.rect.centery, outside.pos.y, delta=1.5)
+
+    def test_capacity_grows_and_slots_are_reused(self):
+        """Test that the arrays grow when full and killed slots are reused"""
+        field = AsteroidField(capacity=1)
+        first = field.spawn((0, 0), 1)
+        second = field.spawn((10, 10), 1)
+        self.assertEqual(field.capacity, 2)
+        index = first.index
+        first.kill()
+        self.assertEqual(len(field), 1)
+        third = field.spawn((20, 20), 1)
+        self.assertEqual(third.index, index)
+        self.assertTrue(field.alive[second.index])
+
+    def test_split_and_damage(self):
+        """Test that views take damage and split into the same field"""
+        field = AsteroidField(capacity=4)
+        view = field.spawn((400, 300), 2)
+        self.assertFalse(view.take_damage(10))
+        self.assertTrue(view.take_damage(10))
+        fragments = view.split()
+        self.assertEqual([f.size for f in fragments], [1, 1])
+        self.assertEqual(len(field), 3)
+
+    def test_manager_uses_field_backend(self):
+        """Test that AsteroidManager spawns into and steps the field when given one"""
+        field = AsteroidField(capacity=4)
+        manager = AsteroidManager(field)
+        manager.start_game()
+        asteroid = manager.spawn_asteroid((400, 300), 1)
+        self.assertIsInstance(asteroid, AsteroidView)
+        self.assertIn(asteroid, globals.ASTEROID_SPRITES)
+        before = asteroid.pos
+        manager.update()
+        self.assertNotEqual(asteroid.pos, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import shutil
+import tempfile
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import assets
+from src import atlas
+
+
+class TestAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        assets.clear()
+        self.addCleanup(assets.clear)
+
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.paths = []
+        for i, size in enumerate([(30, 20), (30, 20), (16, 16), (40, 10)]):
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            image.fill((10 * i, 200, 50, 255))
+            image.set_at((1, 1), (255, 0, 0, 128))
+            path = self.directory / f"img{i}.png"
+            pygame.image.save(image, path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_layout_does_not_overlap(self):
+        """Test that packed rectangles stay inside the atlas and never overlap"""
+        sizes = {f"img{i}": (30 + i % 3 * 10, 20 + i % 4 * 5) for i in range(40)}
+        (width, height), frames = atlas.layout(sizes, max_width=128)
+        self.assertLessEqual(width, 128)
+        rects = [pygame.Rect(rect) for rect in frames.values()]
+        for i, rect in enumerate(rects):
+            self.assertTrue(pygame.Rect(0, 0, width, height).contains(rect))
+            self.assertEqual(rect.collidelist(rects[i + 1:]), -1)
+
+    def test_atlas_serves_original_images(self):
+        """Test that images loaded through an atlas match their source files and decode once"""
+        originals = [pygame.image.tobytes(pygame.image.load(path), "RGBA") for path in self.paths]
+        atlas.build({"test": self.paths}, self.directory / "atlas")
+        self.assertEqual(atlas.load_manifests(self.directory / "atlas"), 1)
+
+        for path, original in zip(self.paths, originals):
+            image = assets.load_image(path)
+            self.assertIsNotNone(image.get_parent())
+            self.assertEqual(pygame.image.tobytes(image, "RGBA"), original)
+        self.assertEqual(assets.loads(), 1)
+
+        # Scaled variants are still derived from the atlas view
+        self.assertEqual(assets.load_image(self.paths[0], 0.5).get_size(), (15, 10))
+        self.assertEqual(assets.loads(), 1)
+
+    def test_missing_atlases_fall_back_to_files(self):
+        """Test that without manifests every image is loaded from its own file"""
+        self.assertEqual(atlas.load_manifests(self.directory / "missing"), 0)
+        for path in self.paths:
+            self.assertIsNone(assets.load_image(path).get_parent())
+        self.assertEqual(assets.loads(), len(self.paths))
+
+
+if __name__ == '__main__':
+    unittest.main()
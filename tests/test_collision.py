@@ -0,0 +1,97 @@
+import unittest
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import collision
+from src.collision import SpatialHash
+
+
+def make_sprite(center, size=20):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((size, size), pygame.SRCALPHA)
+    sprite.image.fill((255, 255, 255, 255))
+    sprite.rect = sprite.image.get_rect(center=center)
+    sprite.mask = pygame.mask.from_surface(sprite.image)
+    return sprite
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        collision.begin_frame()
+
+    def test_query_returns_only_nearby_sprites(self):
+        """Test that a query only returns sprites in overlapping cells"""
+        near = make_sprite((100, 100))
+        far = make_sprite((700, 500))
+        grid = SpatialHash(cell_size=64)
+        grid.rebuild([near, far])
+        self.assertEqual(grid.query(pygame.Rect(90, 90, 10, 10)), [near])
+
+    def test_sprite_spanning_cells_is_returned_once(self):
+        """Test that a sprite overlapping several cells is not duplicated"""
+        sprite = make_sprite((64, 64), size=40)
+        grid = SpatialHash(cell_size=64)
+        grid.rebuild([sprite])
+        self.assertEqual(len(grid.keys(sprite.rect)), 4)
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 128, 128)), [sprite])
+
+    def test_cell_size_follows_largest_sprite(self):
+        """Test that an unsized grid uses the largest sprite dimension as cell size"""
+        grid = SpatialHash()
+        grid.rebuild([make_sprite((0, 0), 20), make_sprite((300, 300), 90)])
+        self.assertEqual(grid.cell_size, 90)
+
+    def test_collide_counts_narrow_phase_tests(self):
+        """Test that only rect-overlapping pairs reach the mask test"""
+        a = make_sprite((100, 100))
+        b = make_sprite((105, 105))
+        c = make_sprite((200, 200))
+        self.assertTrue(collision.collide(a, b))
+        self.assertFalse(collision.collide(a, c))
+        self.assertEqual(collision.STATS, {"candidates": 2, "narrow": 1, "hits": 1})
+        collision.begin_frame()
+        self.assertEqual(collision.LAST_FRAME["narrow"], 1)
+        self.assertEqual(collision.STATS["narrow"], 0)
+
+    def test_radius_rejects_transparent_corners(self):
+        """Test that a sprite's covering radius skips mask tests its rect alone would run"""
+        rock = make_sprite((100, 100), size=60)
+        rock.image.fill((0, 0, 0, 0))
+        pygame.draw.circle(rock.image, (255, 255, 255), (30, 30), 30)
+        rock.mask = pygame.mask.from_surface(rock.image)
+        rock.radius = 30
+        corner = make_sprite((72, 72), size=4)
+        edge = make_sprite((100, 72), size=4)
+        self.assertFalse(collision.collide(corner, rock))
+        self.assertEqual(collision.STATS["narrow"], 0)
+        self.assertTrue(collision.collide(edge, rock))
+        self.assertTrue(collision.collide(rock, edge))
+        self.assertEqual(collision.STATS["narrow"], 2)
+
+    def test_grid_reduces_narrow_phase_tests(self):
+        """Test that a broadphase query avoids testing distant sprites"""
+        rocks = [make_sprite((x * 40 + 20, y * 40 + 20)) for x in range(20) for y in range(10)]
+        shot = make_sprite((20, 20), size=4)
+        grid = SpatialHash()
+        grid.rebuild(rocks)
+        hits = pygame.sprite.spritecollide(shot, grid.query(shot.rect), False, collision.collide)
+        self.assertEqual(hits, [rocks[0]])
+        self.assertLess(collision.STATS["candidates"], len(rocks) // 10)
+
+    def test_query_keeps_insertion_order_across_cells(self):
+        """Test that sprites found in several cells come back in the order they were added"""
+        first = make_sprite((100, 100))
+        second = make_sprite((30, 30))
+        grid = SpatialHash(cell_size=64)
+        grid.rebuild([first, second])
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 128, 128)), [first, second])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.context import GameContext
+from src.engine import Engine, Inputs
+from src.env import AsteroidsEnv, VectorEnv, MAX_ASTEROIDS, np
+from src import globals
+from src import assets
+from src import sounds
+
+
+class TestGameContext(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        assets.clear()
+        sounds.clear()
+
+        # Mock image loading and sound
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_games_do_not_share_state(self):
+        """Test that two games in separate contexts keep their own sprites and score"""
+        outside = globals.ASTEROID_SPRITES
+        first, second = GameContext(1), GameContext(2)
+        with first.active():
+            engine = Engine(seed=1)
+            for _ in range(120):
+                engine.step(1 / 60, Inputs())
+            globals.SCORE = 50
+            asteroids = len(globals.ASTEROID_SPRITES)
+        with second.active():
+            self.assertEqual(globals.SCORE, 0)
+            self.assertEqual(len(globals.ASTEROID_SPRITES), 0)
+        self.assertIs(globals.ASTEROID_SPRITES, outside)
+        self.assertEqual(first.values["SCORE"], 50)
+        self.assertEqual(len(first.values["ASTEROID_SPRITES"]), asteroids)
+        self.assertGreater(asteroids, 0)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestAsteroidsEnv(TestGameContext):
+    def test_reset_and_step(self):
+        """Test that an environment returns fixed-shape observations and rewards"""
+        env = AsteroidsEnv(seed=3, raster=(18, 32))
+        obs, info = env.reset()
+        self.assertEqual(obs["asteroids"].shape, (MAX_ASTEROIDS, 7))
+        self.assertEqual(obs["raster"].shape, (18, 32))
+        self.assertEqual(obs["player"][0], 1)
+        self.assertEqual(info["lives"], 3)
+
+        for _ in range(60):
+            obs, reward, terminated, truncated, info = env.step((1, 1, 4))
+        self.assertEqual(info["frame"], 240)
+        self.assertGreater(obs["asteroids"][:, 0].sum(), 0)
+        self.assertGreater(obs["raster"].max(), 0)
+        self.assertFalse(truncated)
+
+    def test_same_seed_same_game(self):
+        """Test that interleaved environments with the same seed play identical games"""
+        first, second = AsteroidsEnv(seed=5), AsteroidsEnv(seed=5)
+        first.reset(seed=9)
+        second.reset(seed=9)
+        for i in range(50):
+            a = first.step((i % 5, 1, i % 16))[0]
+            b = second.step((i % 5, 1, i % 16))[0]
+        for name in a:
+            np.testing.assert_array_equal(a[name], b[name])
+
+    def test_truncates_after_max_steps(self):
+        """Test that an episode is cut off after max_steps actions"""
+        env = AsteroidsEnv(seed=1, max_steps=3)
+        env.reset()
+        self.assertEqual([env.step((0, 0, 0))[3] for _ in range(3)], [False, False, True])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorEnv(unittest.TestCase):
+    def run_games(self, processes):
+        """Play three seeded games split across the given number of worker processes"""
+        actions = [(1, 1, 3), (4, 0, 8), (0, 1, 12)]
+        with VectorEnv(3, seed=2, processes=processes) as env:
+            env.reset(seed=2)
+            for _ in range(20):
+                obs, rewards, terminated, truncated, infos = env.step(actions)
+        return obs, infos
+
+    def test_vector_env_is_independent_of_process_count(self):
+        """Test that games give the same observations whether or not they share a process"""
+        split, infos = self.run_games(processes=3)
+        shared, _ = self.run_games(processes=1)
+        self.assertEqual(split["player"].shape, (3, 10))
+        self.assertEqual(infos[1]["frame"], 80)
+        for name in split:
+            np.testing.assert_array_equal(split[name], shared[name])
+        # Different seeds give different games
+        self.assertFalse(np.array_equal(split["asteroids"][0], split["asteroids"][1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+import random
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.governor import SpawnGovernor, QualityGovernor, QUALITY, QUALITY_LEVELS
+from src.Asteroid import Asteroid, AsteroidManager, ROTATION_CACHE
+from src import globals
+from src import collision
+from src import culling
+from src import assets
+from src import sounds
+
+class GovernorTestCase(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        globals.DT = globals.FIXED_DT
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        ROTATION_CACHE.clear()
+        assets.clear()
+        sounds.clear()
+
+        patcher = patch('pygame.image.load')
+        mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+
+class TestSpawnGovernor(GovernorTestCase):
+    def test_throttle_follows_frame_time(self):
+        """Test that slow frames throttle spawning and fast frames undo it"""
+        governor = SpawnGovernor(80, 160, budget_ms=10, window=4)
+        with self.assertLogs("src.governor", "INFO") as logs:
+            for _ in range(3):
+                governor.frame(30)
+            self.assertEqual(governor.throttle, 1)
+            governor.frame(30)
+            self.assertEqual(governor.throttle, 0.75)
+            for _ in range(40):
+                governor.frame(30)
+            self.assertEqual(governor.throttle, 0.25)
+            self.assertEqual(governor.spawn_rate(2.0), 0.5)
+            self.assertEqual(governor.speed, 2)
+            self.assertGreater(governor.size_weights([0.3, 0.6, 0.1])[0], 0.3)
+            for _ in range(40):
+                governor.frame(2)
+        self.assertEqual(governor.throttle, 1)
+        self.assertIn("spawn rate x1.00 -> x0.75", logs.output[0])
+
+    def test_caps_count_and_mass(self):
+        """Test that spawns are held at the count or mass cap and logged once per change"""
+        governor = SpawnGovernor(3, 8, budget_ms=10)
+        rock = lambda size: MagicMock(size=size)
+        with self.assertLogs("src.governor", "INFO") as logs:
+            self.assertTrue(governor.admit([rock(3)], 3))
+            self.assertFalse(governor.admit([rock(3), rock(3)], 1))
+            self.assertFalse(governor.admit([rock(3), rock(3)], 2))
+            self.assertEqual(governor.capped, "mass")
+            self.assertFalse(governor.admit([rock(1)] * 3, 1))
+            self.assertEqual(governor.capped, "count")
+            self.assertTrue(governor.admit([rock(1)], 1))
+        self.assertEqual(governor.refused, 3)
+        self.assertEqual(len(logs.output), 3)
+
+    def test_wave_stops_at_cap(self):
+        """Test that a running wave never spawns past the asteroid cap"""
+        globals.RNG = random.Random(1)
+        manager = AsteroidManager()
+        manager.governor.max_count = 5
+        manager.start_game()
+        manager.spawn_rate = 30
+        with self.assertLogs("src.governor", "INFO"):
+            for _ in range(120):
+                manager.update()
+        self.assertEqual(len(globals.ASTEROID_SPRITES), 5)
+        self.assertGreater(manager.governor.refused, 0)
+
+    def test_throttled_spawns_are_faster(self):
+        """Test that a throttled governor speeds up the asteroids it lets through"""
+        speeds = []
+        for throttle in (1.0, 0.25):
+            globals.RNG = random.Random(4)
+            manager = AsteroidManager()
+            manager.governor.throttle = throttle
+            with patch.object(manager.governor, "size_weights", return_value=[0.3, 0.6, 0.1]):
+                speeds.append(manager.spawn_wave_asteroid().vel.length())
+        self.assertAlmostEqual(speeds[1], speeds[0] * 2)
+
+
+class TestQualityGovernor(GovernorTestCase):
+    def setUp(self):
+        super().setUp()
+        QUALITY.reset()
+        self.addCleanup(QUALITY.reset)
+
+    def test_steps_down_and_back_up(self):
+        """Test that quality drops one level per slow window, recovers and keeps its history"""
+        governor = QualityGovernor(budget_ms=10, window=5)
+        with self.assertLogs("src.governor", "INFO") as logs:
+            for _ in range(5 * 10):
+                governor.frame(25)
+            self.assertEqual(governor.level, len(QUALITY_LEVELS) - 1)
+            self.assertEqual(governor.max_sounds, 2)
+            for _ in range(5 * 10):
+                governor.frame(5)
+        self.assertEqual(governor.level, 0)
+        self.assertEqual(governor.name, "full")
+        self.assertEqual(len(governor.history), 2 * (len(QUALITY_LEVELS) - 1))
+        _, frames, old, new, average = governor.history[0]
+        self.assertEqual((frames, old, new, average), (5, 0, 1, 25))
+        self.assertIn("quality full -> coarse rotation", logs.output[0])
+
+    def test_coarse_rotation(self):
+        """Test that reduced quality only fetches frames on the coarser angles"""
+        QUALITY.set_level(1)
+        asteroid = Asteroid((400, 300), 3)
+        asteroid.rotation_speed = 1
+        coarse = ROTATION_CACHE.step * 2
+        images = set()
+        for _ in range(12):
+            asteroid.update()
+            self.assertEqual(asteroid.frame_angle % coarse, 0)
+            images.add(asteroid.frame_angle)
+        self.assertEqual(len(images), 3)
+
+    def test_small_asteroids_stop_turning(self):
+        """Test that small asteroids keep their frame from the still small rocks level on"""
+        QUALITY.set_level(2)
+        small = Asteroid((400, 300), 1)
+        small.rotation_speed = 1
+        image = small.image
+        for _ in range(10):
+            small.update()
+        self.assertIs(small.image, image)
+        self.assertEqual(small.rotation, 10)
+
+    def test_fewer_sounds(self):
+        """Test that a pass with many kills plays only a few explosions"""
+        QUALITY.set_level(3)
+        manager = AsteroidManager()
+        rocks = [Asteroid((100 * i, 300), 1) for i in range(1, 6)]
+        for rock in rocks:
+            rock.health = 0
+        globals.ASTEROID_SPRITES.add(rocks)
+        projectiles = [MagicMock(rect=rock.rect.copy()) for rock in rocks]
+        collision.rebuild_grids()
+        with patch('src.collision.collide', lambda a, b: a.rect.colliderect(b.rect)), \
+                patch('src.sounds.play') as play, \
+                patch.object(globals, 'PROJECTILE_SPRITES', MagicMock()) as shots:
+            shots.sprites.return_value = projectiles
+            points, _ = manager.handle_collision()
+        self.assertEqual(points, 50)
+        self.assertEqual(play.call_count, 2)
+
+    def test_offscreen_catches_up(self):
+        """Test that an off-screen asteroid moving every fourth step ends up in the same place"""
+        self.addCleanup(culling.VIEW.update, culling.VIEW.copy())
+        culling.set_view(800, 600)
+        positions = []
+        for level in (0, len(QUALITY_LEVELS) - 1):
+            QUALITY.set_level(level)
+            asteroid = Asteroid((-60, 300), 3)
+            asteroid.vel.update(10, 0)
+            asteroid.rotation_speed = 0.5
+            asteroid.rect.center = asteroid.pos
+            for _ in range(8):
+                asteroid.update()
+            positions.append((asteroid.pos.x, asteroid.rotation))
+        self.assertAlmostEqual(positions[0][0], positions[1][0])
+        self.assertAlmostEqual(positions[0][1], positions[1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import shutil
+import tempfile
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import manifest
+from src.manifest import AssetManifest
+from src.Asteroid import ASTEROID_PATHS, choose_sprite_path
+from src import globals
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        for size_class, names in (("large", ["a10000.png", "a10001.png", "b30000.png"]),
+                                  ("medium", ["a10000.png"]), ("small", [])):
+            (self.directory / size_class).mkdir()
+            for name in names:
+                image = pygame.Surface((40, 30), pygame.SRCALPHA)
+                pygame.draw.rect(image, (255, 255, 255, 255), (10, 5, 20, 20))
+                pygame.image.save(image, self.directory / size_class / name)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_describe_sprite(self):
+        """Test that metadata covers the opaque pixels of a sprite"""
+        entry = manifest.describe(self.directory / "large" / "a10000.png")
+        # The centers of the corner pixels are 9.5 pixels from the center on each axis
+        self.assertEqual(entry["radius"], 14)
+
+    def test_built_manifest_indexes_families(self):
+        """Test that a generated manifest looks up families directly and keeps file order"""
+        manifest.build(self.directory, self.directory / "manifest.json")
+        loaded = AssetManifest.load(self.directory / "manifest.json", self.directory)
+        large = [self.directory / "large" / name for name in ("a10000.png", "a10001.png", "b30000.png")]
+        self.assertEqual(loaded.paths["large"], large)
+        self.assertEqual(loaded.family("large", "a1"), large[:2])
+        self.assertEqual(loaded.family("large", "zz"), [])
+        self.assertEqual(loaded.radius(large[2]), 14 + manifest.RADIUS_SLACK)
+        self.assertEqual(loaded.radius(str(large[2])), loaded.radius(large[2]))
+
+    def test_missing_manifest_scans_directories(self):
+        """Test that the sprites are still found without a generated manifest"""
+        scanned = AssetManifest.load(self.directory / "missing.json", self.directory)
+        self.assertEqual(len(scanned.paths["large"]), 3)
+        self.assertEqual(scanned.paths["small"], [])
+        self.assertIsNone(scanned.radius(scanned.paths["medium"][0]))
+
+    def test_game_manifest_matches_asset_files(self):
+        """Test that the committed manifest lists exactly the asteroid files in order"""
+        for size_class in manifest.SIZE_CLASSES:
+            files = sorted(Path(manifest.asteroid_dir, size_class).glob("*.png"))
+            self.assertEqual(ASTEROID_PATHS[size_class], files)
+
+    def test_choose_sprite_keeps_family(self):
+        """Test that splitting an asteroid keeps its variant family"""
+        globals.RNG.seed(1)
+        for _ in range(20):
+            self.assertTrue(choose_sprite_path(1, "b3").name.startswith("b3"))
+        self.assertIn(choose_sprite_path(2, "b3"), ASTEROID_PATHS["medium"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,8 +9,10 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 # Now you can import from src
-from src.Player import Player
+from src.Player import Player, ROTATION_CACHE
 from src import globals
+from src import assets
+from src import sounds
 
 class TestPlayer(unittest.TestCase):
     def setUp(self):
@@ -33,6 +35,9 @@ class TestPlayer(unittest.TestCase):
         globals.LIVES = 3
         globals.ASTEROID_SPRITES = pygame.sprite.Group()
         globals.PROJECTILE_SPRITES = pygame.sprite.Group()
+        assets.clear()
+        sounds.clear()
+        ROTATION_CACHE.clear()
 
         # Create a test surface
         self.screen = pygame.Surface((globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
@@ -0,0 +1,85 @@
+import unittest
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.pool import Pool
+
+
+class Pooled(pygame.sprite.Sprite):
+    pool = None
+
+    def __init__(self, value):
+        super().__init__()
+        self.reset(value)
+
+    def reset(self, value):
+        self.value = value
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class TestPool(unittest.TestCase):
+    def test_killed_sprites_are_reused(self):
+        """Test that a killed sprite is reset and handed out again"""
+        pool = Pool(Pooled)
+        group = pygame.sprite.Group()
+        first = pool.acquire(1)
+        group.add(first)
+        first.kill()
+        second = pool.acquire(2)
+        self.assertIs(first, second)
+        self.assertEqual(second.value, 2)
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(pool.reused, 1)
+
+    def test_double_kill_releases_once(self):
+        """Test that killing a sprite twice does not put it in the free list twice"""
+        pool = Pool(Pooled)
+        sprite = pool.acquire(1)
+        sprite.kill()
+        sprite.kill()
+        self.assertEqual(len(pool.free), 1)
+        self.assertEqual(pool.in_use, 0)
+
+    def test_clear_keeps_sprites_in_use(self):
+        """Test that clearing the free list leaves the count of live sprites right"""
+        pool = Pool(Pooled)
+        live = pool.acquire(1)
+        pool.acquire(2).kill()
+        pool.clear()
+        self.assertEqual(pool.stats()["free"], 0)
+        self.assertEqual(pool.in_use, 1)
+        live.kill()
+        self.assertEqual(pool.in_use, 0)
+
+    def test_high_water_mark_and_max_size(self):
+        """Test that the pool tracks peak usage and caps the free list"""
+        pool = Pool(Pooled, max_size=2)
+        sprites = [pool.acquire(i) for i in range(4)]
+        self.assertEqual(pool.high_water, 4)
+        for sprite in sprites:
+            sprite.kill()
+        self.assertEqual(pool.stats()["free"], 2)
+        self.assertEqual(pool.high_water, 4)
+
+    def test_prefill(self):
+        """Test that prefilled sprites are served without constructing new ones"""
+        pool = Pool(Pooled)
+        pool.prefill(3, 0)
+        for i in range(3):
+            pool.acquire(i)
+        self.assertEqual(pool.created, 3)
+        self.assertEqual(pool.reused, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
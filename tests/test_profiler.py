@@ -0,0 +1,110 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import patch
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.profiler import FrameProfiler, FrameCounters
+from src import collision, culling
+from src.UI import UI, PerfOverlay, clear_fonts
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        # A fake nanosecond clock advanced by each test
+        self.now = 0
+        patcher = patch('time.perf_counter_ns', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.profiler = FrameProfiler(("input", "update", "draw"), size=4)
+
+    def frame(self, input_ns, update_ns, draw_ns, steps=1):
+        """Record one frame with the given phase times, running the update phase steps times"""
+        self.profiler.begin()
+        self.now += input_ns
+        self.profiler.mark("input")
+        for _ in range(steps):
+            self.now += update_ns
+            self.profiler.mark("update")
+        self.now += draw_ns
+        self.profiler.mark("draw")
+        self.profiler.end()
+
+    def test_marks_charge_time_to_phases(self):
+        """Test that each mark records the time since the previous one"""
+        self.frame(1_000_000, 2_000_000, 3_000_000)
+        self.assertEqual(self.profiler.last_ms("input"), 1)
+        self.assertEqual(self.profiler.last_ms("update"), 2)
+        self.assertEqual(self.profiler.last_ms("draw"), 3)
+        self.assertEqual(self.profiler.last_ms(), 6)
+
+    def test_repeated_phases_add_up(self):
+        """Test that a phase run several times in a frame is summed"""
+        self.frame(0, 2_000_000, 0, steps=3)
+        self.assertEqual(self.profiler.last_ms("update"), 6)
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        """Test that history wraps around and is returned oldest first"""
+        for ms in range(1, 7):
+            self.frame(0, 0, ms * 1_000_000)
+        self.assertEqual(list(self.profiler.history("draw")), [3e6, 4e6, 5e6, 6e6])
+        self.assertEqual(self.profiler.average_ms("draw"), 4.5)
+
+    def test_empty_profiler(self):
+        """Test that an unused profiler reports zero"""
+        self.assertEqual(self.profiler.last_ms(), 0)
+        self.assertEqual(self.profiler.average_ms("draw"), 0)
+        self.assertEqual(len(self.profiler.history()), 0)
+
+
+class TestFrameCounters(unittest.TestCase):
+    def test_begin_frame_keeps_last_frame(self):
+        """Test that starting a frame zeroes the counts and keeps the finished frame's"""
+        counters = FrameCounters("hits", "misses")
+        counters["hits"] += 2
+        last_frame = counters.last_frame
+        counters.begin_frame()
+        self.assertEqual(counters, {"hits": 0, "misses": 0})
+        self.assertEqual(last_frame, {"hits": 2, "misses": 0})
+
+    def test_modules_share_the_helper(self):
+        """Test that collision and culling count through the shared helper"""
+        for module in (collision, culling):
+            self.assertIsInstance(module.STATS, FrameCounters)
+            self.assertIs(module.LAST_FRAME, module.STATS.last_frame)
+
+
+class TestPerfOverlay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        clear_fonts()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_overlay_draws_through_ui(self):
+        """Test that the overlay can be added to the UI and only re-renders periodically"""
+        profiler = FrameProfiler(("update", "draw"), size=8)
+        for _ in range(3):
+            profiler.begin()
+            profiler.mark("update")
+            profiler.mark("draw")
+            profiler.end()
+        group = pygame.sprite.Group()
+        overlay = PerfOverlay((0, 0), profiler, {"asteroids": group}, refresh=5)
+        ui = UI(self.screen)
+        ui.add(overlay)
+        with patch.object(overlay, 'render', wraps=overlay.render) as render:
+            for _ in range(6):
+                ui.draw()
+        self.assertEqual(render.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,8 +9,10 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 # Now you can import from src
-from src.projectile import Projectile
+from src.projectile import Projectile, ROTATION_CACHE
 from src import globals
+from src import assets
+from src import sounds
 
 class TestProjectile(unittest.TestCase):
     def setUp(self):
@@ -32,6 +34,9 @@ class TestProjectile(unittest.TestCase):
 
         # Create a test surface
         self.screen = pygame.Surface((globals.WINDOW_WIDTH, globals.WINDOW_HEIGHT))
+        assets.clear()
+        sounds.clear()
+        ROTATION_CACHE.clear()
 
         # Mock image loading
         self.original_load = pygame.image.load
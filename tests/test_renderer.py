@@ -0,0 +1,104 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import patch
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.renderer import DirtyRenderer
+from src import culling
+
+
+class TestDirtyRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        self.background = pygame.Surface((800, 600))
+        self.background.fill((0, 0, 40))
+
+        self.sprite = pygame.sprite.Sprite()
+        self.sprite.image = pygame.Surface((20, 20))
+        self.sprite.image.fill((255, 0, 0))
+        self.sprite.rect = self.sprite.image.get_rect(topleft=(100, 100))
+        self.group = pygame.sprite.Group(self.sprite)
+
+        self.renderer = DirtyRenderer(self.screen, self.background, threshold=0.4)
+        patcher_flip = patch('pygame.display.flip')
+        self.flip = patcher_flip.start()
+        self.addCleanup(patcher_flip.stop)
+        patcher_update = patch('pygame.display.update')
+        self.update = patcher_update.start()
+        self.addCleanup(patcher_update.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def frame(self):
+        self.renderer.erase()
+        self.renderer.draw(self.group)
+        self.renderer.present()
+
+    def test_first_frame_is_full(self):
+        """Test that the first frame blits the whole background and flips"""
+        self.frame()
+        self.flip.assert_called_once()
+        self.update.assert_not_called()
+        self.assertEqual(self.screen.get_at((500, 500)), (0, 0, 40, 255))
+
+    def test_moving_sprite_updates_old_and_new_rects(self):
+        """Test that only the previous and current sprite rects are erased and pushed"""
+        self.frame()
+        self.sprite.rect.topleft = (300, 100)
+        self.frame()
+        self.update.assert_called_once_with([pygame.Rect(100, 100, 20, 20), pygame.Rect(300, 100, 20, 20)])
+        self.assertEqual(self.screen.get_at((105, 105)), (0, 0, 40, 255))
+        self.assertEqual(self.screen.get_at((305, 105)), (255, 0, 0, 255))
+        self.assertEqual(self.renderer.partial_frames, 1)
+
+    def test_tracks_extra_rects(self):
+        """Test that rects drawn outside the renderer, like UI, are erased next frame"""
+        self.frame()
+        self.renderer.erase()
+        self.renderer.add([self.screen.fill((0, 255, 0), (400, 400, 10, 10))])
+        self.renderer.present()
+        self.frame()
+        self.assertEqual(self.screen.get_at((405, 405)), (0, 0, 40, 255))
+
+    def test_large_dirty_area_falls_back_to_flip(self):
+        """Test that a frame covering most of the screen is flipped instead of updated"""
+        self.frame()
+        self.sprite.image = pygame.Surface((700, 500))
+        self.sprite.rect = self.sprite.image.get_rect()
+        self.frame()
+        self.assertEqual(self.flip.call_count, 2)
+        self.update.assert_not_called()
+
+    def test_invalidate_redraws_everything(self):
+        """Test that an invalidated renderer redraws the full background once"""
+        self.frame()
+        self.screen.fill((9, 9, 9))
+        self.renderer.invalidate()
+        self.frame()
+        self.assertEqual(self.flip.call_count, 2)
+        self.assertEqual(self.screen.get_at((700, 10)), (0, 0, 40, 255))
+        self.frame()
+        self.update.assert_called_once()
+
+    def test_sprites_off_screen_are_not_drawn(self):
+        """Test that sprites entirely off the screen are skipped and counted"""
+        hidden = pygame.sprite.Sprite()
+        hidden.image = self.sprite.image
+        hidden.rect = hidden.image.get_rect(topleft=(-40, 100))
+        self.group.add(hidden)
+        culling.begin_frame()
+        self.frame()
+        self.assertEqual(self.renderer.previous, [pygame.Rect(100, 100, 20, 20)])
+        self.assertEqual(culling.STATS["draws"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
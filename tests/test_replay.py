@@ -0,0 +1,214 @@
+import unittest
+import tempfile
+import json
+import zlib
+import os
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.engine import Engine, Inputs
+from src.asteroid_field import AsteroidField, AsteroidView, np
+from src.replay import Recorder, Replay, play, _write_varint, _read_varint
+from src import globals
+from src import culling
+from src import assets
+from src import sounds
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+        # Mock globals
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        globals.DT = 0.016  # 60 FPS
+        globals.PLAYER_SPRITE = pygame.sprite.Group()
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        globals.PROJECTILE_SPRITES = pygame.sprite.Group()
+        globals.PICKUP_SPRITES = pygame.sprite.Group()
+        assets.clear()
+        sounds.clear()
+
+        # Mock image loading and sound
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+        handle, self.path = tempfile.mkstemp(suffix=".replay")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def scripted_inputs(self, frame):
+        """Held keys with a slowly sweeping aim, so the stream has both repeats and deltas"""
+        return Inputs(
+            up=frame % 200 < 50, left=frame % 300 > 250, fire=True,
+            aim=None if frame < 10 else (400 + frame // 30 % 90 - 45.4, 300.6 - frame // 45 % 60)
+        )
+
+    def record(self, frames, keyframe_interval=120, field=None):
+        """Record a seeded game with short waves and return its engine"""
+        engine = Engine(field, seed=11)
+        engine.spawner.wave_duration = 2
+        engine.spawner.break_duration = 1
+        engine.recorder = Recorder(self.path, engine, keyframe_interval)
+        for frame in range(frames):
+            engine.step(globals.FIXED_DT, self.scripted_inputs(frame))
+        engine.recorder.close()
+        return engine
+
+    def test_varint_round_trip(self):
+        """Test that zigzag varints decode to the values written"""
+        out = bytearray()
+        values = [0, 1, -1, 63, -64, 64, 300, -300, 2 ** 40, -(2 ** 40)]
+        for value in values:
+            _write_varint(out, value)
+        offset = 0
+        for value in values:
+            decoded, offset = _read_varint(out, offset)
+            self.assertEqual(decoded, value)
+        self.assertEqual(offset, len(out))
+
+    def test_inputs_round_trip(self):
+        """Test that the recorded stream decodes to the quantized inputs of every step"""
+        engine = Engine(seed=3)
+        recorder = Recorder(self.path, engine, keyframe_interval=100)
+        expected = [recorder.record(engine, self.scripted_inputs(frame)) for frame in range(450)]
+        recorder.close()
+
+        replay = Replay(self.path)
+        self.assertEqual(replay.seed, 3)
+        self.assertEqual(replay.frames, 450)
+        self.assertEqual(list(replay.inputs()), expected)
+        self.assertEqual(expected[20].aim, (round(400 - 45.4), round(300.6)))
+        # Held inputs are run-length encoded in well under a byte per step
+        self.assertLess(replay.stream_end - replay.index()[0][2], 450 / 3)
+
+        # Decoding can start at any keyframe
+        entry = replay.index()[2]
+        self.assertEqual(entry[0], 200)
+        self.assertEqual(list(replay.inputs(entry)), expected[200:])
+
+    def test_replay_reproduces_game(self):
+        """Test that re-simulating a replay ends in exactly the recorded state"""
+        recorded = self.record(400).snapshot()
+
+        engine = Engine()
+        self.assertEqual(play(Replay(self.path), engine), 400)
+        self.assertEqual(engine.snapshot(), recorded)
+
+    def test_seek_to_wave_matches_full_simulation(self):
+        """Test that starting from a wave keyframe reaches the same state as a full replay"""
+        recorded = self.record(600).snapshot()
+        replay = Replay(self.path)
+        self.assertGreaterEqual(recorded["spawner"]["wave_number"], 3)
+
+        entry = replay.keyframe_for_wave(3)
+        self.assertEqual(entry[1], 3)
+        self.assertEqual(replay.load_state(entry)["spawner"]["wave_number"], 3)
+
+        engine = Engine()
+        self.assertEqual(play(replay, engine, wave=3), 600 - entry[0])
+        self.assertEqual(engine.snapshot(), recorded)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_field_backend_records_and_seeks(self):
+        """Test that games on the array backend record, seek and replay on that backend"""
+        recorded = self.record(600, field=AsteroidField()).snapshot()
+        self.assertEqual(recorded["backend"], "field")
+        replay = Replay(self.path)
+
+        engine = Engine(AsteroidField())
+        play(replay, engine, wave=3)
+        self.assertEqual(engine.snapshot(), recorded)
+        self.assertTrue(all(isinstance(a, AsteroidView) for a in globals.ASTEROID_SPRITES))
+
+        with self.assertRaises(ValueError):
+            Engine().restore(replay.load_state(replay.index()[0]))
+
+    def test_keyframes_are_plain_data(self):
+        """Test that keyframes are stored as JSON and decode to a state that restores exactly"""
+        self.record(130)
+        replay = Replay(self.path)
+        entry = replay.index()[1]
+        blob = replay.data[entry[6]:entry[6] + entry[7]]
+        self.assertEqual(json.loads(zlib.decompress(blob))["frame"], entry[0])
+
+        state = replay.load_state(entry)
+        Engine(seed=11).restore(state)
+        self.assertEqual(globals.RNG.getstate(), state["rng"])
+
+    def restore_culled(self, field=None):
+        """Snapshot an asteroid that turned while out of view, restore it and return its mask before and after"""
+        # A long bar, so every rotation frame has a different mask
+        bar = pygame.Surface((60, 60), pygame.SRCALPHA)
+        bar.fill((255, 255, 255), (0, 25, 60, 10))
+        self.mock_load.return_value.convert_alpha.return_value = bar
+        self.addCleanup(culling.VIEW.update, culling.VIEW.copy())
+        culling.set_view(800, 600)
+
+        engine = Engine(field, seed=5)
+        engine.spawner.wave_active = False
+        engine.spawner.break_duration = 1000
+        asteroid = engine.spawner.spawn_asteroid(pos=(-90, 300), size=3)
+        if field is None:
+            asteroid.vel.update(0, 0)
+            asteroid.rotation_speed = 7
+        else:
+            asteroid.vel = (0, 0)
+            field.rotation_speed[asteroid.index] = 7
+        for _ in range(10):
+            engine.step(globals.FIXED_DT, Inputs())
+        mask = asteroid.mask
+        self.assertNotEqual(asteroid.rotation, asteroid.image_angle)
+
+        state = engine.snapshot()
+        engine.restore(state)
+        self.assertEqual(engine.snapshot(), state)
+        restored, = globals.ASTEROID_SPRITES.sprites()
+        return mask, restored.mask
+
+    def assert_same_mask(self, expected, actual):
+        self.assertGreater(expected.count(), 0)
+        self.assertEqual(actual.get_size(), expected.get_size())
+        self.assertEqual(actual.count(), expected.count())
+        self.assertEqual(actual.overlap_area(expected, (0, 0)), expected.count())
+
+    def test_restore_keeps_frame_of_culled_asteroid(self):
+        """Test that an asteroid turning out of view comes back from a snapshot with the frame it showed"""
+        self.assert_same_mask(*self.restore_culled())
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_restore_keeps_frame_of_culled_field_asteroid(self):
+        """Test that a culled asteroid of the array backend is restored with the frame it showed"""
+        self.assert_same_mask(*self.restore_culled(AsteroidField()))
+
+    def test_rejects_other_files(self):
+        """Test that loading something that is not a replay raises"""
+        with open(self.path, "wb") as file:
+            file.write(b"not a replay" * 8)
+        with self.assertRaises(ValueError):
+            Replay(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import pygame
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.rotation import RotationCache
+
+
+class TestRotationCache(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        self.source = pygame.Surface((50, 50), pygame.SRCALPHA)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_angles_are_quantized(self):
+        """Test that angles within half a step share the same frame"""
+        cache = RotationCache(step=3)
+        self.assertEqual(cache.frame_count, 120)
+        self.assertEqual(cache.index(0), cache.index(1.4))
+        self.assertEqual(cache.index(360), cache.index(0))
+        self.assertEqual(cache.index(-3), cache.frame_count - 1)
+
+    def test_frames_are_rendered_once_and_shared(self):
+        """Test that a frame is rendered on first use and reused afterwards"""
+        cache = RotationCache(step=3)
+        first = cache.frame("rock", self.source, 30)
+        second = cache.frame("rock", self.source, 30.5)
+        self.assertIs(first, second)
+        self.assertEqual(cache.renders, 1)
+
+    def test_frames_carry_matching_masks(self):
+        """Test that each frame comes with a mask built from its rotated image"""
+        self.source.fill((255, 255, 255, 255))
+        cache = RotationCache(step=45)
+        image, mask = cache.frame("rock", self.source, 45)
+        self.assertEqual(mask.get_size(), image.get_size())
+        self.assertEqual(mask.count(), pygame.mask.from_surface(image).count())
+
+    def test_prerender_fills_all_frames(self):
+        """Test that prerendering a variant renders every quantized angle"""
+        cache = RotationCache(step=45)
+        cache.prerender("rock", self.source)
+        self.assertEqual(cache.renders, 8)
+        cache.frame("rock", self.source, 90)
+        self.assertEqual(cache.renders, 8)
+
+    def test_least_recently_used_frames_are_evicted(self):
+        """Test that the memory cap evicts frames of variants that were not used recently"""
+        cache = RotationCache(step=90)
+        frame_bytes = cache.frame_bytes(cache.frame("a", self.source, 0))
+        cache.max_bytes = frame_bytes * 2
+        cache.frame("b", self.source, 0)
+        cache.frame("a", self.source, 0)
+        cache.frame("c", self.source, 0)
+        self.assertIn(("a", 0), cache.frames)
+        self.assertIn(("c", 0), cache.frames)
+        self.assertNotIn(("b", 0), cache.frames)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.stats()["variants"], 2)
+        self.assertLessEqual(cache.bytes, cache.max_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.engine import Engine, Inputs, wait_events
+from src import globals
+from src import collision
+from src import assets
+from src import sounds
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        # Initialize pygame for testing
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+        # Mock globals
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        globals.DT = 0.016  # 60 FPS
+        globals.PLAYER_SPRITE = pygame.sprite.Group()
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        globals.PROJECTILE_SPRITES = pygame.sprite.Group()
+        globals.PICKUP_SPRITES = pygame.sprite.Group()
+        assets.clear()
+        sounds.clear()
+
+        # Mock image loading and sound
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_engine_starts_a_game(self):
+        """Test that a new Engine resets score and lives and spawns the player"""
+        globals.SCORE = 100
+        engine = Engine()
+        self.assertEqual(globals.SCORE, 0)
+        self.assertEqual(globals.LIVES, 3)
+        self.assertIn(engine.player, globals.PLAYER_SPRITE)
+        self.assertTrue(engine.spawner.wave_active)
+
+    def test_step_applies_inputs(self):
+        """Test that a step moves, aims and fires the player from the given inputs"""
+        engine = Engine()
+        engine.step(1 / 60, Inputs(aim=(700, 300)))
+        engine.player.last_shot = engine.player.fire_delay
+        engine.step(1 / 60, Inputs(right=True, fire=True, aim=(700, 300)))
+        self.assertGreater(engine.player.vel.x, 0)
+        self.assertAlmostEqual(engine.player.angle, 0, delta=1)
+        self.assertEqual(len(globals.PROJECTILE_SPRITES), 1)
+        self.assertEqual(globals.DT, 1 / 60)
+
+    def test_step_builds_collision_grids_once(self):
+        """Test that the player and the projectiles share one grid build per step"""
+        engine = Engine()
+        with patch.object(collision.ASTEROID_GRID, 'rebuild') as rebuild:
+            for _ in range(3):
+                engine.step(1 / 60, Inputs())
+        self.assertEqual(rebuild.call_count, 3)
+
+    def test_spawn_budget_is_per_rendered_frame(self):
+        """Test that a frame catching up several steps drains queued spawns under one budget"""
+        engine = Engine()
+        engine.spawner.queue.budget_us = 0
+        spawned = []
+        for i in range(5):
+            engine.spawner.queue.post(spawned.append, i)
+        engine.advance(3 * globals.FIXED_DT, Inputs())
+        self.assertEqual(engine.frame, 3)
+        self.assertEqual(spawned, [0])
+        engine.advance(globals.FIXED_DT, Inputs())
+        self.assertEqual(spawned, [0, 1])
+
+    def test_step_spawns_asteroids_over_time(self):
+        """Test that simulated time drives the asteroid spawner without a clock"""
+        engine = Engine()
+        for _ in range(120):
+            engine.step(1 / 60, Inputs())
+        self.assertGreater(len(globals.ASTEROID_SPRITES), 0)
+        self.assertEqual(engine.frame, 120)
+
+    def test_step_reports_game_over(self):
+        """Test that step reports game over once no lives are left"""
+        engine = Engine()
+        globals.LIVES = 0
+        self.assertEqual(engine.step(1 / 60, Inputs()), "GAMEOVER")
+        engine.reset()
+        self.assertEqual(globals.LIVES, 3)
+
+
+    def play(self, seed, frame_times):
+        """Run a scripted game at the given render frame times and return its final state"""
+        engine = Engine(seed=seed)
+        for elapsed in frame_times:
+            engine.advance(elapsed, Inputs(fire=True, right=True, aim=(400, 0)))
+        asteroids = [(a.sprite_path, tuple(a.pos), a.health) for a in globals.ASTEROID_SPRITES]
+        return engine.frame, globals.SCORE, tuple(engine.player.pos), asteroids
+
+    def test_same_seed_same_outcome_at_any_render_rate(self):
+        """Test that a seeded game is identical whether rendered at 30, 60 or 144 fps"""
+        at_60 = self.play(7, [1 / 60] * 600)
+        at_30 = self.play(7, [1 / 30] * 300)
+        at_144 = self.play(7, [1 / 144] * 1440)
+        self.assertEqual(at_60[0], 600)
+        self.assertEqual(at_60, at_30)
+        self.assertEqual(at_60, at_144)
+
+    def test_different_seeds_differ(self):
+        """Test that the seed actually drives the simulation"""
+        self.assertNotEqual(self.play(1, [1 / 60] * 300), self.play(2, [1 / 60] * 300))
+
+    def test_interpolation_restores_rects(self):
+        """Test that drawing positions are blended and the simulation rects restored"""
+        engine = Engine()
+        engine.player.vel.x = 60
+        engine.advance(1 / 60, Inputs(aim=(400, 0)))
+        current = engine.player.rect.center
+        previous = engine.previous[engine.player]
+        with engine.interpolated(0.5):
+            self.assertAlmostEqual(
+                engine.player.rect.centerx, (previous[0] + current[0]) / 2, delta=1
+            )
+        self.assertEqual(engine.player.rect.center, current)
+
+    def test_wait_events_returns_pending_events(self):
+        """Test that idle waiting hands back every queued event, or none after the timeout"""
+        pygame.event.clear()
+        self.assertEqual(wait_events(10), [])
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(1, 2), button=1))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        events = wait_events(1000)
+        self.assertEqual([event.type for event in events], [pygame.MOUSEBUTTONUP, pygame.KEYDOWN])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import pygame
+import sys
+from unittest.mock import MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src import sounds
+
+
+class TestSounds(unittest.TestCase):
+    def setUp(self):
+        sounds.clear()
+
+        # Mock sound decoding so we can count decodes
+        self.original_sound = pygame.mixer.Sound
+        pygame.mixer.Sound = MagicMock(side_effect=lambda path: MagicMock())
+
+    def tearDown(self):
+        pygame.mixer.Sound = self.original_sound
+        sounds.clear()
+
+    def test_sound_is_decoded_once(self):
+        """Test that every lookup of a file shares one decoded Sound"""
+        first = sounds.load_sound(Path("assets", "sounds", "boom.wav"))
+        second = sounds.load_sound(Path("assets", "sounds", "boom.wav"))
+        self.assertIs(first, second)
+        self.assertEqual(pygame.mixer.Sound.call_count, 1)
+        self.assertEqual(sounds.STATS, {"lookups": 2, "decodes": 1})
+
+    def test_volume_is_applied_to_channel(self):
+        """Test that playing a shared Sound sets the channel volume, not the Sound volume"""
+        sound = sounds.load_sound("boom.wav")
+        channel = sounds.play(sound, 0.4)
+        sound.play.assert_called_once()
+        sound.set_volume.assert_not_called()
+        channel.set_volume.assert_called_once_with(0.4)
+
+    def test_play_without_free_channel(self):
+        """Test that playing with no free channel is a no-op"""
+        sound = sounds.load_sound("boom.wav")
+        sound.play.return_value = None
+        self.assertIsNone(sounds.play(sound, 0.4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+import random
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.spawn_queue import SpawnQueue
+from src.Asteroid import Asteroid, AsteroidManager, ROTATION_CACHE
+from src.asteroid_field import AsteroidField, np
+from src import globals
+from src import collision
+from src import assets
+from src import sounds
+
+class TestSpawnQueue(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+        globals.WINDOW_WIDTH = 800
+        globals.WINDOW_HEIGHT = 600
+        globals.DT = globals.FIXED_DT
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        globals.PROJECTILE_SPRITES = pygame.sprite.Group()
+        ROTATION_CACHE.clear()
+        assets.clear()
+        sounds.clear()
+
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def idle_manager(self, budget_us):
+        """A manager between waves, so only what the test posts gets spawned"""
+        manager = AsteroidManager()
+        manager.break_duration = 1000
+        manager.queue.budget_us = budget_us
+        return manager
+
+    def test_no_budget_spawns_at_once(self):
+        """Test that without a budget posting is the same as calling the spawn"""
+        queue = SpawnQueue()
+        self.assertEqual(queue.post(lambda a, b: a + b, 1, 2), 3)
+        self.assertEqual(len(queue), 0)
+        self.assertIsNone(AsteroidManager().queue.budget_us)
+
+    def test_budget_drains_at_least_one(self):
+        """Test that an exhausted budget still makes progress each drain"""
+        queue = SpawnQueue(budget_us=0)
+        spawned = []
+        for i in range(3):
+            self.assertIsNone(queue.post(spawned.append, i))
+        self.assertEqual(spawned, [])
+
+        self.assertEqual(queue.drain(), 1)
+        queue.begin_frame()
+        self.assertEqual(queue.drain(), 1)
+        self.assertEqual(spawned, [0, 1])
+        queue.flush()
+        self.assertEqual(spawned, [0, 1, 2])
+        self.assertEqual(queue.stats()["peak"], 3)
+
+    def test_budget_covers_every_step_of_a_frame(self):
+        """Test that steps caught up in one frame share its budget instead of each spending it"""
+        queue = SpawnQueue(budget_us=0)
+        spawned = []
+        for i in range(4):
+            queue.post(spawned.append, i)
+        queue.begin_frame()
+        self.assertEqual([queue.drain() for _ in range(3)], [1, 0, 0])
+        queue.begin_frame()
+        self.assertEqual(queue.drain(), 1)
+        self.assertEqual(spawned, [0, 1])
+
+    def test_collision_fragments_are_deferred(self):
+        """Test that fragments of a destroyed asteroid join the game on the next update"""
+        manager = self.idle_manager(1000)
+        asteroid = Asteroid((400, 300), 3)
+        globals.ASTEROID_SPRITES.add(asteroid)
+        asteroid.take_damage(asteroid.health - globals.PROJECTILE_DAMAGE)
+        projectile = MagicMock(rect=asteroid.rect.copy())
+        collision.rebuild_grids()
+        with patch('src.collision.collide', return_value=True), \
+                patch.object(globals, 'PROJECTILE_SPRITES', MagicMock()) as shots:
+            shots.sprites.return_value = [projectile]
+            manager.handle_collision()
+
+        self.assertEqual(len(globals.ASTEROID_SPRITES), 0)
+        self.assertEqual(len(manager.queue), 2)
+        manager.update()
+        self.assertEqual(len(globals.ASTEROID_SPRITES), 2)
+        self.assertEqual({a.size for a in globals.ASTEROID_SPRITES}, {2})
+
+    def play(self, budget_us, steps=4):
+        """Post three fragments at (400, 300) and return where they are after some steps"""
+        globals.RNG = random.Random(5)
+        globals.ASTEROID_SPRITES.empty()
+        manager = self.idle_manager(budget_us)
+        for _ in range(3):
+            manager.queue.post(manager.spawn_fragment, (400, 300), 2, None)
+        for _ in range(steps):
+            manager.queue.begin_frame()
+            manager.update()
+            globals.ASTEROID_SPRITES.update()
+        return sorted(
+            (a.pos.x, a.pos.y, a.rotation) for a in globals.ASTEROID_SPRITES
+        )
+
+    def test_deferred_fragments_catch_up(self):
+        """Test that fragments spawned frames late are where they would have been on time"""
+        on_time = self.play(None)
+        late = self.play(0)
+        self.assertEqual(len(late), 3)
+        for expected, actual in zip(on_time, late):
+            for a, b in zip(expected, actual):
+                self.assertAlmostEqual(a, b, places=6)
+
+    def play_wave(self, budget_us, field=None, steps=5):
+        """Run a wave spawning every other step and return where its asteroids are"""
+        globals.RNG = random.Random(2)
+        globals.ASTEROID_SPRITES.empty()
+        manager = AsteroidManager(field)
+        manager.start_game()
+        manager.queue.budget_us = budget_us
+        manager.spawn_rate = 1 / (globals.DT * 1.5)
+        for _ in range(steps):
+            manager.update()
+            globals.ASTEROID_SPRITES.update()
+        self.assertEqual(len(manager.queue), 0)
+        return sorted((a.pos.x, a.pos.y) for a in globals.ASTEROID_SPRITES)
+
+    def assert_same_positions(self, expected, actual):
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(len(expected), len(actual))
+        for a, b in zip(expected, actual):
+            self.assertAlmostEqual(a[0], b[0], places=6)
+            self.assertAlmostEqual(a[1], b[1], places=6)
+
+    def test_deferred_wave_spawns_keep_step(self):
+        """Test that queued wave spawns end up where direct spawns are, not a step ahead"""
+        self.assert_same_positions(self.play_wave(None), self.play_wave(10 ** 6))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_deferred_wave_spawns_keep_step_in_field(self):
+        """Test that queued wave spawns of the array backend keep step with direct spawns"""
+        self.assert_same_positions(
+            self.play_wave(None, AsteroidField()), self.play_wave(10 ** 6, AsteroidField())
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
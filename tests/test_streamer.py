@@ -0,0 +1,164 @@
+import unittest
+import shutil
+import tempfile
+import threading
+import pygame
+import sys
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.streamer import AssetStreamer, ASSET_LOADED
+from src.Asteroid import AsteroidManager, ASTEROID_PATHS
+from src import globals
+from src import assets
+from src import sounds
+
+
+class TestAssetStreamer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        assets.clear()
+        sounds.clear()
+        self.addCleanup(assets.clear)
+        self.addCleanup(sounds.clear)
+
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.paths = []
+        for i in range(6):
+            image = pygame.Surface((20 + i, 10), pygame.SRCALPHA)
+            image.fill((30 * i, 100, 200, 255))
+            path = self.directory / f"img{i}.png"
+            pygame.image.save(image, path)
+            self.paths.append(path)
+
+        self.streamer = AssetStreamer(workers=3)
+        self.addCleanup(self.streamer.shutdown)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_streamed_images_are_not_decoded_again(self):
+        """Test that loading a streamed image uses the background decode"""
+        self.streamer.stream([(path, 1) for path in self.paths])
+        for path in self.paths:
+            image = assets.load_image(path)
+            self.assertEqual(image.get_width(), 20 + self.paths.index(path))
+        self.assertEqual(assets.loads(), 0)
+        self.assertEqual(assets.PENDING, {})
+
+    def test_pump_finishes_images_in_order(self):
+        """Test that pump converts finished decodes and stops at one still in flight"""
+        release = threading.Event()
+        real_load = pygame.image.load
+
+        def slow_load(path):
+            if Path(path) == self.paths[1]:
+                release.wait(5)
+            return real_load(path)
+
+        with patch('pygame.image.load', side_effect=slow_load):
+            self.streamer.stream([(path, 1) for path in self.paths] + [(self.paths[0], 0.5)])
+            assets.PENDING[self.paths[0].as_posix()].result()
+            self.streamer.pump()
+            self.assertFalse(self.streamer.done)
+            self.assertIn((str(self.paths[0]), 1, True), assets.IMAGES)
+            self.assertNotIn((str(self.paths[2]), 1, True), assets.IMAGES)
+
+            release.set()
+            for future in list(assets.PENDING.values()):
+                future.result()
+            self.streamer.pump()
+        self.assertTrue(self.streamer.done)
+        self.assertIn((str(self.paths[0]), 0.5, True), assets.IMAGES)
+        self.assertEqual(assets.loads(), 0)
+
+    def test_loaded_images_are_not_streamed(self):
+        """Test that an image already loaded under a str path is not decoded again for a Path"""
+        assets.load_image(str(self.paths[0]))
+        self.streamer.stream([(self.paths[0], 1)])
+        self.assertEqual(assets.PENDING, {})
+        self.assertTrue(self.streamer.images)
+
+    def test_shutdown_waits_for_running_decodes(self):
+        """Test that shutdown returns only once decodes already running have finished"""
+        streamer = AssetStreamer(workers=1)
+        started = threading.Event()
+        real_load = pygame.image.load
+
+        def slow_load(path):
+            started.set()
+            threading.Event().wait(0.2)
+            return real_load(path)
+
+        with patch('pygame.image.load', side_effect=slow_load):
+            streamer.stream([(path, 1) for path in self.paths])
+            running = assets.PENDING[self.paths[0].as_posix()]
+            started.wait(5)
+            streamer.shutdown()
+        self.assertTrue(running.done())
+        self.assertFalse(running.cancelled())
+        # Decodes that never started are dropped, so a later load reads the file itself
+        self.assertEqual(list(assets.PENDING), [self.paths[0].as_posix()])
+
+    def test_finished_decodes_wake_the_event_queue(self):
+        """Test that a finished decode posts an event so idle waits return"""
+        pygame.event.clear()
+        self.streamer.stream([(self.paths[0], 1)])
+        event = pygame.event.wait(2000)
+        self.assertEqual(event.type, ASSET_LOADED)
+
+    def test_streamed_sounds(self):
+        """Test that sounds are decoded in the background and picked up by load_sound"""
+        with patch('pygame.mixer.Sound') as sound:
+            self.streamer.stream([], [Path("assets", "sounds", "power_up.wav")])
+            loaded = sounds.load_sound(Path("assets", "sounds", "power_up.wav"))
+        self.assertIs(loaded, sound.return_value)
+        self.assertEqual(sounds.STATS["decodes"], 0)
+        self.assertTrue(self.streamer.done)
+
+
+class TestSpawnStalls(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        globals.ASTEROID_SPRITES = pygame.sprite.Group()
+        assets.clear()
+        sounds.clear()
+
+        patcher = patch('pygame.image.load')
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_loaded_image = MagicMock()
+        mock_loaded_image.convert_alpha.return_value = pygame.Surface((50, 50), pygame.SRCALPHA)
+        self.mock_load.return_value = mock_loaded_image
+
+        patcher_sound = patch('pygame.mixer.Sound')
+        patcher_sound.start()
+        self.addCleanup(patcher_sound.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_counts_spawns_that_loaded_art(self):
+        """Test that only spawns whose sprite was not loaded yet count as stalled"""
+        manager = AsteroidManager()
+        for paths in ASTEROID_PATHS.values():
+            assets.preload((path, 1) for path in paths)
+        for _ in range(5):
+            manager.spawn_asteroid()
+        self.assertEqual((manager.spawns, manager.stalled_spawns), (5, 0))
+
+        assets.clear()
+        manager.spawn_asteroid()
+        self.assertEqual((manager.spawns, manager.stalled_spawns), (6, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
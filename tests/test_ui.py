@@ -0,0 +1,110 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pygame
+import sys
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Now you can import from src
+from src.UI import Text, Button, GLYPH_ATLASES, FONTS, FONT_STATS, load_font, clear_fonts
+
+
+class TestText(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        GLYPH_ATLASES.clear()
+        clear_fonts()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_set_text_skips_identical_strings(self):
+        """Test that setting the same text again does not re-render it"""
+        text = Text((0, 0), 32, (255, 255, 255), "Score: 0", "Courier")
+        text.font = MagicMock(wraps=text.font)
+        text.set_text("Score: 0")
+        text.font.render.assert_not_called()
+        text.set_text("Score: 10")
+        text.font.render.assert_called_once()
+        self.assertEqual(text.text, "Score: 10")
+
+    def test_glyph_text_uses_atlas(self):
+        """Test that glyph text is composed from cached glyphs without rasterising again"""
+        text = Text((50, 10), 32, (255, 255, 255), "Score: 0", "Courier", glyphs=True)
+        atlas = text.atlas
+        text.set_text("Score: 9")
+        atlas.font = MagicMock(wraps=atlas.font)
+        text.set_text("Score: 1234567890")
+        atlas.font.render_to.assert_not_called()
+        expected = sum(atlas.glyphs[c].get_width() for c in "Score: 1234567890")
+        self.assertEqual(text.image.get_width(), expected)
+        self.assertEqual(text.image.get_height(), atlas.height)
+
+    def test_glyph_atlases_are_shared(self):
+        """Test that texts with the same font, size and color share one atlas"""
+        score = Text((0, 0), 32, (255, 255, 255), "Score: 0", "Courier", bold=True, glyphs=True)
+        lives = Text((0, 0), 32, (255, 255, 255), "Lives: 3", "Courier", bold=True, glyphs=True)
+        other = Text((0, 0), 32, (255, 0, 0), "Lives: 3", "Courier", bold=True, glyphs=True)
+        self.assertIs(score.atlas, lives.atlas)
+        self.assertIsNot(score.atlas, other.atlas)
+
+    def test_glyph_text_draws_pixels(self):
+        """Test that composed glyph text actually contains the rendered characters"""
+        text = Text((0, 0), 32, (255, 255, 255), "88", "Courier", glyphs=True)
+        self.assertIsNotNone(text.image.get_bounding_rect())
+        self.assertGreater(text.image.get_bounding_rect().w, 0)
+
+
+class TestFonts(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        clear_fonts()
+
+    def tearDown(self):
+        pygame.quit()
+        clear_fonts()
+
+    def test_fonts_are_resolved_once(self):
+        """Test that UI elements with the same font share one resolved font"""
+        with patch('pygame.freetype.SysFont', wraps=pygame.freetype.SysFont) as sys_font:
+            score = Text((0, 0), 32, (255, 255, 255), "Score", "Courier", bold=True)
+            button = Button((0, 0), (200, 50), (0, 0, 0), "Start")
+            lives = Text((0, 0), 32, (255, 255, 255), "Lives", "Courier", bold=True)
+            self.assertEqual(sys_font.call_count, 1)
+        self.assertIs(score.font, lives.font)
+        self.assertIs(score.font, button.label)
+        self.assertEqual(FONT_STATS["resolved"], 1)
+        self.assertEqual(FONT_STATS["hits"], 2)
+        self.assertGreater(FONT_STATS["ns"], 0)
+
+    def test_different_styles_are_separate(self):
+        """Test that size and style are part of the registry key"""
+        self.assertIsNot(load_font("Courier", 32), load_font("Courier", 32, bold=True))
+        self.assertIsNot(load_font("Courier", 32), load_font("Courier", 14))
+        self.assertEqual(len(FONTS), 3)
+
+    def test_bundled_font_skips_system_lookup(self):
+        """Test that a font file in the font directory is used without SysFont"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        default = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+        shutil.copy(default, os.path.join(directory, "courier.ttf"))
+
+        with patch('src.UI.font_dir', Path(directory)), \
+             patch('pygame.freetype.SysFont') as sys_font:
+            font = load_font("Courier", 32, bold=True)
+            sys_font.assert_not_called()
+        self.assertTrue(font.strong)
+        self.assertEqual(FONT_STATS["bundled"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()